@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Compile config.yaml into an importable Python module.
+Run at build or container start so the dashboard imports its settings
+instead of parsing YAML; the dashboard falls back to config.yaml when the
+compiled module is missing or older than the YAML file.
+"""
+
+import os
+import pprint
+import sys
+
+import yaml
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SOURCE = os.path.join(ROOT, 'config.yaml')
+TARGET = os.path.join(ROOT, 'src', 'config_compiled.py')
+
+
+def compile_config(source: str = SOURCE, target: str = TARGET) -> str:
+    """Write the parsed configuration as a Python literal and return the target path."""
+    with open(source, 'r') as f:
+        config = yaml.safe_load(f) or {}
+    
+    with open(target, 'w', encoding='utf-8') as f:
+        f.write(f'"""Generated from {os.path.basename(source)} by compile_config.py; do not edit."""\n\n')
+        f.write(f"CONFIG_SOURCE_MTIME = {os.path.getmtime(source)!r}\n\n")
+        f.write(f"CONFIG = {pprint.pformat(config, sort_dicts=False)}\n")
+    
+    return target
+
+
+if __name__ == "__main__":
+    try:
+        print(f"✅ Compiled configuration to {compile_config()}")
+    except Exception as e:
+        print(f"❌ Failed to compile configuration: {e}")
+        sys.exit(1)
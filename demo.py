@@ -4,13 +4,53 @@ Quick demo script to showcase AI Repo Scout capabilities.
 Runs a minimal example with sample data for demonstration.
 """
 
+import importlib.util
 import os
 import sys
 import json
+from collections import Counter
 from datetime import datetime
+from textwrap import shorten
+from typing import Final
 
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Number of repositories shown in the rankings
+TOP_K = 10
+
+# Example of a generated report, shown by demo_report_preview
+_REPORT_PREVIEW: Final[str] = """
+# 🚀 AI Repo Scout Report
+## Daily Trending Repositories
+
+**Generated on:** November 6, 2024 15:30:00 UTC
+**Total Repositories Analyzed:** 3
+**Average Momentum Score:** 67.8
+
+---
+
+## 🔥 Top Trending Repository
+
+### 1. [awesome-ai-tools](https://github.com/developer/awesome-ai-tools)
+
+**developer/awesome-ai-tools** (Python)
+
+A curated list of awesome AI tools and resources for developers
+
+**Metrics:**
+- ⭐ **Stars:** 1,250
+- 🍴 **Forks:** 180
+- 🏃 **Momentum Score:** 72.5/100
+- 📈 **Star Velocity:** 4.2 stars/day
+- 👥 **Contributors:** 25
+- 🏷️ **Topics:** ai, machine-learning, tools, python
+
+---
+
+This is a preview of what full reports look like!
+"""
+
+# Use the installed modules (pip install -e .) and fall back to the source tree
+if importlib.util.find_spec('github_client') is None:
+    sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 def demo_quick_analysis():
     """Run a quick demo analysis with sample data."""
@@ -18,7 +58,8 @@ def demo_quick_analysis():
     print("=" * 40)
     
     try:
-        from github_client import GitHubAPIClient, calculate_momentum_score
+        import numpy as np
+        from github_client import GitHubAPIClient, calculate_momentum_scores
         from ai_analyzer import AIAnalyzer
         
         print("✅ Modules imported successfully")
@@ -77,64 +118,55 @@ def demo_quick_analysis():
         
         print(f"📊 Analyzing {len(sample_repos)} sample repositories...")
         
-        # Calculate momentum scores
-        for repo in sample_repos:
-            repo['momentum_score'] = calculate_momentum_score(repo)
-        
-        # Sort by momentum score
-        sample_repos.sort(key=lambda x: x['momentum_score'], reverse=True)
-        
-        print("\n🏆 Repository Rankings:")
-        print("-" * 40)
-        
-        for i, repo in enumerate(sample_repos, 1):
-            print(f"{i}. {repo['name']} ({repo['language']})")
-            print(f"   ⭐ Stars: {repo['stars']:,} | 🍴 Forks: {repo['forks']:,}")
-            print(f"   🏃 Momentum Score: {repo['momentum_score']:.1f}/100")
-            print(f"   📝 {repo['description'][:80]}...")
-            print()
-        
-        # AI Analysis Demo
-        print("🤖 AI Analysis Demo:")
-        print("-" * 40)
-        
-        try:
-            ai_analyzer = AIAnalyzer()
-            
-            # Try to generate a summary for the top repo
-            top_repo = sample_repos[0]
-            print(f"Generating AI summary for: {top_repo['name']}")
-            
-            # This will use fallback methods if AI models aren't loaded
-            summary = ai_analyzer.summarize_repository(top_repo)
-            print(f"AI Summary: {summary}")
-            
-        except Exception as e:
-            print(f"AI analysis demo skipped (models not loaded): {e}")
-            print("💡 Install full dependencies with: pip install -r requirements.txt")
+        # Calculate momentum scores for the whole batch at once
+        scores = calculate_momentum_scores(sample_repos)
+        for repo, score in zip(sample_repos, scores):
+            repo['momentum_score'] = float(score)
+        
+        # Select the top repositories by momentum score without sorting the whole batch
+        k = min(TOP_K, len(scores))
+        top_idx = np.argpartition(-scores, k - 1)[:k]
+        top_idx = top_idx[np.argsort(-scores[top_idx], kind='stable')]
+        top_repos = [sample_repos[i] for i in top_idx]
+        
+        # Build the ranking block and write it in one go
+        lines = ["\n🏆 Repository Rankings:", "-" * 40]
+        for i, repo in enumerate(top_repos, 1):
+            lines.extend([
+                f"{i}. {repo['name']} ({repo['language']})",
+                f"   ⭐ Stars: {repo['stars']:,} | 🍴 Forks: {repo['forks']:,}",
+                f"   🏃 Momentum Score: {repo['momentum_score']:.1f}/100",
+                f"   📝 {shorten(repo['description'], width=80, placeholder='...')}",
+                ""
+            ])
+        lines.extend(["🤖 AI Analysis Demo:", "-" * 40])
+        sys.stdout.write("\n".join(lines) + "\n")
+        
+        # Generate a summary for the top repo
+        top_repo = top_repos[0]
+        print(f"Generating AI summary for: {top_repo['name']}", flush=True)
+        
+        # Models load on first use; falls back to basic extraction if they aren't available
+        summary = AIAnalyzer.get().summarize_repository(top_repo)
+        print(f"AI Summary: {summary}")
         
         # Language Analysis
-        print("\n📈 Language Trends:")
-        print("-" * 40)
-        
-        languages = {}
-        for repo in sample_repos:
-            lang = repo['language']
-            if lang:
-                languages[lang] = languages.get(lang, 0) + 1
+        languages = Counter(repo['language'] for repo in sample_repos if repo.get('language'))
         
-        for lang, count in sorted(languages.items(), key=lambda x: x[1], reverse=True):
-            print(f"  {lang}: {count} repositories")
+        lines = ["\n📈 Language Trends:", "-" * 40]
+        lines.extend(f"  {lang}: {count} repositories" for lang, count in languages.most_common())
         
         # Recommendations
-        print("\n💡 Sample Recommendations:")
-        print("-" * 40)
-        print("• Python repositories show high momentum scores")
-        print("• AI/ML tools are trending in the developer community")
-        print("• Modern web frameworks continue to gain popularity")
-        print("• Systems programming languages (Rust) show strong growth")
-        
-        print("\n✨ Demo completed successfully!")
+        lines.extend([
+            "\n💡 Sample Recommendations:",
+            "-" * 40,
+            "• Python repositories show high momentum scores",
+            "• AI/ML tools are trending in the developer community",
+            "• Modern web frameworks continue to gain popularity",
+            "• Systems programming languages (Rust) show strong growth",
+            "\n✨ Demo completed successfully!"
+        ])
+        sys.stdout.write("\n".join(lines) + "\n")
         return True
         
     except ImportError as e:
@@ -150,39 +182,7 @@ def demo_report_preview():
     """Show what a generated report looks like."""
     print("\n📄 Sample Report Preview:")
     print("=" * 40)
-    
-    report_preview = """
-# 🚀 AI Repo Scout Report
-## Daily Trending Repositories
-
-**Generated on:** November 6, 2024 15:30:00 UTC
-**Total Repositories Analyzed:** 3
-**Average Momentum Score:** 67.8
-
----
-
-## 🔥 Top Trending Repository
-
-### 1. [awesome-ai-tools](https://github.com/developer/awesome-ai-tools)
-
-**developer/awesome-ai-tools** (Python)
-
-A curated list of awesome AI tools and resources for developers
-
-**Metrics:**
-- ⭐ **Stars:** 1,250
-- 🍴 **Forks:** 180
-- 🏃 **Momentum Score:** 72.5/100
-- 📈 **Star Velocity:** 4.2 stars/day
-- 👥 **Contributors:** 25
-- 🏷️ **Topics:** ai, machine-learning, tools, python
-
----
-
-This is a preview of what full reports look like!
-"""
-    
-    print(report_preview)
+    print(_REPORT_PREVIEW)
 
 
 def main():
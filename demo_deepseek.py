@@ -4,13 +4,16 @@ Enhanced demo script showcasing DeepSeek AI integration.
 Demonstrates the difference between basic and AI-powered analysis.
 """
 
+import importlib.util
 import os
 import sys
 import json
 from datetime import datetime
+from textwrap import shorten
 
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+# Use the installed modules (pip install -e .) and fall back to the source tree
+if importlib.util.find_spec('enhanced_ai_analyzer') is None:
+    sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 def demo_deepseek_integration():
     """Demo DeepSeek AI integration with sample data."""
@@ -41,6 +44,27 @@ def demo_deepseek_integration():
             'star_velocity': 12.3
         }
         
+        # Additional repositories for batch summaries and trend analysis
+        sample_repos = [
+            sample_repo,
+            {
+                'name': 'rust-performance-toolkit',
+                'language': 'Rust',
+                'description': 'High-performance toolkit for systems programming with memory safety guarantees',
+                'stars': 1543,
+                'momentum_score': 82.1,
+                'topics': ['rust', 'performance', 'systems', 'memory-safety']
+            },
+            {
+                'name': 'ai-code-assistant',
+                'language': 'Python',
+                'description': 'AI-powered code completion and refactoring assistant using advanced language models',
+                'stars': 4321,
+                'momentum_score': 76.8,
+                'topics': ['ai', 'code-completion', 'python', 'machine-learning', 'developer-tools']
+            }
+        ]
+        
         # Initialize AI analyzer
         print("\n🔧 Initializing AI Analyzer...")
         config = {
@@ -75,31 +99,14 @@ def demo_deepseek_integration():
         print(f"Stars: {sample_repo['stars']:,} | Momentum: {sample_repo['momentum_score']:.1f}/100")
         print()
         
-        print("🤖 Generating AI Summary...")
-        ai_summary = analyzer.summarize_repository(sample_repo)
-        print(f"AI Summary: {ai_summary}")
+        print("🤖 Generating AI Summaries (one batched request)...")
+        ai_summaries = analyzer.summarize_repositories(sample_repos)
+        print(f"AI Summary: {ai_summaries[0]}")
         
-        # Demonstrate trend analysis
-        sample_repos = [
-            sample_repo,
-            {
-                'name': 'rust-performance-toolkit',
-                'language': 'Rust',
-                'description': 'High-performance toolkit for systems programming with memory safety guarantees',
-                'stars': 1543,
-                'momentum_score': 82.1,
-                'topics': ['rust', 'performance', 'systems', 'memory-safety']
-            },
-            {
-                'name': 'ai-code-assistant',
-                'language': 'Python',
-                'description': 'AI-powered code completion and refactoring assistant using advanced language models',
-                'stars': 4321,
-                'momentum_score': 76.8,
-                'topics': ['ai', 'code-completion', 'python', 'machine-learning', 'developer-tools']
-            }
-        ]
+        for repo, summary in zip(sample_repos[1:], ai_summaries[1:]):
+            print(f"\n{repo['name']}: {summary}")
         
+        # Demonstrate trend analysis
         print(f"\n📈 AI Trend Analysis:")
         print("-" * 40)
         
@@ -108,7 +115,7 @@ def demo_deepseek_integration():
             
             if 'ai_insights' in trends:
                 print("🤖 DeepSeek AI Insights:")
-                print(trends['ai_insights'][:300] + "..." if len(trends['ai_insights']) > 300 else trends['ai_insights'])
+                print(shorten(trends['ai_insights'], width=300, placeholder='...'))
             else:
                 print("📊 Basic Trend Analysis:")
                 print(f"• Top Languages: {list(trends.get('top_languages', {}).keys())}")
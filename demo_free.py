@@ -4,11 +4,13 @@ Free-tier demo for AI Repo Scout.
 Tests the system using only free APIs and lightweight processing.
 """
 
+import importlib.util
 import os
 import sys
 
-# Add src directory to Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+# Use the installed modules (pip install -e .) and fall back to the source tree
+if importlib.util.find_spec('factories') is None:
+    sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 def test_free_version():
     """Test the free version of AI Repo Scout."""
@@ -18,20 +20,18 @@ def test_free_version():
     try:
         # Test imports
         print("📦 Testing imports...")
-        from github_client import GitHubAPIClient, filter_quality_repos
-        from simple_ai_analyzer import EnhancedAIAnalyzer
-        from data_analysis import DataAnalysisEngine
+        from factories import get_github_client, get_analyzer, get_data_engine
         print("✅ All imports successful!")
         
         # Test GitHub client (no token required for basic testing)
         print("\n🐙 Testing GitHub API client...")
-        github_client = GitHubAPIClient()
+        github_client = get_github_client()
         print("✅ GitHub client initialized")
         
         # Test AI analyzer
         print("\n🧠 Testing lightweight AI analyzer...")
         config = {'models': {'provider': 'huggingface'}}
-        ai_analyzer = EnhancedAIAnalyzer(config)
+        ai_analyzer = get_analyzer(config)
         
         # Test repository summarization with sample data
         sample_repo = {
@@ -49,7 +49,7 @@ def test_free_version():
         
         # Test data analysis engine
         print("\n📊 Testing data analysis engine...")
-        data_engine = DataAnalysisEngine({})
+        data_engine = get_data_engine({})
         print("✅ Data engine initialized")
         
         # Test with sample repository data
@@ -4,12 +4,14 @@ LinkedIn Content Demo for AI Repo Scout.
 Generate sample LinkedIn posts from repository analysis.
 """
 
+import importlib.util
 import os
 import sys
 import json
 
-# Add src directory to Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+# Use the installed modules (pip install -e .) and fall back to the source tree
+if importlib.util.find_spec('linkedin_generator') is None:
+    sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 def demo_linkedin_content():
     """Demonstrate LinkedIn content generation."""
@@ -17,8 +19,7 @@ def demo_linkedin_content():
     print("=" * 50)
     
     try:
-        from linkedin_generator import LinkedInContentGenerator
-        import pandas as pd
+        from linkedin_generator import LinkedInContentGenerator, REPO_FRAME_COLUMNS, REPO_FRAME_DTYPES
         
         # Create sample data
         print("📊 Creating sample analysis data...")
@@ -78,44 +79,40 @@ def demo_linkedin_content():
             }
         ]
         
-        sample_df = pd.DataFrame(sample_repos_data)
-        
         # Generate LinkedIn content
-        print("🚀 Generating professional LinkedIn posts...")
+        print("🚀 Generating professional LinkedIn posts...", flush=True)
         generator = LinkedInContentGenerator()
-        posts = generator.generate_all_posts(sample_insights, sample_df)
         
-        print(f"✅ Generated {len(posts)} LinkedIn posts:")
+        import pandas as pd
+        sample_df = pd.DataFrame.from_records(sample_repos_data, columns=REPO_FRAME_COLUMNS).astype(REPO_FRAME_DTYPES)
+        posts = generator.generate_all_posts(sample_insights, sample_df)
         
         # Show previews
+        lines = [f"✅ Generated {len(posts)} LinkedIn posts:"]
         for post_type, post in posts.items():
-            print(f"\n📄 {post.title}")
-            print("-" * 40)
-            # Show first 200 characters of content
-            preview = post.content[:200] + "..." if len(post.content) > 200 else post.content
-            print(preview)
-            print(f"📱 Hashtags: {' '.join(post.hashtags[:5])}")
+            lines.extend([f"\n📄 {post.title}", "-" * 40, post.preview, f"📱 Hashtags: {post.hashtag_line}"])
+        sys.stdout.write("\n".join(lines) + "\n")
         
         # Export to files
-        print(f"\n📁 Exporting posts to files...")
+        print(f"\n📁 Exporting posts to files...", flush=True)
         output_dir = generator.export_posts_to_files(posts, "demo_linkedin_content")
         
         # Show posting schedule
         schedule = generator.create_posting_schedule(posts)
-        print(f"\n📅 Suggested Posting Schedule:")
-        for day, post_title in schedule.items():
-            if post_title:
-                print(f"  • {day.title()}: {post_title}")
-        
-        print(f"\n🎯 Pro Tips:")
-        print("  • Copy content from files in demo_linkedin_content/")
-        print("  • Customize hashtags for your industry") 
-        print("  • Add personal insights before posting")
-        print("  • Engage with comments to boost reach")
-        print("  • Post during peak engagement hours (9-10am, 12-1pm)")
+        lines = ["\n📅 Suggested Posting Schedule:"]
+        lines.extend(f"  • {day.title()}: {post_title}" for day, post_title in schedule.items() if post_title)
         
-        print(f"\n✨ Your LinkedIn content is ready!")
-        print(f"📂 Files saved in: {output_dir}/")
+        lines.extend([
+            "\n🎯 Pro Tips:",
+            "  • Copy content from files in demo_linkedin_content/",
+            "  • Customize hashtags for your industry",
+            "  • Add personal insights before posting",
+            "  • Engage with comments to boost reach",
+            "  • Post during peak engagement hours (9-10am, 12-1pm)",
+            "\n✨ Your LinkedIn content is ready!",
+            f"📂 Files saved in: {output_dir}/"
+        ])
+        sys.stdout.write("\n".join(lines) + "\n")
         
         return True
         
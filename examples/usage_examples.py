@@ -4,16 +4,19 @@ Example usage script for AI Repo Scout.
 Demonstrates various ways to use the tool programmatically.
 """
 
+import importlib.util
 import os
 import sys
 import asyncio
 from datetime import datetime
 
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Use the installed modules (pip install -e .) and fall back to the source tree
+if importlib.util.find_spec('github_client') is None:
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from github_client import GitHubAPIClient, filter_quality_repos
-from enhanced_ai_analyzer import EnhancedAIAnalyzer
+from github_client_async import AsyncGitHubAPIClient, AIOHTTP_AVAILABLE
+from ai_analyzer import AIAnalyzer
 from data_analysis import DataAnalysisEngine
 from report_generator import ReportGenerator
 
@@ -44,9 +47,9 @@ def example_ai_analysis():
     print("🤖 Example 2: AI-Powered Analysis")
     print("=" * 50)
     
-    # Initialize components
+    # Initialize components (the analyzer is shared and loads models on first use)
     client = GitHubAPIClient()
-    ai_analyzer = EnhancedAIAnalyzer()
+    ai_analyzer = AIAnalyzer.get()
     
     # Get repositories
     print("Fetching JavaScript repositories...")
@@ -59,8 +62,8 @@ def example_ai_analysis():
     
     # Generate AI summaries
     print(f"\nGenerating AI summaries for {len(quality_repos[:3])} repositories...")
-    for repo in quality_repos[:3]:
-        summary = ai_analyzer.summarize_repository(repo)
+    summaries = ai_analyzer.summarize_repositories(quality_repos[:3])
+    for repo, summary in zip(quality_repos[:3], summaries):
         print(f"\n📦 {repo['name']}")
         print(f"AI Summary: {summary}")
 
@@ -72,7 +75,6 @@ def example_comprehensive_analysis():
     
     # Initialize all components
     client = GitHubAPIClient()
-    ai_analyzer = EnhancedAIAnalyzer()
     data_engine = DataAnalysisEngine()
     
     # Get multi-language trending repos
@@ -80,8 +82,13 @@ def example_comprehensive_analysis():
     all_repos = []
     
     print("Fetching repositories for multiple languages...")
-    for lang in languages:
-        repos = client.get_trending_repos(language=lang, since="daily")
+    if AIOHTTP_AVAILABLE:
+        # Languages are independent, so fetch them all concurrently
+        by_language = asyncio.run(AsyncGitHubAPIClient().get_trending_by_language(languages, since="daily"))
+    else:
+        by_language = {lang: client.get_trending_repos(language=lang, since="daily") for lang in languages}
+    
+    for lang, repos in by_language.items():
         all_repos.extend(repos)
         print(f"  {lang}: {len(repos)} repositories")
     
@@ -161,7 +168,7 @@ def example_similarity_analysis():
     
     # Initialize components
     client = GitHubAPIClient()
-    ai_analyzer = EnhancedAIAnalyzer()
+    ai_analyzer = AIAnalyzer.get()
     
     # Get a target repository (example: a popular Python ML library)
     print("Searching for machine learning repositories...")
@@ -3,46 +3,53 @@
 Generate LinkedIn content from existing analysis data
 """
 
-import json
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from pathlib import Path
 import sys
 import os
 
 # Add src to path
 sys.path.append('src')
+from fast_json import jloads
 from linkedin_generator import LinkedInContentGenerator
 
 def load_latest_analysis():
     """Load the most recent analysis data"""
-    data_dir = Path('data')
-    insight_files = list(data_dir.glob('insights_*.json'))
-    
-    if not insight_files:
+    # Get the most recent file; DirEntry caches its stat result, so one stat per file
+    try:
+        with os.scandir('data') as entries:
+            latest_file = max(
+                (e for e in entries if e.name.startswith('insights_') and e.name.endswith('.json')),
+                key=lambda e: e.stat().st_mtime,
+                default=None
+            )
+    except FileNotFoundError:
+        latest_file = None
+    
+    if latest_file is None:
         print("No analysis data found!")
         return None, None
     
-    # Get the most recent file
-    latest_file = max(insight_files, key=lambda f: f.stat().st_mtime)
-    print(f"Using analysis data from: {latest_file}")
-    
-    with open(latest_file) as f:
-        insights = json.load(f)
-    
-    # Convert top performers to DataFrame format
-    repos_data = []
-    for repo in insights['top_performers']['highest_momentum']:
-        repos_data.append({
-            'name': repo['name'],
-            'full_name': repo['full_name'],
-            'momentum_score': repo['momentum_score'],
-            'stars': repo['stars'],
-            'language': 'Python',  # Default for this analysis
-            'description': f"High-momentum repository with {repo['stars']} stars"
-        })
-    
-    repos_df = pd.DataFrame(repos_data)
+    print(f"Using analysis data from: {latest_file.path}")
+    
+    with open(latest_file.path, 'rb') as f:
+        insights = jloads(f.read())
+    
+    # Build the DataFrame column by column, already in its final dtypes
+    top_performers = insights['top_performers']['highest_momentum']
+    count = len(top_performers)
+    stars = np.fromiter((repo['stars'] for repo in top_performers), dtype=np.int32, count=count)
+    
+    repos_df = pd.DataFrame({
+        'name': [repo['name'] for repo in top_performers],
+        'full_name': [repo['full_name'] for repo in top_performers],
+        'momentum_score': np.fromiter((repo['momentum_score'] for repo in top_performers),
+                                      dtype=np.float32, count=count),
+        'stars': stars,
+        'language': pd.Categorical(['Python'] * count),  # Default for this analysis
+        'description': [f"High-momentum repository with {star_count} stars" for star_count in stars]
+    })
     
     return insights, repos_df
 
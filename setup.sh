@@ -47,6 +47,10 @@ fi
 mkdir -p data
 echo "✅ Data directory created"
 
+# Pre-download AI models so the first analysis doesn't wait on them (optional)
+echo "🤖 Caching AI models..."
+python3 warm_models.py && echo "✅ AI models cached" || echo "⚠️  AI models not cached (they will download on first use)"
+
 # Run a quick test
 echo "🧪 Running quick test..."
 python3 src/main.py --timeframe daily --languages python --help > /dev/null 2>&1
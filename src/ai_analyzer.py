@@ -4,28 +4,135 @@ Provides repository summarization, text embeddings, and similarity analysis.
 """
 
 import logging
-from typing import List, Dict, Tuple, Optional
-import torch
-from transformers import (
-    AutoTokenizer, AutoModel, AutoModelForSeq2SeqLM,
-    pipeline, T5Tokenizer, T5ForConditionalGeneration
-)
-from sentence_transformers import SentenceTransformer
+from collections import Counter
+from itertools import chain
+from functools import cached_property
+from typing import ClassVar, List, Dict, Tuple, Optional
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
-import pickle
+import shelve
 import os
+import re
 from datetime import datetime
 
+from fast_json import jdumps, jloads
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Keywords for categorization, checked in order
+CATEGORY_KEYWORDS = {
+    'Web Development': ['web', 'react', 'vue', 'angular', 'frontend', 'backend', 'api', 'server', 'http'],
+    'Machine Learning': ['ml', 'ai', 'machine learning', 'neural', 'deep learning', 'tensorflow', 'pytorch'],
+    'DevOps & Tools': ['devops', 'docker', 'kubernetes', 'ci', 'cd', 'deployment', 'monitoring', 'cli'],
+    'Mobile Development': ['mobile', 'android', 'ios', 'react native', 'flutter', 'swift', 'kotlin'],
+    'Data Science': ['data', 'analytics', 'visualization', 'pandas', 'numpy', 'jupyter', 'statistics'],
+    'Gaming': ['game', 'gaming', 'unity', 'unreal', 'engine', 'graphics', '3d'],
+    'Blockchain': ['blockchain', 'crypto', 'bitcoin', 'ethereum', 'smart contract', 'defi', 'web3'],
+    'Security': ['security', 'cybersecurity', 'encryption', 'authentication', 'vulnerability', 'penetration']
+}
+
+# One compiled alternation per category so each check is a single C-level scan
+CATEGORY_PATTERNS = {
+    category: re.compile('|'.join(map(re.escape, keywords)))
+    for category, keywords in CATEGORY_KEYWORDS.items()
+}
+
+# Star-count buckets for the growth patterns insight, split at the given edges
+STAR_BUCKETS = ['0-100', '100-1000', '1000-10000', '10000+']
+STAR_BUCKET_EDGES = [100, 1000, 10000]
+
+# Inputs shorter than this are already summary-sized, so T5 is skipped for them
+MIN_SUMMARY_CHARS = 200
+MIN_SUMMARY_WORDS = 40
+
+# Number of model summaries remembered per analyzer, keyed by input text
+SUMMARY_CACHE_SIZE = 4096
+
+# torch/transformers are imported on first model load rather than at import time
+_tf = None
+_st = None
+_torch = None
+
+
+# Placeholder left in the analysis cache JSON where an array was moved into the .npz archive
+ARRAY_REF_KEY = '__ndarray__'
+
+
+def _split_arrays(value, path: str, arrays: Dict[str, np.ndarray]):
+    """Move numpy arrays out of nested dicts and lists into `arrays`, keyed by path.
+    
+    Each array is replaced by a placeholder holding its path (dict keys escaped
+    JSON-pointer style and joined with '/'), so the structure can go to JSON.
+    """
+    if isinstance(value, np.ndarray):
+        arrays[path] = value
+        return {ARRAY_REF_KEY: path}
+    if isinstance(value, dict):
+        return {key: _split_arrays(item, _child_path(path, key), arrays) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_split_arrays(item, _child_path(path, i), arrays) for i, item in enumerate(value)]
+    return value
+
+
+def _child_path(path: str, key) -> str:
+    """Path of a dict key or list index below `path` ('' is the root)."""
+    key = str(key).replace('~', '~0').replace('/', '~1')
+    return f"{path}/{key}" if path else key
+
+
+def _quantize(value: np.ndarray) -> np.ndarray:
+    """Halve float32 arrays (embeddings) to float16 when every value fits its range.
+    
+    Any other array, including float64, is returned unchanged at full precision.
+    """
+    if value.dtype == np.float32 and not np.any(np.abs(value) > np.finfo(np.float16).max):
+        return value.astype(np.float16)
+    return value
+
+
+def _join_arrays(value, arrays: Dict[str, np.ndarray]):
+    """Put the arrays referenced by _split_arrays placeholders back in place."""
+    if isinstance(value, dict):
+        if len(value) == 1 and ARRAY_REF_KEY in value:
+            return arrays[value[ARRAY_REF_KEY]]
+        return {key: _join_arrays(item, arrays) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_join_arrays(item, arrays) for item in value]
+    return value
+
+
+def _lazy_torch():
+    """Import torch and use every CPU core for inference."""
+    global _torch
+    if _torch is None:
+        import torch as _torch
+        _torch.set_num_threads(os.cpu_count() or 1)
+    return _torch
+
+
+def _lazy_tf():
+    """Import and return the transformers module."""
+    global _tf
+    if _tf is None:
+        import transformers as _tf
+    return _tf
+
+
+def _lazy_st():
+    """Import and return the sentence_transformers module."""
+    global _st
+    if _st is None:
+        import sentence_transformers as _st
+    return _st
+
 
 class AIAnalyzer:
     """AI-powered repository analysis using free Hugging Face models."""
     
+    _instance: ClassVar[Optional["AIAnalyzer"]] = None
+    
     def __init__(self, cache_dir: str = "./data/models"):
-        """Initialize AI models for analysis.
+        """Initialize the analyzer; models are loaded on first use.
         
         Args:
             cache_dir: Directory to cache downloaded models
@@ -33,58 +140,100 @@ class AIAnalyzer:
         self.cache_dir = cache_dir
         os.makedirs(cache_dir, exist_ok=True)
         
-        # Initialize models (all free from Hugging Face)
-        self.summarizer = None
-        self.embeddings_model = None
-        self.similarity_model = None
-        
-        # Model configurations
+        # Model configurations (all free from Hugging Face)
         self.models_config = {
             'summarizer': 't5-small',
             'embeddings': 'distilbert-base-uncased',
             'similarity': 'sentence-transformers/all-MiniLM-L6-v2'
         }
         
-        self._load_models()
+        # Sentence-transformer vectors keyed by model, full_name and updated_at
+        self._embedding_cache: Dict[str, np.ndarray] = {}
+        self._embedding_store = os.path.join(cache_dir, "embeddings_cache")
+        
+        # Model summaries keyed by summarizer input, oldest evicted first
+        self._summary_cache: Dict[str, str] = {}
+    
+    @classmethod
+    def get(cls, cache_dir: str = "./data/models") -> "AIAnalyzer":
+        """Return the process-wide analyzer, creating it on the first call."""
+        if cls._instance is None:
+            cls._instance = cls(cache_dir)
+        return cls._instance
     
-    def _load_models(self):
-        """Load AI models with error handling and fallbacks."""
+    @cached_property
+    def summarizer(self):
+        """T5 summarization pipeline, or None if it cannot be loaded."""
         try:
-            logger.info("Loading AI models...")
-            
-            # Load summarization model (T5-small)
             logger.info("Loading T5 summarization model...")
-            self.summarizer = pipeline(
+            return _lazy_tf().pipeline(
                 "summarization",
                 model=self.models_config['summarizer'],
                 tokenizer=self.models_config['summarizer'],
                 device=-1,  # Use CPU (free)
+                torch_dtype=_lazy_torch().bfloat16,  # Halves memory traffic on CPU
+                model_kwargs={'low_cpu_mem_usage': True},
                 cache_dir=self.cache_dir
             )
-            
-            # Load sentence transformer for similarity
-            logger.info("Loading sentence transformer model...")
-            self.similarity_model = SentenceTransformer(
-                self.models_config['similarity'],
-                cache_folder=self.cache_dir
-            )
-            
-            # Load embeddings model
-            logger.info("Loading embeddings model...")
-            self.embeddings_tokenizer = AutoTokenizer.from_pretrained(
+        except Exception as e:
+            logger.error(f"Failed to load summarization model: {e}")
+            logger.info("Will use fallback text processing methods.")
+            return None
+    
+    @cached_property
+    def similarity_model(self):
+        """Sentence transformer for similarity, or None if it cannot be loaded."""
+        logger.info("Loading sentence transformer model...")
+        
+        # ONNX Runtime encodes noticeably faster on CPU than PyTorch eager; it needs
+        # sentence-transformers>=3.2 with the onnx extra, so fall back to torch otherwise
+        for backend in ('onnx', 'torch'):
+            try:
+                kwargs = {'backend': backend} if backend == 'onnx' else {}
+                return _lazy_st().SentenceTransformer(
+                    self.models_config['similarity'],
+                    device='cpu',
+                    cache_folder=self.cache_dir,
+                    **kwargs
+                )
+            except Exception as e:
+                logger.log(logging.INFO if backend == 'onnx' else logging.ERROR,
+                           f"Failed to load sentence transformer model ({backend} backend): {e}")
+        return None
+    
+    @cached_property
+    def embeddings_tokenizer(self):
+        """Tokenizer for the embeddings model, or None if it cannot be loaded."""
+        try:
+            return _lazy_tf().AutoTokenizer.from_pretrained(
                 self.models_config['embeddings'],
                 cache_dir=self.cache_dir
             )
-            self.embeddings_model = AutoModel.from_pretrained(
+        except Exception as e:
+            logger.error(f"Failed to load embeddings tokenizer: {e}")
+            return None
+    
+    @cached_property
+    def embeddings_model(self):
+        """DistilBERT embeddings model, or None if it cannot be loaded."""
+        try:
+            logger.info("Loading embeddings model...")
+            torch = _lazy_torch()
+            model = _lazy_tf().AutoModel.from_pretrained(
                 self.models_config['embeddings'],
-                cache_dir=self.cache_dir
+                cache_dir=self.cache_dir,
+                low_cpu_mem_usage=True  # Load weights straight from the checkpoint without a random init pass
             )
             
-            logger.info("All AI models loaded successfully!")
-            
+            # Half-precision weights: float16 on GPU, bfloat16 on CPU
+            if torch.cuda.is_available():
+                model = model.half().to("cuda")
+            else:
+                model = model.to(dtype=torch.bfloat16)
+            return model.eval()
         except Exception as e:
-            logger.error(f"Failed to load AI models: {e}")
-            logger.info("Will use fallback text processing methods.")
+            logger.error(f"Failed to load embeddings model: {e}")
+            return None
     
     def summarize_repository(self, repo: Dict) -> str:
         """Generate an AI-powered summary of a repository.
@@ -96,32 +245,13 @@ class AIAnalyzer:
             AI-generated summary string
         """
         try:
-            # Prepare input text
-            description = repo.get('description', '')
-            topics = repo.get('topics', [])
-            language = repo.get('language', '')
-            
-            # Create comprehensive input
-            input_text = f"Repository: {repo.get('name', '')}. "
-            
-            if description:
-                input_text += f"Description: {description}. "
-            
-            if language:
-                input_text += f"Language: {language}. "
-            
-            if topics:
-                input_text += f"Topics: {', '.join(topics)}. "
+            input_text = self._summary_input(repo)
             
-            # Add context about metrics
-            stars = repo.get('stars', 0)
-            if stars > 1000:
-                input_text += f"Popular project with {stars} stars. "
-            elif stars > 100:
-                input_text += f"Growing project with {stars} stars. "
+            if input_text in self._summary_cache:
+                return self._summary_cache[input_text]
             
-            # Use AI summarizer if available
-            if self.summarizer and len(input_text) > 50:
+            # Use AI summarizer if available and the input is long enough to condense
+            if self._worth_summarizing(input_text) and self.summarizer:
                 # T5 works better with "summarize:" prefix
                 summarize_input = f"summarize: {input_text}"
                 
@@ -133,7 +263,7 @@ class AIAnalyzer:
                     truncation=True
                 )
                 
-                return summary[0]['summary_text']
+                return self._remember_summary(input_text, summary[0]['summary_text'])
             
             else:
                 # Fallback: extract key information
@@ -143,6 +273,81 @@ class AIAnalyzer:
             logger.error(f"Summarization failed for {repo.get('name', 'unknown')}: {e}")
             return self._extract_key_info(repo)
     
+    def summarize_repositories(self, repos: List[Dict], batch_size: int = 8) -> List[str]:
+        """Generate summaries for several repositories in batched pipeline calls.
+        
+        Args:
+            repos: List of repository dictionaries
+            batch_size: Number of inputs the summarizer processes per forward pass
+            
+        Returns:
+            List of summary strings, in the same order as repos
+        """
+        inputs = [self._summary_input(repo) for repo in repos]
+        summaries: List[Optional[str]] = [self._summary_cache.get(text) for text in inputs]
+        
+        # Cached and short inputs skip the model, as in summarize_repository
+        model_indices = [
+            i for i, text in enumerate(inputs)
+            if summaries[i] is None and self._worth_summarizing(text)
+        ]
+        
+        if model_indices and self.summarizer:
+            try:
+                outputs = self.summarizer(
+                    [f"summarize: {inputs[i]}" for i in model_indices],
+                    max_length=100,
+                    min_length=20,
+                    do_sample=False,
+                    truncation=True,
+                    batch_size=batch_size
+                )
+                for i, output in zip(model_indices, outputs):
+                    summaries[i] = self._remember_summary(inputs[i], output['summary_text'])
+            except Exception as e:
+                logger.error(f"Batch summarization failed: {e}")
+        
+        return [summary or self._extract_key_info(repo) for summary, repo in zip(summaries, repos)]
+    
+    @staticmethod
+    def _worth_summarizing(input_text: str) -> bool:
+        """Whether an input is long enough for the model to add anything."""
+        return len(input_text) >= MIN_SUMMARY_CHARS and len(input_text.split()) >= MIN_SUMMARY_WORDS
+    
+    def _remember_summary(self, input_text: str, summary: str) -> str:
+        """Cache a model summary, evicting the oldest entry when full."""
+        if len(self._summary_cache) >= SUMMARY_CACHE_SIZE:
+            self._summary_cache.pop(next(iter(self._summary_cache)))
+        self._summary_cache[input_text] = summary
+        return summary
+    
+    def _summary_input(self, repo: Dict) -> str:
+        """Build the summarizer input text for a repository."""
+        description = repo.get('description', '')
+        topics = repo.get('topics', [])
+        language = repo.get('language', '')
+        
+        # Create comprehensive input
+        input_parts = [f"Repository: {repo.get('name', '')}. "]
+        
+        if description:
+            input_parts.append(f"Description: {description}. ")
+        
+        if language:
+            input_parts.append(f"Language: {language}. ")
+        
+        if topics:
+            input_parts.append(f"Topics: {', '.join(topics)}. ")
+        
+        # Add context about metrics
+        stars = repo.get('stars', 0)
+        if stars > 1000:
+            input_parts.append(f"Popular project with {stars} stars. ")
+        elif stars > 100:
+            input_parts.append(f"Growing project with {stars} stars. ")
+        
+        return "".join(input_parts)
+    
     def _extract_key_info(self, repo: Dict) -> str:
         """Fallback method to extract key repository information."""
         name = repo.get('name', 'Unknown')
@@ -173,34 +378,48 @@ class AIAnalyzer:
             texts: List of text strings
             
         Returns:
-            Numpy array of embeddings
+            Numpy array of embeddings (unit-normalized for the model paths)
         """
+        # Model embeddings depend only on the text, so encode each distinct text once
+        unique_texts = list(dict.fromkeys(texts))
+        if len(unique_texts) < len(texts) and (
+                self.similarity_model or (self.embeddings_model and self.embeddings_tokenizer)):
+            positions = {text: i for i, text in enumerate(unique_texts)}
+            return self.get_embeddings(unique_texts)[[positions[text] for text in texts]]
+        
         try:
             if self.similarity_model:
-                # Use sentence transformer (recommended)
-                embeddings = self.similarity_model.encode(texts)
-                return embeddings
+                # Use sentence transformer (recommended), encoding in padded batches
+                return self.similarity_model.encode(
+                    texts,
+                    batch_size=32,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True,
+                    show_progress_bar=False
+                )
             
-            elif self.embeddings_model:
-                # Use DistilBERT embeddings
-                embeddings = []
+            elif self.embeddings_model and self.embeddings_tokenizer:
+                # Use DistilBERT embeddings, one forward pass for the whole batch
+                torch = _lazy_torch()
+                import torch.nn.functional as F
                 
-                for text in texts:
-                    inputs = self.embeddings_tokenizer(
-                        text,
-                        return_tensors="pt",
-                        truncation=True,
-                        padding=True,
-                        max_length=512
-                    )
-                    
-                    with torch.no_grad():
-                        outputs = self.embeddings_model(**inputs)
-                        # Use mean pooling of last hidden states
-                        embedding = outputs.last_hidden_state.mean(dim=1).squeeze().numpy()
-                        embeddings.append(embedding)
+                inputs = self.embeddings_tokenizer(
+                    texts,
+                    return_tensors="pt",
+                    truncation=True,
+                    padding=True,
+                    max_length=128
+                ).to(self.embeddings_model.device)
+                
+                with torch.inference_mode():
+                    outputs = self.embeddings_model(**inputs)
+                    # Mean pooling over real (non-padding) tokens
+                    mask = inputs['attention_mask'].unsqueeze(-1).to(outputs.last_hidden_state.dtype)
+                    summed = (outputs.last_hidden_state * mask).sum(dim=1)
+                    embeddings = summed / mask.sum(dim=1).clamp(min=1e-9)
+                    embeddings = F.normalize(embeddings, dim=1)
                 
-                return np.array(embeddings)
+                return embeddings.float().cpu().numpy()
             
             else:
                 logger.warning("No embedding models available. Using simple text features.")
@@ -233,27 +452,18 @@ class AIAnalyzer:
         Returns:
             List of (repo, similarity_score) tuples
         """
+        # Imported here: loading ai_fastpath imports Numba and compiles its kernel
+        from ai_fastpath import topk_cosine
+        
         try:
-            # Prepare text descriptions
-            target_text = self._repo_to_text(target_repo)
-            candidate_texts = [self._repo_to_text(repo) for repo in candidate_repos]
-            
-            # Get embeddings
-            all_texts = [target_text] + candidate_texts
-            embeddings = self.get_embeddings(all_texts)
-            
-            # Calculate similarities
-            target_embedding = embeddings[0:1]
-            candidate_embeddings = embeddings[1:]
+            # Get embeddings, reusing vectors of unchanged repositories
+            embeddings = self._embed_repos([target_repo] + candidate_repos)
             
-            similarities = cosine_similarity(target_embedding, candidate_embeddings)[0]
-            
-            # Get top-k similar repos
-            similar_indices = np.argsort(similarities)[::-1][:top_k]
+            # Cosine similarity and top-k selection (compiled for large candidate sets)
+            similar_indices, similarities = topk_cosine(embeddings[0], embeddings[1:], top_k)
             
             results = []
-            for idx in similar_indices:
-                similarity_score = similarities[idx]
+            for idx, similarity_score in zip(similar_indices, similarities):
                 similar_repo = candidate_repos[idx]
                 results.append((similar_repo, float(similarity_score)))
             
@@ -263,6 +473,55 @@ class AIAnalyzer:
             logger.error(f"Similarity calculation failed: {e}")
             return []
     
+    def _embedding_key(self, repo: Dict) -> Optional[str]:
+        """Cache key for a repository's embedding; changes whenever the repo is updated."""
+        if not repo.get('full_name'):
+            return None
+        return f"{self.models_config['similarity']}|{repo['full_name']}|{repo.get('updated_at', '')}"
+    
+    def _embed_repos(self, repos: List[Dict]) -> np.ndarray:
+        """Embed repositories, encoding only those without a cached vector.
+        
+        Vectors from the sentence transformer are kept in memory and on disk
+        under cache_dir (as float16 on disk). Fallback features depend on the
+        whole batch and are never cached.
+        
+        Args:
+            repos: List of repository dictionaries
+            
+        Returns:
+            Numpy array of embeddings, one row per repository
+        """
+        texts = [self._repo_to_text(repo) for repo in repos]
+        if not self.similarity_model:
+            return self.get_embeddings(texts)
+        
+        keys = [self._embedding_key(repo) for repo in repos]
+        vectors = [self._embedding_cache.get(key) if key else None for key in keys]
+        
+        try:
+            with shelve.open(self._embedding_store) as store:
+                for i, key in enumerate(keys):
+                    if vectors[i] is None and key and key in store:
+                        vectors[i] = self._embedding_cache[key] = store[key].astype(np.float32)
+                
+                missing = [i for i, vector in enumerate(vectors) if vector is None]
+                if missing:
+                    encoded = self.get_embeddings([texts[i] for i in missing])
+                    cacheable = encoded.shape[1] == self.similarity_model.get_sentence_embedding_dimension()
+                    
+                    for i, vector in zip(missing, encoded):
+                        vectors[i] = vector
+                        if cacheable and keys[i]:
+                            self._embedding_cache[keys[i]] = vector
+                            store[keys[i]] = vector.astype(np.float16)
+                
+                return np.vstack(vectors)
+        
+        except Exception as e:
+            logger.warning(f"Embedding cache unavailable, encoding all texts: {e}")
+            return self.get_embeddings(texts)
+    
     def _repo_to_text(self, repo: Dict) -> str:
         """Convert repository data to text for analysis."""
         text_parts = []
@@ -294,44 +553,18 @@ class AIAnalyzer:
         Returns:
             Dictionary with categories as keys and repo lists as values
         """
-        categories = {
-            'Web Development': [],
-            'Machine Learning': [],
-            'DevOps & Tools': [],
-            'Mobile Development': [],
-            'Data Science': [],
-            'Gaming': [],
-            'Blockchain': [],
-            'Security': [],
-            'Other': []
-        }
-        
-        # Keywords for categorization
-        category_keywords = {
-            'Web Development': ['web', 'react', 'vue', 'angular', 'frontend', 'backend', 'api', 'server', 'http'],
-            'Machine Learning': ['ml', 'ai', 'machine learning', 'neural', 'deep learning', 'tensorflow', 'pytorch'],
-            'DevOps & Tools': ['devops', 'docker', 'kubernetes', 'ci', 'cd', 'deployment', 'monitoring', 'cli'],
-            'Mobile Development': ['mobile', 'android', 'ios', 'react native', 'flutter', 'swift', 'kotlin'],
-            'Data Science': ['data', 'analytics', 'visualization', 'pandas', 'numpy', 'jupyter', 'statistics'],
-            'Gaming': ['game', 'gaming', 'unity', 'unreal', 'engine', 'graphics', '3d'],
-            'Blockchain': ['blockchain', 'crypto', 'bitcoin', 'ethereum', 'smart contract', 'defi', 'web3'],
-            'Security': ['security', 'cybersecurity', 'encryption', 'authentication', 'vulnerability', 'penetration']
-        }
+        categories = {category: [] for category in CATEGORY_PATTERNS}
+        categories['Other'] = []
         
         for repo in repos:
             repo_text = self._repo_to_text(repo).lower()
-            categorized = False
             
-            # Check each category
-            for category, keywords in category_keywords.items():
-                if any(keyword in repo_text for keyword in keywords):
-                    categories[category].append(repo)
-                    categorized = True
-                    break
-            
-            # If no category matches, put in "Other"
-            if not categorized:
-                categories['Other'].append(repo)
+            # First category whose pattern matches wins, otherwise "Other"
+            category = next(
+                (name for name, pattern in CATEGORY_PATTERNS.items() if pattern.search(repo_text)),
+                'Other'
+            )
+            categories[category].append(repo)
         
         # Remove empty categories
         return {k: v for k, v in categories.items() if v}
@@ -358,56 +591,66 @@ class AIAnalyzer:
             return insights
         
         # Language analysis
-        languages = [repo.get('language') for repo in repos if repo.get('language')]
-        for lang in languages:
-            insights['top_languages'][lang] = insights['top_languages'].get(lang, 0) + 1
+        insights['top_languages'] = dict(Counter(repo['language'] for repo in repos if repo.get('language')))
         
         # Topic analysis
-        all_topics = []
-        for repo in repos:
-            all_topics.extend(repo.get('topics', []))
-        
-        for topic in all_topics:
-            insights['trending_topics'][topic] = insights['trending_topics'].get(topic, 0) + 1
+        insights['trending_topics'] = dict(Counter(chain.from_iterable(repo.get('topics', []) for repo in repos)))
         
         # Categorization
         insights['categories'] = self.categorize_repositories(repos)
         
         # Growth patterns
-        star_ranges = {'0-100': 0, '100-1000': 0, '1000-10000': 0, '10000+': 0}
-        for repo in repos:
-            stars = repo.get('stars', 0)
-            if stars < 100:
-                star_ranges['0-100'] += 1
-            elif stars < 1000:
-                star_ranges['100-1000'] += 1
-            elif stars < 10000:
-                star_ranges['1000-10000'] += 1
-            else:
-                star_ranges['10000+'] += 1
+        stars = np.fromiter((repo.get('stars', 0) for repo in repos), dtype=np.int64, count=len(repos))
+        counts = np.bincount(np.searchsorted(STAR_BUCKET_EDGES, stars, side='right'), minlength=len(STAR_BUCKETS))
         
-        insights['growth_patterns']['star_distribution'] = star_ranges
+        insights['growth_patterns']['star_distribution'] = dict(zip(STAR_BUCKETS, counts.tolist()))
         
         return insights
     
-    def save_analysis_cache(self, data: Dict, cache_file: str = "analysis_cache.pkl"):
-        """Save analysis results to cache for faster retrieval."""
-        cache_path = os.path.join(self.cache_dir, cache_file)
+    def save_analysis_cache(self, data: Dict, cache_file: str = "analysis_cache"):
+        """Save analysis results to cache for faster retrieval.
+        
+        Numpy arrays, including ones nested in dicts and lists, are stored in a
+        ``.npz`` archive under path-style keys (e.g. ``nested/v``) and everything
+        else as JSON alongside it. float32 arrays within float16 range are written
+        as float16 and read back as float32; other arrays keep their dtype.
+        """
+        base = os.path.splitext(os.path.join(self.cache_dir, cache_file))[0]
+        arrays = {}
+        meta = _split_arrays(data, '', arrays)
+        arrays = {path: _quantize(value) for path, value in arrays.items()}
         try:
-            with open(cache_path, 'wb') as f:
-                pickle.dump(data, f)
-            logger.info(f"Analysis cache saved to {cache_path}")
+            with open(f"{base}.json", 'w', encoding='utf-8') as f:
+                f.write(jdumps(meta, default=str))
+            if arrays:
+                np.savez(f"{base}.npz", **arrays)
+            elif os.path.exists(f"{base}.npz"):
+                os.remove(f"{base}.npz")
+            logger.info(f"Analysis cache saved to {base}.json")
         except Exception as e:
             logger.error(f"Failed to save cache: {e}")
     
-    def load_analysis_cache(self, cache_file: str = "analysis_cache.pkl") -> Optional[Dict]:
+    def load_analysis_cache(self, cache_file: str = "analysis_cache") -> Optional[Dict]:
         """Load analysis results from cache."""
-        cache_path = os.path.join(self.cache_dir, cache_file)
+        base = os.path.splitext(os.path.join(self.cache_dir, cache_file))[0]
         try:
-            if os.path.exists(cache_path):
-                with open(cache_path, 'rb') as f:
-                    data = pickle.load(f)
-                logger.info(f"Analysis cache loaded from {cache_path}")
+            if os.path.exists(f"{base}.json"):
+                with open(f"{base}.json", 'rb') as f:
+                    data = jloads(f.read())
+                if os.path.exists(f"{base}.npz"):
+                    with np.load(f"{base}.npz") as archive:
+                        arrays = {path: archive[path] for path in archive.files}
+                    arrays = {
+                        path: value.astype(np.float32) if value.dtype == np.float16 else value
+                        for path, value in arrays.items()
+                    }
+                    data = _join_arrays(data, arrays)
+                    
+                    # Caches written before nested arrays were supported have no placeholders
+                    for path, value in arrays.items():
+                        if '/' not in path:
+                            data.setdefault(path, value)
+                logger.info(f"Analysis cache loaded from {base}.json")
                 return data
         except Exception as e:
             logger.error(f"Failed to load cache: {e}")
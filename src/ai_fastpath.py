@@ -0,0 +1,147 @@
+"""
+Compiled similarity kernel for ranking repository embeddings.
+Uses Numba when it is installed and falls back to NumPy otherwise.
+"""
+
+import logging
+from typing import Iterator, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Below this many candidates a single BLAS matmul beats the compiled loop
+NUMBA_MIN_CANDIDATES = 512
+
+# Above this many candidates the NumPy path scores rows in blocks to bound temporaries
+CHUNKED_MIN_CANDIDATES = 1024
+SIMILARITY_CHUNK = 2048
+
+
+def _cosine_kernel(target, candidates, out):
+    """Fill `out` with the cosine similarity of each candidate row to `target`.
+    
+    Norms are computed in the same pass as the dot products, so no
+    normalized copies of the embedding matrix are allocated.
+    """
+    target_norm = 0.0
+    for j in range(target.shape[0]):
+        target_norm += target[j] * target[j]
+    target_norm = np.sqrt(target_norm) + 1e-12
+    
+    for i in prange(candidates.shape[0]):
+        dot = 0.0
+        norm = 0.0
+        for j in range(candidates.shape[1]):
+            dot += candidates[i, j] * target[j]
+            norm += candidates[i, j] * candidates[i, j]
+        out[i] = dot / ((np.sqrt(norm) + 1e-12) * target_norm)
+    
+    return out
+
+
+if NUMBA_AVAILABLE:
+    cosine_kernel = njit(cache=True, fastmath=True, parallel=True)(_cosine_kernel)
+    
+    # Compile once at import so the on-disk cache is reused by later runs
+    try:
+        cosine_kernel(np.ones(4), np.ones((4, 4)), np.empty(4))
+    except Exception as e:
+        logger.warning(f"Numba similarity kernel failed to compile, using NumPy: {e}")
+        NUMBA_AVAILABLE = False
+else:
+    cosine_kernel = _cosine_kernel
+
+
+def cosine_similarities(target: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """Cosine similarity of every candidate row to the target vector.
+    
+    Args:
+        target: Embedding of shape (dim,)
+        candidates: Embeddings of shape (n, dim)
+    
+    Returns:
+        Array of n similarity scores
+    """
+    target = np.ascontiguousarray(target, dtype=np.float64)
+    candidates = np.asarray(candidates)
+    n = len(candidates)
+    
+    if NUMBA_AVAILABLE and n >= NUMBA_MIN_CANDIDATES:
+        return cosine_kernel(target, np.ascontiguousarray(candidates, dtype=np.float64), np.empty(n))
+    
+    target_norm = np.linalg.norm(target) + 1e-12
+    if n <= CHUNKED_MIN_CANDIDATES:
+        candidates = candidates.astype(np.float64, copy=False)
+        return (candidates @ target) / ((np.linalg.norm(candidates, axis=1) + 1e-12) * target_norm)
+    
+    # Convert and score one block at a time instead of copying the whole matrix
+    out = np.empty(n)
+    for start in range(0, n, SIMILARITY_CHUNK):
+        block = candidates[start:start + SIMILARITY_CHUNK].astype(np.float64, copy=False)
+        out[start:start + len(block)] = (block @ target) / ((np.linalg.norm(block, axis=1) + 1e-12) * target_norm)
+    return out
+
+
+def topk_cosine(target: np.ndarray, candidates: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Indices and scores of the k candidates most similar to the target.
+    
+    Args:
+        target: Embedding of shape (dim,)
+        candidates: Embeddings of shape (n, dim)
+        k: Number of results to return
+    
+    Returns:
+        Tuple of (indices, similarities), ordered from most to least similar
+    """
+    similarities = cosine_similarities(target, candidates)
+    k = min(k, len(similarities))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp), np.empty(0)
+    
+    # Select the top-k without sorting every candidate
+    indices = np.argpartition(-similarities, k - 1)[:k]
+    indices = indices[np.argsort(-similarities[indices])]
+    return indices, similarities[indices]
+
+
+def pairwise_topk_chunked(embeddings: np.ndarray, k: int = 5,
+                          chunk: int = SIMILARITY_CHUNK) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+    """Top-k most similar rows for every row of an embedding matrix, one block at a time.
+    
+    Only a (chunk, n) similarity block is alive at once, so peak memory stays at
+    chunk * n floats instead of the n * n of a full all-pairs matrix.
+    
+    Args:
+        embeddings: Embeddings of shape (n, dim)
+        k: Number of neighbours per row (a row is never its own neighbour)
+        chunk: Number of rows scored per block
+    
+    Yields:
+        Tuples of (start_row, indices, similarities), each of shape (rows_in_block, k),
+        ordered from most to least similar
+    """
+    normalized = np.asarray(embeddings, dtype=np.float32)
+    normalized = normalized / (np.linalg.norm(normalized, axis=1, keepdims=True) + 1e-12)
+    n = len(normalized)
+    k = min(k, n - 1)
+    if k <= 0:
+        return
+    
+    for start in range(0, n, chunk):
+        block = normalized[start:start + chunk] @ normalized.T
+        rows = np.arange(len(block))
+        block[rows, start + rows] = -np.inf
+        
+        indices = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        scores = np.take_along_axis(block, indices, axis=1)
+        order = np.argsort(-scores, axis=1)
+        yield start, np.take_along_axis(indices, order, axis=1), np.take_along_axis(scores, order, axis=1)
@@ -5,33 +5,49 @@ Displays trending repositories, insights, and analytics in a beautiful web inter
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import numpy as np
-from datetime import datetime, timedelta
-import json
+import hashlib
+import importlib.util
 import os
+import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Add src directory to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__)))
+# Use the installed modules (pip install -e .) and fall back to the source tree
+if importlib.util.find_spec('github_client') is None:
+    sys.path.append(os.path.join(os.path.dirname(__file__)))
 
-from github_client import GitHubAPIClient, filter_quality_repos
+from github_client import TRENDING_MIN_STARS, GitHubAPIClient, filter_quality_repos
+from github_client_gql import GitHubGraphQLClient
 from simple_ai_analyzer import EnhancedAIAnalyzer
 from data_analysis import DataAnalysisEngine
-import yaml
 
-# Page configuration
-st.set_page_config(
-    page_title="🚀 AI Repo Scout",
-    page_icon="🚀",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+# Configuration compiled ahead of time by compile_config.py (optional)
+try:
+    from config_compiled import CONFIG, CONFIG_SOURCE_MTIME
+except ImportError:
+    CONFIG = CONFIG_SOURCE_MTIME = None
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'config.yaml')
+
+# On-disk cache of analyzed trending data, one Parquet file per (languages, timeframe, min_stars)
+TRENDING_CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'cache')
+TRENDING_CACHE_TTL = 3600  # seconds
+
+# Separator used when the topics column is flattened to a string
+TOPIC_SEPARATOR = '|'
+
+# Columns the analytics aggregates are computed from
+AGGREGATE_COLUMNS = ['language', 'momentum_score', 'repo_type', 'growth_potential']
+
+# Growth scatter is capped at this many points; high-momentum repositories are always plotted
+SCATTER_MAX_POINTS = 500
+SCATTER_KEEP_MOMENTUM = 70
+SCATTER_COLUMNS = ['age_days', 'stars', 'language', 'momentum_score', 'name']
 
-# Custom CSS for better styling
-st.markdown("""
+# Custom CSS for better styling; Streamlit clears elements not emitted on a rerun, so it is sent every run
+_CSS_SOURCE = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -68,7 +84,111 @@ st.markdown("""
         font-size: 0.8rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Minified once at import and sent in the same element as the page title
+CUSTOM_CSS = re.sub(r'\s*([{};:,>])\s*', r'\1', ' '.join(_CSS_SOURCE.split()))
+HEADER_HTML = CUSTOM_CSS + '<h1 class="main-header">🚀 AI Repo Scout</h1>'
+
+
+@st.cache_resource(ttl=TRENDING_CACHE_TTL, max_entries=16)
+def _read_trending_cache(path: str, mtime: float) -> pd.DataFrame:
+    """Read a cached trending data file once and share the frame across reruns and sessions.
+    
+    The modification time is part of the cache key, so a rewritten file is read again.
+    The returned frame is shared and must be treated as read-only.
+    """
+    return pd.read_parquet(path)
+
+
+@st.cache_resource
+def _read_config() -> dict:
+    """Load the configuration once per server process; the result is shared and read-only.
+    
+    Uses the compiled module when it is up to date with config.yaml and parses
+    the YAML file otherwise.
+    """
+    if CONFIG is not None:
+        try:
+            if os.path.getmtime(CONFIG_PATH) <= CONFIG_SOURCE_MTIME:
+                return CONFIG
+        except OSError:
+            return CONFIG  # Compiled config shipped without the YAML source
+    
+    import yaml  # Only needed when the compiled config is missing or stale
+    
+    with open(CONFIG_PATH, 'r') as f:
+        return yaml.safe_load(f)
+
+
+def clear_trending_cache():
+    """Delete every cached trending data file."""
+    _read_trending_cache.clear()
+    try:
+        with os.scandir(TRENDING_CACHE_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith('.parquet'):
+                    os.remove(entry.path)
+    except FileNotFoundError:
+        pass
+
+
+def _compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Shrink a repositories DataFrame to compact, cheaply hashable dtypes.
+    
+    Repeated strings become categoricals, numbers are downcast and the
+    list-valued topics column is flattened to its first 3 topics joined
+    by TOPIC_SEPARATOR.
+    """
+    df = df.copy()
+    for col in ['language', 'repo_type']:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    for col in ['stars', 'forks', 'contributors']:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in ['momentum_score', 'star_velocity', 'growth_potential']:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast='float')
+    if 'topics' in df.columns:
+        df['topics'] = df['topics'].map(
+            lambda topics: TOPIC_SEPARATOR.join(topics[:3]) if isinstance(topics, (list, np.ndarray)) else ''
+        )
+    return df
+
+
+def _repo_records(df: pd.DataFrame) -> list:
+    """Repository dictionaries from a compacted DataFrame, with topics restored to lists."""
+    records = df.to_dict('records')
+    for record in records:
+        topics = record.get('topics')
+        if isinstance(topics, str):
+            record['topics'] = topics.split(TOPIC_SEPARATOR) if topics else []
+        for key in ['language', 'repo_type']:
+            if key in record and pd.isna(record[key]):
+                record[key] = None
+    return records
+
+
+def _scatter_sample(df: pd.DataFrame) -> pd.DataFrame:
+    """Columns and rows needed for the growth scatter, downsampled to SCATTER_MAX_POINTS."""
+    plot_df = df[[col for col in SCATTER_COLUMNS if col in df.columns]]
+    if len(plot_df) <= SCATTER_MAX_POINTS or 'momentum_score' not in plot_df.columns:
+        return plot_df
+    
+    high = plot_df['momentum_score'] > SCATTER_KEEP_MOMENTUM
+    rest = plot_df[~high]
+    n_rest = min(max(SCATTER_MAX_POINTS - int(high.sum()), 0), len(rest))
+    return pd.concat([plot_df[high], rest.sample(n_rest, random_state=0)])
+
+
+# Page configuration
+st.set_page_config(
+    page_title="🚀 AI Repo Scout",
+    page_icon="🚀",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
 
 
 class RepoScoutDashboard:
@@ -77,6 +197,7 @@ class RepoScoutDashboard:
     def __init__(self):
         """Initialize the dashboard components."""
         self.github_client = None
+        self.graphql_client = None
         self.ai_analyzer = None
         self.data_engine = None
         self.config = self.load_config()
@@ -84,9 +205,7 @@ class RepoScoutDashboard:
     def load_config(self) -> dict:
         """Load configuration from YAML file."""
         try:
-            config_path = os.path.join(os.path.dirname(__file__), '..', 'config.yaml')
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            return _read_config()
         except Exception as e:
             st.error(f"Failed to load config: {e}")
             return {}
@@ -96,34 +215,94 @@ class RepoScoutDashboard:
         """Initialize API clients with caching."""
         try:
             github_client = GitHubAPIClient()
+            # GraphQL requires a token; without one the dashboard uses REST
+            graphql_client = GitHubGraphQLClient(github_client.token) if github_client.token else None
             ai_analyzer = EnhancedAIAnalyzer()
             data_engine = DataAnalysisEngine()
-            return github_client, ai_analyzer, data_engine
+            return github_client, graphql_client, ai_analyzer, data_engine
         except Exception as e:
             st.error(f"Failed to initialize clients: {e}")
-            return None, None, None
+            return None, None, None, None
+    
+    def fetch_trending_data(self, languages: list, timeframe: str = "daily",
+                            min_stars: int = TRENDING_MIN_STARS) -> pd.DataFrame:
+        """Fetch trending repository data, reusing a Parquet copy on disk for up to an hour.
+        
+        Cached frames are shared between reruns and sessions without copying, so
+        callers must treat the result as read-only (copy before mutating).
+        """
+        # Searches never go below the default floor, so lower settings share its results
+        min_stars = max(min_stars, TRENDING_MIN_STARS)
+        key = hashlib.blake2b(repr((tuple(languages), timeframe, min_stars)).encode(), digest_size=16).hexdigest()
+        path = os.path.join(TRENDING_CACHE_DIR, f"{key}.parquet")
+        
+        try:
+            mtime = os.path.getmtime(path)
+            if time.time() - mtime < TRENDING_CACHE_TTL:
+                return _read_trending_cache(path, mtime)
+        except OSError:
+            pass  # No cached copy yet
+        except Exception as e:
+            st.warning(f"Ignoring unreadable cache file: {e}")
+        
+        df = self._fetch_trending_data(languages, timeframe, min_stars)
+        
+        if not df.empty:
+            try:
+                os.makedirs(TRENDING_CACHE_DIR, exist_ok=True)
+                df.to_parquet(path, compression='zstd')
+            except Exception as e:
+                st.warning(f"Failed to cache trending data: {e}")
+        
+        return df
+    
+    def _fetch_quality_repos(self, language: str, timeframe: str, min_stars: int) -> list:
+        """Fetch one language's trending repositories and keep those passing the quality filter."""
+        return filter_quality_repos(
+            self.github_client.get_trending_repos(language=language, since=timeframe, min_stars=min_stars)
+        )
     
-    @st.cache_data(ttl=3600)  # Cache for 1 hour
-    def fetch_trending_data(_self, languages: list, timeframe: str = "daily") -> pd.DataFrame:
-        """Fetch and cache trending repository data."""
-        if not _self.github_client:
+    def _fetch_trending_data(self, languages: list, timeframe: str, min_stars: int) -> pd.DataFrame:
+        """Fetch and analyze trending repository data from GitHub."""
+        if not self.github_client:
             return pd.DataFrame()
         
-        all_repos = []
+        all_repos = None
         
         # Progress bar for data fetching
         progress_bar = st.progress(0)
         status_text = st.empty()
         
-        for i, language in enumerate(languages):
-            status_text.text(f"Fetching {language} repositories...")
-            
+        status_text.text(f"Fetching {', '.join(languages)} repositories...")
+        
+        if self.graphql_client:
+            # One search query covers every language
             try:
-                repos = _self.github_client.get_trending_repos(language=language, since=timeframe)
-                all_repos.extend(repos)
-                progress_bar.progress((i + 1) / len(languages))
+                found = self.graphql_client.search_trending(languages, since=timeframe, min_stars=min_stars)
+                if found:
+                    all_repos = filter_quality_repos(found)
             except Exception as e:
-                st.warning(f"Failed to fetch {language} repositories: {e}")
+                st.warning(f"GraphQL search failed, falling back to REST: {e}")
+        
+        if all_repos is None:
+            # Languages are independent HTTP round-trips, so fetch them concurrently;
+            # each worker applies the quality filter before its results are merged
+            results = {}
+            with ThreadPoolExecutor(max_workers=max(len(languages), 1)) as executor:
+                futures = {
+                    executor.submit(self._fetch_quality_repos, language, timeframe, min_stars): language
+                    for language in languages
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    language = futures[future]
+                    try:
+                        results[language] = future.result()
+                    except Exception as e:
+                        st.warning(f"Failed to fetch {language} repositories: {e}")
+                    progress_bar.progress(done / len(languages))
+            
+            all_repos = [repo for language in languages for repo in results.get(language, [])]
+            all_repos.sort(key=lambda repo: repo['momentum_score'], reverse=True)
         
         progress_bar.empty()
         status_text.empty()
@@ -131,19 +310,17 @@ class RepoScoutDashboard:
         if not all_repos:
             return pd.DataFrame()
         
-        # Filter quality repositories
-        quality_repos = filter_quality_repos(all_repos)
-        
         # Convert to DataFrame and analyze
-        if _self.data_engine:
-            df = _self.data_engine.analyze_repositories(quality_repos)
-            return df
+        if self.data_engine:
+            df = self.data_engine.analyze_repositories(all_repos)
+        else:
+            df = pd.DataFrame(all_repos)
         
-        return pd.DataFrame(quality_repos)
+        return _compact_dtypes(df)
     
     def render_header(self):
-        """Render the main header."""
-        st.markdown('<h1 class="main-header">🚀 AI Repo Scout</h1>', unsafe_allow_html=True)
+        """Render the main header along with the page styles."""
+        st.markdown(HEADER_HTML, unsafe_allow_html=True)
         st.markdown("**Discover trending GitHub repositories with AI-powered insights**")
         st.markdown("---")
     
@@ -187,6 +364,7 @@ class RepoScoutDashboard:
         # Refresh button
         if st.sidebar.button("🔄 Refresh Data"):
             st.cache_data.clear()
+            clear_trending_cache()
             st.experimental_rerun()
         
         return {
@@ -271,45 +449,61 @@ class RepoScoutDashboard:
             self.render_repo_table(df_sorted)
     
     def render_repo_cards(self, df: pd.DataFrame):
-        """Render repositories as cards."""
-        for idx, repo in df.iterrows():
-            with st.container():
-                col1, col2 = st.columns([3, 1])
-                
-                with col1:
-                    # Repository header
-                    momentum_score = repo.get('momentum_score', 0)
-                    momentum_badge = f'<span class="trending-badge">🔥 {momentum_score:.1f}</span>' if momentum_score > 70 else ''
-                    
-                    st.markdown(f"""
-                    <div class="repo-card">
-                        <h4><a href="{repo.get('html_url', '#')}" target="_blank">{repo.get('name', 'Unknown')}</a> {momentum_badge}</h4>
-                        <p><strong>{repo.get('full_name', '')}</strong></p>
-                        <p>{repo.get('description', 'No description available')[:200]}...</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                with col2:
-                    # Metrics
-                    st.metric("Stars", f"{repo.get('stars', 0):,}")
-                    st.metric("Forks", f"{repo.get('forks', 0):,}")
-                    if 'star_velocity' in repo:
-                        st.metric("Growth", f"{repo['star_velocity']:.1f}/day")
-                
-                # Tags and language
-                tags = []
-                if repo.get('language'):
-                    tags.append(f'<span class="language-tag">{repo["language"]}</span>')
-                
-                topics = repo.get('topics', [])
-                if isinstance(topics, list) and topics:
-                    for topic in topics[:3]:  # Show first 3 topics
-                        tags.append(f'<span class="language-tag">{topic}</span>')
-                
-                if tags:
-                    st.markdown(" ".join(tags), unsafe_allow_html=True)
-                
-                st.markdown("---")
+        """Render repositories as cards, built column-wise and emitted as one markdown element."""
+        if df.empty:
+            return
+        
+        def column(name, default):
+            if name not in df.columns:
+                return pd.Series(default, index=df.index)
+            values = df[name]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                values = values.astype(object)
+            return values.fillna(default)
+        
+        def fmt(values: pd.Series, spec: str) -> pd.Series:
+            return values.map(spec.format).astype(object)
+        
+        momentum = column('momentum_score', 0)
+        badges = pd.Series(np.where(
+            momentum > 70,
+            '<span class="trending-badge">🔥 ' + fmt(momentum, '{:.1f}') + '</span>',
+            ''
+        ), index=df.index)
+        
+        growth = ''
+        if 'star_velocity' in df.columns:
+            growth = ' · 📈 ' + fmt(column('star_velocity', 0), '{:.1f}') + '/day'
+        
+        # Language tag plus the first 3 topics, built with string ops over whole columns
+        language_html = column('language', '').astype(object)
+        language_html = pd.Series(
+            np.where(language_html != '', '<span class="language-tag">' + language_html + '</span>', ''),
+            index=df.index
+        )
+        topics = column('topics', '').astype(object)
+        topics_html = pd.Series(np.where(
+            topics != '',
+            '<span class="language-tag">'
+            + topics.str.replace(TOPIC_SEPARATOR, '</span> <span class="language-tag">', regex=False)
+            + '</span>',
+            ''
+        ), index=df.index)
+        tag_html = (language_html + ' ' + topics_html).str.strip()
+        
+        cards = (
+            '<div class="repo-card">'
+            '<h4><a href="' + column('html_url', '#').astype(object) + '" target="_blank">'
+            + column('name', 'Unknown').astype(object) + '</a> ' + badges + '</h4>'
+            '<p><strong>' + column('full_name', '').astype(object) + '</strong></p>'
+            '<p>' + column('description', 'No description available').astype(object).str.slice(0, 200) + '...</p>'
+            '<p>⭐ ' + fmt(column('stars', 0), '{:,.0f}') + ' stars · 🍴 ' + fmt(column('forks', 0), '{:,.0f}')
+            + ' forks' + growth + '</p>'
+            '<p>' + tag_html + '</p>'
+            '</div>'
+        )
+        
+        st.markdown(cards.str.cat(sep=''), unsafe_allow_html=True)
     
     def render_repo_table(self, df: pd.DataFrame):
         """Render repositories as a table."""
@@ -322,20 +516,19 @@ class RepoScoutDashboard:
         available_columns = [col for col in display_columns if col in df.columns]
         
         if available_columns:
-            # Format the dataframe for display
-            display_df = df[available_columns].copy()
-            
-            # Format numerical columns
-            for col in ['stars', 'forks', 'contributors']:
-                if col in display_df.columns:
-                    display_df[col] = display_df[col].apply(lambda x: f"{x:,}" if pd.notna(x) else "0")
+            display_df = df[available_columns]
             
-            for col in ['momentum_score', 'star_velocity']:
-                if col in display_df.columns:
-                    display_df[col] = display_df[col].apply(lambda x: f"{x:.1f}" if pd.notna(x) else "0.0")
+            # Format numbers at render time; the columns stay numeric so sorting still works
+            count_columns = [col for col in ['stars', 'forks', 'contributors'] if col in available_columns]
+            rate_columns = [col for col in ['momentum_score', 'star_velocity'] if col in available_columns]
+            styler = (
+                display_df.style
+                .format('{:,.0f}', subset=count_columns, na_rep='0')
+                .format('{:.1f}', subset=rate_columns, na_rep='0.0')
+            )
             
             st.dataframe(
-                display_df,
+                styler,
                 use_container_width=True,
                 height=600
             )
@@ -347,23 +540,63 @@ class RepoScoutDashboard:
         
         st.subheader("📊 Analytics & Insights")
         
+        # Aggregates survive reruns (e.g. tab switches) until the data itself changes
+        aggregate_columns = [col for col in AGGREGATE_COLUMNS if col in df.columns]
+        fingerprint = hashlib.blake2b(
+            pd.util.hash_pandas_object(df[aggregate_columns], index=True).values.tobytes(),
+            digest_size=16
+        ).hexdigest()
+        if st.session_state.get('agg_fp') != fingerprint:
+            st.session_state['aggs'] = self.compute_aggregates(df)
+            st.session_state['agg_fp'] = fingerprint
+        aggs = st.session_state['aggs']
+        
         tab1, tab2, tab3, tab4 = st.tabs(["Language Trends", "Growth Patterns", "Repository Types", "AI Insights"])
         
         with tab1:
-            self.render_language_analytics(df)
+            self.render_language_analytics(aggs)
         
         with tab2:
             self.render_growth_analytics(df)
         
         with tab3:
-            self.render_type_analytics(df)
+            self.render_type_analytics(aggs)
         
         with tab4:
             self.render_ai_insights(df)
     
-    def render_language_analytics(self, df: pd.DataFrame):
+    def compute_aggregates(self, df: pd.DataFrame) -> dict:
+        """Compute the grouped statistics shown in the analytics tabs.
+        
+        Args:
+            df: Analyzed repositories DataFrame
+        
+        Returns:
+            Dictionary of aggregate Series; entries are None when their columns are missing
+        """
+        aggs = {'lang_counts': None, 'lang_momentum': None, 'type_counts': None, 'growth_by_type': None}
+        
+        if 'language' in df.columns:
+            aggs['lang_counts'] = df['language'].value_counts().head(10)
+            if 'momentum_score' in df.columns:
+                aggs['lang_momentum'] = (
+                    df.groupby('language', observed=True)['momentum_score'].mean().sort_values(ascending=False).head(10)
+                )
+        
+        if 'repo_type' in df.columns:
+            aggs['type_counts'] = df['repo_type'].value_counts()
+            if 'growth_potential' in df.columns:
+                aggs['growth_by_type'] = (
+                    df.groupby('repo_type', observed=True)['growth_potential'].mean().sort_values(ascending=False)
+                )
+        
+        return aggs
+    
+    def render_language_analytics(self, aggs: dict):
         """Render language-based analytics."""
-        if 'language' not in df.columns:
+        import plotly.graph_objects as go  # Deferred until an analytics tab is rendered
+        
+        if aggs['lang_counts'] is None:
             st.warning("Language data not available.")
             return
         
@@ -371,87 +604,106 @@ class RepoScoutDashboard:
         
         with col1:
             # Language distribution
-            lang_counts = df['language'].value_counts().head(10)
-            fig = px.bar(
-                x=lang_counts.values,
-                y=lang_counts.index,
-                orientation='h',
+            lang_counts = aggs['lang_counts']
+            fig = go.Figure(go.Bar(
+                x=lang_counts.to_numpy(),
+                y=lang_counts.index.to_numpy(),
+                orientation='h'
+            ))
+            fig.update_layout(
                 title="Top Programming Languages",
-                labels={'x': 'Number of Repositories', 'y': 'Language'}
+                xaxis_title='Number of Repositories',
+                yaxis_title='Language',
+                height=400
             )
-            fig.update_layout(height=400)
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             # Average momentum by language
-            if 'momentum_score' in df.columns:
-                lang_momentum = df.groupby('language')['momentum_score'].mean().sort_values(ascending=False).head(10)
-                fig = px.bar(
-                    x=lang_momentum.index,
-                    y=lang_momentum.values,
+            lang_momentum = aggs['lang_momentum']
+            if lang_momentum is not None:
+                fig = go.Figure(go.Bar(x=lang_momentum.index.to_numpy(), y=lang_momentum.to_numpy()))
+                fig.update_layout(
                     title="Average Momentum Score by Language",
-                    labels={'x': 'Language', 'y': 'Momentum Score'}
+                    xaxis_title='Language',
+                    yaxis_title='Momentum Score',
+                    height=400
                 )
-                fig.update_layout(height=400)
                 st.plotly_chart(fig, use_container_width=True)
     
     def render_growth_analytics(self, df: pd.DataFrame):
         """Render growth pattern analytics."""
+        import plotly.graph_objects as go  # Deferred until an analytics tab is rendered
+        
         col1, col2 = st.columns(2)
         
         with col1:
             # Stars vs. Age scatter plot
             if all(col in df.columns for col in ['age_days', 'stars']):
-                fig = px.scatter(
-                    df,
-                    x='age_days',
-                    y='stars',
-                    color='language' if 'language' in df.columns else None,
-                    size='momentum_score' if 'momentum_score' in df.columns else None,
+                plot_df = _scatter_sample(df)
+                
+                # One trace per language (for the legend), markers sized by momentum score
+                groups = plot_df.groupby('language', observed=True, sort=False, dropna=False) if 'language' in plot_df.columns else [(None, plot_df)]
+                max_size = plot_df['momentum_score'].max() if 'momentum_score' in plot_df.columns else 0
+                
+                fig = go.Figure()
+                for language, group in groups:
+                    marker = {}
+                    if max_size > 0:
+                        marker = dict(size=group['momentum_score'].to_numpy(), sizemode='area',
+                                      sizeref=2.0 * max_size / 20 ** 2)
+                    fig.add_trace(go.Scatter(
+                        x=group['age_days'].to_numpy(),
+                        y=group['stars'].to_numpy(),
+                        mode='markers',
+                        name=language,
+                        marker=marker,
+                        customdata=group['name'].to_numpy() if 'name' in group.columns else None,
+                        hovertemplate="%{customdata}<br>Age (Days): %{x}<br>Stars: %{y}<extra></extra>"
+                    ))
+                fig.update_layout(
                     title="Repository Growth Over Time",
-                    labels={'age_days': 'Age (Days)', 'stars': 'Stars'},
-                    hover_data=['name']
+                    xaxis_title='Age (Days)',
+                    yaxis_title='Stars',
+                    height=400
                 )
-                fig.update_layout(height=400)
                 st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             # Momentum score distribution
             if 'momentum_score' in df.columns:
-                fig = px.histogram(
-                    df,
-                    x='momentum_score',
-                    nbins=20,
+                fig = go.Figure(go.Histogram(x=df['momentum_score'].to_numpy(), nbinsx=20))
+                fig.update_layout(
                     title="Momentum Score Distribution",
-                    labels={'momentum_score': 'Momentum Score', 'count': 'Number of Repositories'}
+                    xaxis_title='Momentum Score',
+                    yaxis_title='Number of Repositories',
+                    height=400
                 )
-                fig.update_layout(height=400)
                 st.plotly_chart(fig, use_container_width=True)
     
-    def render_type_analytics(self, df: pd.DataFrame):
+    def render_type_analytics(self, aggs: dict):
         """Render repository type analytics."""
-        if 'repo_type' in df.columns:
+        import plotly.graph_objects as go  # Deferred until an analytics tab is rendered
+        
+        type_counts = aggs['type_counts']
+        if type_counts is not None:
             col1, col2 = st.columns(2)
             
             with col1:
                 # Repository types pie chart
-                type_counts = df['repo_type'].value_counts()
-                fig = px.pie(
-                    values=type_counts.values,
-                    names=type_counts.index,
-                    title="Repository Types Distribution"
-                )
+                fig = go.Figure(go.Pie(values=type_counts.to_numpy(), labels=type_counts.index.to_numpy()))
+                fig.update_layout(title="Repository Types Distribution")
                 st.plotly_chart(fig, use_container_width=True)
             
             with col2:
                 # Growth potential by type
-                if 'growth_potential' in df.columns:
-                    growth_by_type = df.groupby('repo_type')['growth_potential'].mean().sort_values(ascending=False)
-                    fig = px.bar(
-                        x=growth_by_type.index,
-                        y=growth_by_type.values,
+                growth_by_type = aggs['growth_by_type']
+                if growth_by_type is not None:
+                    fig = go.Figure(go.Bar(x=growth_by_type.index.to_numpy(), y=growth_by_type.to_numpy()))
+                    fig.update_layout(
                         title="Average Growth Potential by Type",
-                        labels={'x': 'Repository Type', 'y': 'Growth Potential'}
+                        xaxis_title='Repository Type',
+                        yaxis_title='Growth Potential'
                     )
                     st.plotly_chart(fig, use_container_width=True)
     
@@ -463,7 +715,7 @@ class RepoScoutDashboard:
         
         try:
             with st.spinner("Generating AI insights..."):
-                insights = self.ai_analyzer.generate_insights(df.to_dict('records'))
+                insights = self.ai_analyzer.generate_insights(_repo_records(df))
             
             # Display insights
             st.subheader("🤖 AI-Generated Insights")
@@ -486,10 +738,10 @@ class RepoScoutDashboard:
             # Generate repository summaries for top repos
             if len(df) > 0:
                 st.subheader("🎯 AI Repository Summaries")
-                top_repos = df.head(5)
+                top_repos = _repo_records(df.head(5))
+                summaries = self.ai_analyzer.summarize_repositories(top_repos)
                 
-                for _, repo in top_repos.iterrows():
-                    summary = self.ai_analyzer.summarize_repository(repo.to_dict())
+                for repo, summary in zip(top_repos, summaries):
                     st.write(f"**{repo.get('name', 'Unknown')}**: {summary}")
         
         except Exception as e:
@@ -500,7 +752,7 @@ class RepoScoutDashboard:
         self.render_header()
         
         # Initialize clients
-        self.github_client, self.ai_analyzer, self.data_engine = self.initialize_clients()
+        self.github_client, self.graphql_client, self.ai_analyzer, self.data_engine = self.initialize_clients()
         
         if not self.github_client:
             st.error("Failed to initialize GitHub client. Please check your configuration.")
@@ -515,16 +767,12 @@ class RepoScoutDashboard:
         
         # Fetch data
         with st.spinner("Fetching trending repositories..."):
-            df = self.fetch_trending_data(params['languages'], params['timeframe'])
+            df = self.fetch_trending_data(params['languages'], params['timeframe'], params['min_stars'])
         
         if df.empty:
             st.error("No repositories found. Please try different filters.")
             return
         
-        # Filter by minimum stars
-        if 'stars' in df.columns:
-            df = df[df['stars'] >= params['min_stars']]
-        
         # Render main content
         self.render_metrics_overview(df)
         st.markdown("---")
@@ -7,24 +7,62 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import json
 import os
+import re
 import sys
-import glob
+import hashlib
+import time
+from itertools import compress
+from concurrent.futures import ThreadPoolExecutor
 
 # Add src directory to path for imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
 
+# The clients, analyzers and yaml are imported on first use so that loading
+# recent results does not pay for the network and model stack
 try:
-    from github_client import GitHubAPIClient, filter_quality_repos
-    from simple_ai_analyzer import EnhancedAIAnalyzer
-    from data_analysis import DataAnalysisEngine
-    import yaml
+    from fast_json import jdumps, jloads
 except ImportError as e:
     st.error(f"Import error: {e}")
     st.stop()
 
+# Fallback values for repository card fields, in the order the cards unpack them
+CARD_DEFAULTS = {
+    'name': 'Unknown',
+    'language': 'N/A',
+    'description': 'No description',
+    'stars': 0,
+    'forks': 0,
+    'momentum_score': 0.0
+}
+
+# Columns the dashboard reads and their dtypes (see DataAnalysisEngine.export_analysis);
+# _normalize guarantees all of them exist
+ANALYSIS_DTYPES = {
+    'name': 'string',
+    'description': 'string',
+    'language': 'category',
+    'stars': 'int32',
+    'forks': 'int32',
+    'momentum_score': 'float32',
+    'star_velocity': 'float32'
+}
+
+# Saved AI trend insights, reused for identical repository sets until they expire
+TRENDS_CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'cache')
+TRENDS_CACHE_TTL = 86400  # seconds
+
+# Maximum number of rows shown in the Data Explorer tab
+RAW_DATA_ROW_LIMIT = 200
+
+# Fragments (st.fragment in Streamlit 1.37+, experimental from 1.33) rerun on their own
+# when a widget inside them changes; older versions render the sections normally
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+# Raw HTML without the Markdown parser (st.html, Streamlit 1.33+); older versions use st.markdown
+_html = getattr(st, 'html', None) or (lambda body: st.markdown(body, unsafe_allow_html=True))
+
 # Page configuration
 st.set_page_config(
     page_title="🚀 AI Repo Scout - Free Version",
@@ -33,8 +71,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
+# Custom CSS for better styling; Streamlit clears elements not emitted on a rerun, so it is sent every run
+_CSS_SOURCE = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -64,7 +102,136 @@ st.markdown("""
         margin: 1rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Minified once at import and sent in the same element as the page title
+CUSTOM_CSS = re.sub(r'\s*([{};:,>])\s*', r'\1', ' '.join(_CSS_SOURCE.split()))
+HEADER_HTML = CUSTOM_CSS + '<div class="main-header">🚀 AI Repo Scout Dashboard</div>'
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _load_analysis(data_path: str, data_mtime: float, json_path: str, json_mtime: float,
+                   summary_path: str = None, summary_mtime: float = None):
+    """Read an analysis table (Arrow IPC, Parquet or CSV), its insights JSON and its dashboard summary.
+    
+    The modification times are part of the cache key, so a rewritten file is
+    read again while reruns against unchanged files skip the parse entirely.
+    """
+    if data_path.endswith('.feather'):
+        df = pd.read_feather(data_path)
+    elif data_path.endswith('.parquet'):
+        df = pd.read_parquet(data_path, engine='pyarrow')
+    else:
+        df = pd.read_csv(data_path)
+    with open(json_path, 'rb') as f:
+        insights = jloads(f.read())
+    
+    summary = None
+    if summary_path:
+        with open(summary_path, 'rb') as f:
+            summary = jloads(f.read())
+    
+    return _normalize(df), insights, summary
+
+
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """Add any missing ANALYSIS_DTYPES columns and coerce them to their compact dtypes.
+    
+    Done once per loaded or analyzed DataFrame, so the display methods can use
+    the columns unconditionally. Missing counts become 0; missing scores,
+    languages and text stay NA.
+    """
+    for column, dtype in ANALYSIS_DTYPES.items():
+        values = df[column] if column in df.columns else pd.Series(np.nan, index=df.index)
+        if dtype in ('category', 'string'):
+            df[column] = values.astype(dtype)
+        else:
+            values = pd.to_numeric(values, errors='coerce')
+            df[column] = (values.fillna(0) if dtype.startswith('int') else values).astype(dtype)
+    
+    return df
+
+
+@st.cache_resource
+def _github_client():
+    """GitHub client shared by every session, so its HTTP session and auth are built once."""
+    from github_client import GitHubAPIClient
+    return GitHubAPIClient()
+
+
+@st.cache_resource
+def _ai_analyzer(config: dict):
+    """AI analyzer shared by every session; rebuilt only when the configuration changes."""
+    from simple_ai_analyzer import EnhancedAIAnalyzer
+    return EnhancedAIAnalyzer(config)
+
+
+@st.cache_resource
+def _data_engine():
+    """Analysis engine shared by every session."""
+    from data_analysis import DataAnalysisEngine
+    return DataAnalysisEngine({})
+
+
+@st.cache_data(ttl=900, show_spinner=False)
+def _fetch_trending(languages: tuple, timeframe: str) -> list:
+    """Trending repositories for each language (one list per language), cached for 15 minutes.
+    
+    Languages are independent HTTP round-trips, so they are fetched concurrently.
+    The Streamlit caches are only touched here on the script thread; the worker
+    threads run nothing but the plain client calls.
+    """
+    client = _github_client()
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(languages)))) as executor:
+        return list(executor.map(lambda language: client.get_trending_repos(language=language, since=timeframe),
+                                 languages))
+
+
+@st.cache_data(ttl=900, show_spinner=False)
+def _analyze(repo_key: tuple, _repos: list) -> pd.DataFrame:
+    """Run the data analysis for a set of repositories.
+    
+    Cached on `repo_key` (name, last update and stars of every repository), so
+    the repository list itself is not hashed.
+    """
+    return _normalize(_data_engine().analyze_repositories(_repos))
+
+
+def _trend_insights(repo_key: tuple, repos: list, config: dict, force_refresh: bool = False) -> dict:
+    """AI trend insights for a set of repositories, reused from disk unless a refresh is forced.
+    
+    Results are stored under data/cache, named by a hash of `repo_key`, and
+    kept for TRENDS_CACHE_TTL; expired files are removed whenever a new one is written.
+    """
+    digest = hashlib.blake2b(repr(repo_key).encode(), digest_size=8).hexdigest()
+    path = os.path.join(TRENDS_CACHE_DIR, f"trends_{digest}.json")
+    
+    if not force_refresh and os.path.exists(path) and time.time() - os.path.getmtime(path) < TRENDS_CACHE_TTL:
+        try:
+            with open(path, 'rb') as f:
+                return jloads(f.read())
+        except Exception as e:
+            st.warning(f"Could not read cached insights: {e}")
+    
+    insights = _ai_analyzer(config).analyze_trends(repos)
+    try:
+        os.makedirs(TRENDS_CACHE_DIR, exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(jdumps(insights, default=str))
+        _prune_trend_cache()
+    except Exception as e:
+        st.warning(f"Could not cache insights: {e}")
+    
+    return insights
+
+
+def _prune_trend_cache():
+    """Delete saved trend insights older than TRENDS_CACHE_TTL."""
+    cutoff = time.time() - TRENDS_CACHE_TTL
+    with os.scandir(TRENDS_CACHE_DIR) as entries:
+        for entry in entries:
+            if entry.name.startswith('trends_') and entry.name.endswith('.json') and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
 
 
 class RepoScoutDashboard:
@@ -79,6 +246,7 @@ class RepoScoutDashboard:
     def load_config(self):
         """Load configuration from YAML file."""
         try:
+            import yaml
             config_path = os.path.join(os.path.dirname(__file__), '..', 'config.yaml')
             if os.path.exists(config_path):
                 with open(config_path, 'r') as f:
@@ -93,12 +261,12 @@ class RepoScoutDashboard:
         }
     
     def initialize_clients(self):
-        """Initialize API clients."""
+        """Attach the process-wide API clients to this dashboard."""
         if self.github_client is None:
             try:
-                self.github_client = GitHubAPIClient()
-                self.ai_analyzer = EnhancedAIAnalyzer(self.config)
-                self.data_engine = DataAnalysisEngine({})
+                self.github_client = _github_client()
+                self.ai_analyzer = _ai_analyzer(self.config)
+                self.data_engine = _data_engine()
                 return True
             except Exception as e:
                 st.error(f"Failed to initialize clients: {e}")
@@ -108,47 +276,56 @@ class RepoScoutDashboard:
     def load_recent_data(self):
         """Load the most recent analysis data."""
         try:
-            # Look for recent data files
+            # One directory pass; DirEntry caches its stat result, so one stat per file
             data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
             if os.path.exists(data_dir):
-                csv_files = glob.glob(os.path.join(data_dir, 'analysis_*.csv'))
-                json_files = glob.glob(os.path.join(data_dir, 'insights_*.json'))
+                with os.scandir(data_dir) as entries:
+                    files = {e.name: (e.path, e.stat()) for e in entries if e.is_file()}
+                
+                def latest(prefix, suffix):
+                    candidates = [name for name in files if name.startswith(prefix) and name.endswith(suffix)]
+                    return max(candidates, key=lambda name: files[name][1].st_ctime, default=None)
+                
+                # Prefer the Arrow IPC export; older runs have Parquet or only the CSV
+                latest_data = (latest('analysis_', '.feather') or latest('analysis_', '.parquet') or
+                               latest('analysis_', '.csv'))
+                latest_json = latest('insights_', '.json')
                 
-                if csv_files and json_files:
-                    # Load the most recent files
-                    latest_csv = max(csv_files, key=os.path.getctime)
-                    latest_json = max(json_files, key=os.path.getctime)
+                if latest_data and latest_json:
+                    args = [files[latest_data][0], files[latest_data][1].st_mtime,
+                            files[latest_json][0], files[latest_json][1].st_mtime]
                     
-                    df = pd.read_csv(latest_csv)
-                    with open(latest_json, 'r') as f:
-                        insights = json.load(f)
+                    # Summary written alongside the insights (runs before it was added have none)
+                    summary_name = latest_json.replace('insights_', 'summary_', 1)
+                    if summary_name in files:
+                        args += [files[summary_name][0], files[summary_name][1].st_mtime]
                     
-                    return df, insights
+                    return _load_analysis(*args)
         except Exception as e:
             st.warning(f"Could not load recent data: {e}")
         
-        return None, None
+        return None, None, None
     
-    def run_live_analysis(self, languages, timeframe):
-        """Run live analysis with current settings."""
+    def run_live_analysis(self, languages, timeframe, force_refresh=False):
+        """Run live analysis with current settings.
+        
+        AI insights saved for the same set of repositories are reused unless
+        `force_refresh` is set.
+        """
         if not self.initialize_clients():
             return None, None
         
+        from github_client import filter_quality_repos  # Already imported by initialize_clients
+        
         try:
             with st.spinner(f"Fetching {timeframe} trending repositories for {', '.join(languages)}..."):
-                # Collect data
-                all_repos = []
-                for language in languages:
-                    repos = self.github_client.get_trending_repos(language=language, since=timeframe)
-                    all_repos.extend(repos)
+                # Collect data (languages are fetched concurrently)
+                results = _fetch_trending(tuple(languages), timeframe)
+                all_repos = [repo for repos in results for repo in repos]
                 
-                # Remove duplicates and filter
-                seen = set()
-                unique_repos = []
-                for repo in all_repos:
-                    if repo.get('full_name') not in seen:
-                        seen.add(repo.get('full_name'))
-                        unique_repos.append(repo)
+                # Remove duplicates (keeping the first occurrence) and filter
+                first_seen = ~pd.Series([repo.get('full_name') for repo in all_repos], dtype=object).duplicated()
+                unique_repos = list(compress(all_repos, first_seen.to_numpy()))
                 
                 quality_repos = filter_quality_repos(unique_repos, min_stars=10)[:20]  # Limit for demo
                 
@@ -156,9 +333,11 @@ class RepoScoutDashboard:
                     st.warning("No repositories found matching criteria")
                     return None, None
                 
-                # Analyze data
-                df = self.data_engine.analyze_repositories(quality_repos)
-                insights = self.ai_analyzer.analyze_trends(quality_repos)
+                # Analyze data (cached for an unchanged set of repositories)
+                repo_key = tuple((repo.get('full_name'), repo.get('updated_at'), repo.get('stars'))
+                                 for repo in quality_repos)
+                df = _analyze(repo_key, quality_repos)
+                insights = _trend_insights(repo_key, quality_repos, self.config, force_refresh)
                 
                 return df, insights
                 
@@ -166,28 +345,36 @@ class RepoScoutDashboard:
             st.error(f"Analysis failed: {e}")
             return None, None
     
-    def display_metrics(self, df, insights):
-        """Display key metrics."""
+    def display_metrics(self, df, insights, summary=None):
+        """Display key metrics, taken from the precomputed summary when there is one."""
         if df is None or df.empty:
             return
         
+        if summary and summary.get('metrics'):
+            metrics = summary['metrics']
+        else:
+            metrics = {
+                'total': len(df),
+                'avg_momentum': df['momentum_score'].mean(),
+                'total_stars': df['stars'].sum(),
+                'high_momentum': int((df['momentum_score'] > 70).sum())
+            }
+        
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("Total Repositories", len(df))
+            st.metric("Total Repositories", metrics['total'])
         
         with col2:
-            avg_momentum = df['momentum_score'].mean() if 'momentum_score' in df.columns else 0
-            st.metric("Avg Momentum Score", f"{avg_momentum:.1f}/100")
+            st.metric("Avg Momentum Score", f"{metrics['avg_momentum']:.1f}/100")
         
         with col3:
-            total_stars = df['stars'].sum() if 'stars' in df.columns else 0
-            st.metric("Total Stars", f"{total_stars:,}")
+            st.metric("Total Stars", f"{metrics['total_stars']:,}")
         
         with col4:
-            high_momentum = len(df[df['momentum_score'] > 70]) if 'momentum_score' in df.columns else 0
-            st.metric("High Momentum", high_momentum)
+            st.metric("High Momentum", metrics['high_momentum'])
     
+    @_fragment
     def display_top_repositories(self, df):
         """Display top repositories."""
         if df is None or df.empty:
@@ -196,56 +383,89 @@ class RepoScoutDashboard:
         st.subheader("🔥 Top Trending Repositories")
         
         # Sort by momentum score
-        if 'momentum_score' in df.columns:
-            top_repos = df.nlargest(10, 'momentum_score')
-        else:
-            top_repos = df.head(10)
+        top_repos = df.nlargest(10, 'momentum_score')
+        
+        # Fill defaults column-wise (language leaves the categorical dtype so it can take 'N/A'),
+        # then emit every card in one markdown element
+        cards = top_repos[list(CARD_DEFAULTS)].astype({'language': object}).fillna(CARD_DEFAULTS)
+        cards['description'] = cards['description'].str.slice(0, 200)
         
-        for idx, repo in top_repos.iterrows():
-            with st.container():
-                st.markdown(f"""
-                <div class="repo-card">
-                    <h4>🚀 {repo.get('name', 'Unknown')} ({repo.get('language', 'N/A')})</h4>
-                    <p><strong>Description:</strong> {repo.get('description', 'No description')[:200]}...</p>
-                    <div style="display: flex; gap: 20px; margin-top: 10px;">
-                        <span>⭐ {repo.get('stars', 0):,} stars</span>
-                        <span>🍴 {repo.get('forks', 0)} forks</span>
-                        <span>🏃 Momentum: {repo.get('momentum_score', 0):.1f}/100</span>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+        html_parts = []
+        for name, language, description, stars, forks, momentum in cards.itertuples(index=False, name=None):
+            html_parts.append(
+                f'<div class="repo-card">'
+                f'<h4>🚀 {name} ({language})</h4>'
+                f'<p><strong>Description:</strong> {description}...</p>'
+                f'<div style="display: flex; gap: 20px; margin-top: 10px;">'
+                f'<span>⭐ {stars:,} stars</span>'
+                f'<span>🍴 {forks} forks</span>'
+                f'<span>🏃 Momentum: {momentum:.1f}/100</span>'
+                f'</div></div>'
+            )
+        _html("".join(html_parts))
     
-    def display_insights(self, insights):
-        """Display AI-generated insights."""
-        if not insights:
+    @_fragment
+    def display_insights(self, insights, summary=None):
+        """Display AI-generated insights, taken from the precomputed summary when there is one."""
+        if not insights and not summary:
             return
         
+        if summary:
+            top_languages = summary.get('top_languages', [])
+            top_categories = summary.get('top_categories', [])
+            recommendations = summary.get('recommendations', [])
+        else:
+            top_languages = list(insights.get('language_trends', {}).items())[:5]
+            top_categories = list(insights.get('category_trends', {}).items())[:5]
+            recommendations = insights.get('recommendations', [])[:5]
+        
         st.subheader("🧠 AI Insights")
         
         # Language trends
-        if insights.get('language_trends'):
+        if top_languages:
             st.write("**📊 Top Programming Languages:**")
-            lang_data = insights['language_trends']
-            for lang, count in list(lang_data.items())[:5]:
+            for lang, count in top_languages:
                 st.write(f"- {lang}: {count} repositories")
         
         # Category trends
-        if insights.get('category_trends'):
+        if top_categories:
             st.write("**🏷️ Trending Categories:**")
-            cat_data = insights['category_trends']
-            for cat, count in list(cat_data.items())[:5]:
+            for cat, count in top_categories:
                 st.write(f"- {cat.title()}: {count} projects")
         
         # Recommendations
-        if insights.get('recommendations'):
+        if recommendations:
             st.write("**💡 Key Recommendations:**")
-            for rec in insights['recommendations'][:5]:
+            for rec in recommendations:
                 st.write(f"- {rec}")
     
+    @_fragment
+    def display_data_explorer(self, df):
+        """Display the raw analysis data."""
+        st.subheader("📈 Raw Data")
+        st.write("**Repository Analysis Data:**")
+        # Display selected columns
+        table = df[['name', 'language', 'stars', 'forks', 'momentum_score', 'star_velocity']]
+        
+        # Only the first rows are sent to the browser; numbers are formatted client-side
+        st.dataframe(
+            table.head(RAW_DATA_ROW_LIMIT),
+            use_container_width=True,
+            height=400,
+            column_config={
+                'stars': st.column_config.NumberColumn(format='%d'),
+                'forks': st.column_config.NumberColumn(format='%d'),
+                'momentum_score': st.column_config.ProgressColumn(min_value=0, max_value=100, format='%.1f'),
+                'star_velocity': st.column_config.NumberColumn(format='%.2f')
+            }
+        )
+        if len(table) > RAW_DATA_ROW_LIMIT:
+            st.caption(f"Showing {RAW_DATA_ROW_LIMIT} of {len(table)} rows")
+    
     def run(self):
         """Main dashboard application."""
         # Header
-        st.markdown('<div class="main-header">🚀 AI Repo Scout Dashboard</div>', unsafe_allow_html=True)
+        _html(HEADER_HTML)
         st.markdown("**Discover trending repositories with AI-powered insights**")
         
         # Sidebar controls
@@ -258,10 +478,10 @@ class RepoScoutDashboard:
             help="Load recent data or fetch fresh data from GitHub"
         )
         
-        df, insights = None, None
+        df, insights, summary = None, None, None
         
         if data_source == "Load Recent Analysis":
-            df, insights = self.load_recent_data()
+            df, insights, summary = self.load_recent_data()
             if df is not None:
                 st.sidebar.success(f"✅ Loaded {len(df)} repositories from recent analysis")
             else:
@@ -281,22 +501,26 @@ class RepoScoutDashboard:
                 help="Time period for trending analysis"
             )
             
+            force_refresh = st.sidebar.checkbox(
+                "Force AI refresh",
+                value=False,
+                help="Re-run the AI trend analysis even if insights for these repositories were saved"
+            )
+            
             if st.sidebar.button("🚀 Run Analysis", type="primary"):
-                df, insights = self.run_live_analysis(languages, timeframe)
+                df, insights = self.run_live_analysis(languages, timeframe, force_refresh)
         
         # Main content
         if df is not None and not df.empty:
             # Success message
-            st.markdown(f"""
-            <div class="success-box">
-                <h4>✅ Analysis Complete!</h4>
-                <p>Successfully analyzed <strong>{len(df)}</strong> repositories. 
-                Explore the results below.</p>
-            </div>
-            """, unsafe_allow_html=True)
+            _html(
+                f'<div class="success-box"><h4>✅ Analysis Complete!</h4>'
+                f'<p>Successfully analyzed <strong>{len(df)}</strong> repositories. '
+                f'Explore the results below.</p></div>'
+            )
             
             # Display metrics
-            self.display_metrics(df, insights)
+            self.display_metrics(df, insights, summary)
             
             # Display results in tabs
             tab1, tab2, tab3 = st.tabs(["📊 Top Repositories", "🧠 AI Insights", "📈 Data Explorer"])
@@ -305,18 +529,10 @@ class RepoScoutDashboard:
                 self.display_top_repositories(df)
             
             with tab2:
-                self.display_insights(insights)
+                self.display_insights(insights, summary)
             
             with tab3:
-                st.subheader("📈 Raw Data")
-                st.write("**Repository Analysis Data:**")
-                # Display selected columns
-                display_columns = [col for col in df.columns if col in 
-                                 ['name', 'language', 'stars', 'forks', 'momentum_score', 'star_velocity']]
-                if display_columns:
-                    st.dataframe(df[display_columns], use_container_width=True)
-                else:
-                    st.dataframe(df, use_container_width=True)
+                self.display_data_explorer(df)
         
         else:
             # Welcome message
@@ -8,15 +8,102 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import List, Dict, Tuple, Optional
 import logging
+import hashlib
+import time
 from dataclasses import dataclass
-from sklearn.preprocessing import MinMaxScaler
 from sklearn.cluster import KMeans
-import json
 import os
 
+from fast_json import jdumpb
+from scoring_numba import weighted_sum
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Trend direction labels and the days-since-update upper bounds of the first two
+TREND_DIRECTIONS = ['rising', 'stable', 'declining']
+TREND_DIRECTION_EDGES = [7, 30]
+
+# Derived metric columns, in the order they are added to the analysis DataFrame
+METRIC_COLUMNS = [
+    'star_velocity', 'growth_rate', 'contributor_velocity', 'activity_score', 'freshness_score',
+    'momentum_score', 'star_velocity_norm', 'growth_rate_norm', 'engagement_norm',
+    'contributor_velocity_norm', 'activity_norm', 'freshness_norm', 'quality_norm',
+    'fork_ratio', 'issue_ratio', 'engagement_score'
+]
+
+# Integer count columns, stored as int32
+COUNT_COLUMNS = ['stars', 'forks', 'issues', 'contributors', 'recent_commits', 'age_days', 'days_since_update']
+
+# Scoring weight keys in the order of the momentum factors
+MOMENTUM_FACTORS = ['star_velocity', 'growth_rate', 'engagement', 'contributor_velocity',
+                    'activity', 'freshness', 'quality']
+
+# Growth potential factor columns and their weights
+GROWTH_FACTORS = {
+    'star_velocity_norm': 0.3,
+    'freshness_norm': 0.2,
+    'activity_norm': 0.2,
+    'engagement_norm': 0.15,
+    'quality_norm': 0.15
+}
+
+# Below this many repositories the pandas/Polars conversion costs more than Polars saves
+POLARS_MIN_ROWS = 5000
+
+# Ordered growth potential categories and their bin edges (right-inclusive)
+GROWTH_CATEGORIES = ['low', 'moderate', 'high', 'exceptional']
+GROWTH_CATEGORY_EDGES = [0, 30, 60, 80, 100]
+
+# Growth pattern buckets (right-inclusive edges) for repository age in days and star count
+AGE_BUCKETS = ['new (0-30 days)', 'young (31-90 days)', 'mature (91-365 days)', 'established (>365 days)']
+AGE_BUCKET_EDGES = [-np.inf, 30, 90, 365, np.inf]
+SIZE_BUCKETS = ['small (0-100 stars)', 'medium (101-1000 stars)', 'large (1001-10000 stars)', 'huge (>10000 stars)']
+SIZE_BUCKET_EDGES = [-np.inf, 100, 1000, 10000, np.inf]
+
+# Analysis memoization: smallest batch worth caching, entries kept per engine and their lifetime
+# (ages and freshness depend on the current time, so results go stale)
+ANALYSIS_CACHE_MIN_ROWS = 50
+ANALYSIS_CACHE_SIZE = 8
+ANALYSIS_CACHE_TTL = 3600
+
+# Repository types in classification precedence order; the last one is the fallback
+REPO_TYPES = ['viral', 'established', 'rising', 'community', 'experimental', 'niche']
+
+
+def _capped_ratio(values: np.ndarray, cap: float = 1.0) -> np.ndarray:
+    """Return values / cap clipped to [0, 1], reusing the quotient array for the clip."""
+    ratio = np.divide(values, cap)
+    return np.clip(ratio, 0.0, 1.0, out=ratio)
+
+
+def _top_rows(df: pd.DataFrame, column: str, n: int = 5) -> pd.DataFrame:
+    """Rows with the n largest values of a column, largest first (like DataFrame.nlargest).
+    
+    np.partition finds the n-th largest value in linear time, so only the rows
+    at or above it are sorted. Ties keep their row order; missing values are skipped.
+    """
+    values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+    candidates = np.flatnonzero(~np.isnan(values))
+    if 0 < n < len(candidates):
+        threshold = -np.partition(-values[candidates], n - 1)[n - 1]
+        candidates = candidates[values[candidates] >= threshold]
+    order = candidates[np.lexsort((candidates, -values[candidates]))][:n]
+    return df.iloc[order]
+
 
 @dataclass
 class TrendMetrics:
@@ -51,7 +138,7 @@ class DataAnalysisEngine:
                     else:
                         default_config[key] = config[key]
         self.config = default_config
-        self.scaler = MinMaxScaler()
+        self._cache: Dict[str, Tuple[float, pd.DataFrame]] = {}
         
     def _default_config(self) -> Dict:
         """Default configuration for analysis parameters."""
@@ -78,15 +165,27 @@ class DataAnalysisEngine:
             }
         }
     
-    def analyze_repositories(self, repos: List[Dict]) -> pd.DataFrame:
+    def analyze_repositories(self, repos: List[Dict], use_polars: bool = True) -> pd.DataFrame:
         """Perform comprehensive analysis on repository data.
         
+        Results for batches of ANALYSIS_CACHE_MIN_ROWS or more repositories are
+        memoized on a hash of the repositories and the engine config, so the
+        same batch seen again (re-ranking, re-export) is not re-analyzed.
+        
         Args:
             repos: List of repository dictionaries
+            use_polars: Compute the metrics with Polars for large batches when it is installed
             
         Returns:
             DataFrame with enriched analysis results
         """
+        key = self._cache_key(repos, use_polars) if len(repos) >= ANALYSIS_CACHE_MIN_ROWS else None
+        if key:
+            entry = self._cache.get(key)
+            if entry and time.time() - entry[0] < ANALYSIS_CACHE_TTL:
+                logger.info(f"Using cached analysis of {len(repos)} repositories")
+                return entry[1].copy()
+        
         logger.info(f"Analyzing {len(repos)} repositories...")
         
         # Convert to DataFrame for easier analysis
@@ -97,206 +196,257 @@ class DataAnalysisEngine:
             return df
         
         # Calculate advanced metrics
-        df = self._calculate_trend_metrics(df)
-        df = self._calculate_momentum_scores(df)
-        df = self._calculate_engagement_metrics(df)
+        df = self._compute_all_metrics(df, use_polars)
         df = self._classify_repository_types(df)
         df = self._predict_growth_potential(df)
         
         # Sort by overall score
         df = df.sort_values('momentum_score', ascending=False)
         
+        if key:
+            self._cache.pop(key, None)
+            if len(self._cache) >= ANALYSIS_CACHE_SIZE:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[key] = (time.time(), df.copy())
+        
         logger.info("Repository analysis completed")
         return df
     
-    def _calculate_trend_metrics(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate various trend metrics for repositories."""
+    def _cache_key(self, repos: List[Dict], use_polars: bool) -> str:
+        """Hash a repository batch together with the settings that shape its analysis."""
+        payload = jdumpb([repos, self.config, use_polars], default=str)
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def _compute_all_metrics(self, df: pd.DataFrame, use_polars: bool = True) -> pd.DataFrame:
+        """Calculate trend, momentum and engagement metrics in one pass.
         
+        Dates are parsed with pandas; the numeric metrics come from Polars for
+        large batches (when installed) and from NumPy otherwise. All results are
+        attached with a single assign, metrics as float32 and counts as int32.
+        
+        Args:
+            df: Repositories DataFrame
+            use_polars: Allow the Polars path for batches of POLARS_MIN_ROWS or more
+        """
         # Convert date strings to datetime and make timezone-naive for comparison
-        df['created_at'] = pd.to_datetime(df['created_at']).dt.tz_localize(None)
-        df['updated_at'] = pd.to_datetime(df['updated_at']).dt.tz_localize(None)
+        created_at = pd.to_datetime(df['created_at']).dt.tz_localize(None)
+        updated_at = pd.to_datetime(df['updated_at']).dt.tz_localize(None)
         
         # Calculate age and time-based metrics
         now = datetime.now()
-        df['age_days'] = (now - df['created_at']).dt.days
-        df['days_since_update'] = (now - df['updated_at']).dt.days
-        
-        # Star velocity (stars per day)
-        df['star_velocity'] = df['stars'] / np.maximum(df['age_days'], 1)
-        
-        # Growth rate (relative to repository age)
-        df['growth_rate'] = np.where(
-            df['age_days'] > 30,
-            df['stars'] / (df['age_days'] / 30),  # Stars per month
-            df['stars'] * 30 / np.maximum(df['age_days'], 1)  # Projected monthly growth
+        age_days = (now - created_at).dt.days
+        days_since_update = (now - updated_at).dt.days
+        
+        if use_polars and POLARS_AVAILABLE and len(df) >= POLARS_MIN_ROWS:
+            metrics = self._metrics_polars(df, age_days)
+        else:
+            metrics = self._metrics_numpy(df, age_days)
+        
+        df = df.assign(
+            created_at=created_at,
+            updated_at=updated_at,
+            age_days=age_days,
+            days_since_update=days_since_update,
+            **{column: metrics[column].astype(np.float32, copy=False) for column in METRIC_COLUMNS},
+            trend_direction=self._calculate_trend_direction(days_since_update.to_numpy(dtype=float))
         )
         
-        # Contributor velocity
-        df['contributor_velocity'] = df['contributors'] / np.maximum(df['age_days'], 1) * 30  # Contributors per month
-        
-        # Activity score (based on recent commits)
-        df['activity_score'] = np.minimum(df['recent_commits'] / 10, 1.0)  # Normalized to 0-1
-        
-        # Freshness score (newer is better)
-        max_age = self.config['thresholds']['max_age_days']
-        df['freshness_score'] = np.maximum(1 - (df['age_days'] / max_age), 0)
-        
-        return df
+        # Counts fit in int32; columns holding missing values (float) are left as they are
+        return df.astype({column: np.int32 for column in COUNT_COLUMNS
+                          if column in df and pd.api.types.is_integer_dtype(df[column])})
     
-    def _calculate_momentum_scores(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate comprehensive momentum scores."""
+    def _metrics_numpy(self, df: pd.DataFrame, age_days: pd.Series) -> Dict[str, np.ndarray]:
+        """Compute the METRIC_COLUMNS in float32 from NumPy arrays read once from the DataFrame."""
         weights = self.config['scoring_weights']
         caps = self.config['normalization']
         
-        # Normalize metrics to 0-1 scale
-        metrics = {}
-        
-        # Star velocity (capped and normalized)
-        metrics['star_velocity_norm'] = np.minimum(df['star_velocity'] / caps['star_velocity_cap'], 1.0)
-        
-        # Growth rate (capped and normalized)
-        metrics['growth_rate_norm'] = np.minimum(df['growth_rate'] / caps['growth_rate_cap'], 1.0)
-        
-        # Engagement ratio (issues + forks relative to stars)
-        total_engagement = df['issues'] + df['forks']
-        metrics['engagement_norm'] = np.minimum(total_engagement / np.maximum(df['stars'], 1), 1.0)
-        
-        # Contributor velocity (normalized)
-        metrics['contributor_velocity_norm'] = np.minimum(df['contributor_velocity'] / 5, 1.0)  # Cap at 5 contributors/month
-        
-        # Activity score (already normalized)
-        metrics['activity_norm'] = df['activity_score']
-        
-        # Freshness score (already normalized)
-        metrics['freshness_norm'] = df['freshness_score']
-        
-        # Quality score (based on description, topics, etc.)
-        quality_factors = []
-        quality_factors.append((df['description'].str.len() > 20).astype(float) * 0.3)  # Has good description
-        quality_factors.append((df['topics'].str.len() > 0).astype(float) * 0.3)  # Has topics
-        quality_factors.append((df['license'].notna()).astype(float) * 0.2)  # Has license
-        quality_factors.append(np.minimum(df['contributors'] / 10, 1.0) * 0.2)  # Multiple contributors
-        
-        metrics['quality_norm'] = sum(quality_factors)
-        
-        # Calculate weighted momentum score
-        momentum_components = [
-            weights['star_velocity'] * metrics['star_velocity_norm'],
-            weights['growth_rate'] * metrics['growth_rate_norm'],
-            weights['engagement'] * metrics['engagement_norm'],
-            weights['contributor_velocity'] * metrics['contributor_velocity_norm'],
-            weights['activity'] * metrics['activity_norm'],
-            weights['freshness'] * metrics['freshness_norm'],
-            weights['quality'] * metrics['quality_norm']
-        ]
-        
-        df['momentum_score'] = sum(momentum_components) * 100  # Scale to 0-100
+        age = age_days.to_numpy(dtype=np.float32)
+        stars = df['stars'].to_numpy(dtype=np.float32)
+        forks = df['forks'].to_numpy(dtype=np.float32)
+        issues = df['issues'].to_numpy(dtype=np.float32)
+        contributors = df['contributors'].to_numpy(dtype=np.float32)
+        recent_commits = df['recent_commits'].to_numpy(dtype=np.float32)
+        
+        safe_age = np.maximum(age, 1)
+        safe_stars = np.maximum(stars, 1)
+        
+        # Trend metrics
+        star_velocity = stars / safe_age                     # Stars per day
+        growth_rate = star_velocity * 30                     # Stars per month (projected for repos under a month old)
+        contributor_velocity = contributors / safe_age * 30  # Contributors per month
+        activity_score = _capped_ratio(recent_commits, 10)  # Based on recent commits, normalized to 0-1
+        freshness_score = np.maximum(1 - age / self.config['thresholds']['max_age_days'], 0)  # Newer is better
+        
+        # Normalized momentum inputs (0-1 scale)
+        star_velocity_norm = _capped_ratio(star_velocity, caps['star_velocity_cap'])
+        growth_rate_norm = _capped_ratio(growth_rate, caps['growth_rate_cap'])
+        engagement_norm = _capped_ratio((issues + forks) / safe_stars)  # Issues + forks relative to stars
+        contributor_velocity_norm = _capped_ratio(contributor_velocity, 5)  # Cap at 5 contributors/month
+        
+        # Quality score (based on description, topics, license and contributors)
+        description_len = df['description'].str.len().to_numpy(dtype=np.float32, na_value=0)
+        topics_len = df['topics'].str.len().to_numpy(dtype=np.float32, na_value=0)
+        quality_norm = weighted_sum((
+            description_len > 20,              # Has good description
+            topics_len > 0,                    # Has topics
+            df['license'].notna().to_numpy(),  # Has license
+            _capped_ratio(contributors, 10)    # Multiple contributors
+        ), [0.3, 0.3, 0.2, 0.2])
+        
+        # Weighted momentum score, scaled to 0-100
+        momentum_score = weighted_sum(
+            (star_velocity_norm, growth_rate_norm, engagement_norm, contributor_velocity_norm,
+             activity_score, freshness_score, quality_norm),
+            [weights[key] for key in MOMENTUM_FACTORS],
+            scale=100
+        )
         
-        # Add individual normalized metrics to DataFrame
-        for metric_name, values in metrics.items():
-            df[metric_name] = values
+        # Engagement and community metrics
+        fork_ratio = forks / safe_stars
+        issue_ratio = issues / safe_stars
+        with np.errstate(divide='ignore', invalid='ignore'):
+            contributor_ratio = _capped_ratio(contributors / stars * 100)
+        engagement_score = weighted_sum((
+            _capped_ratio(fork_ratio * 2),     # Normalize fork ratio
+            _capped_ratio(issue_ratio * 5),    # Normalize issue ratio
+            contributor_ratio,                 # Contributor ratio
+            activity_score                     # Recent activity
+        ), [0.25] * 4, scale=100)  # Mean of the four factors
         
-        return df
+        return {
+            'star_velocity': star_velocity,
+            'growth_rate': growth_rate,
+            'contributor_velocity': contributor_velocity,
+            'activity_score': activity_score,
+            'freshness_score': freshness_score,
+            'momentum_score': momentum_score,
+            'star_velocity_norm': star_velocity_norm,
+            'growth_rate_norm': growth_rate_norm,
+            'engagement_norm': engagement_norm,
+            'contributor_velocity_norm': contributor_velocity_norm,
+            'activity_norm': activity_score,
+            'freshness_norm': freshness_score,
+            'quality_norm': quality_norm,
+            'fork_ratio': fork_ratio,
+            'issue_ratio': issue_ratio,
+            'engagement_score': engagement_score
+        }
     
-    def _calculate_engagement_metrics(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate detailed engagement and community metrics."""
-        
-        # Fork ratio (forks relative to stars)
-        df['fork_ratio'] = df['forks'] / np.maximum(df['stars'], 1)
-        
-        # Issue ratio (open issues relative to stars)
-        df['issue_ratio'] = df['issues'] / np.maximum(df['stars'], 1)
-        
-        # Community engagement score
-        engagement_factors = [
-            np.minimum(df['fork_ratio'] * 2, 1.0),  # Normalize fork ratio
-            np.minimum(df['issue_ratio'] * 5, 1.0),  # Normalize issue ratio
-            np.minimum(df['contributors'] / df['stars'] * 100, 1.0),  # Contributor ratio
-            df['activity_score']  # Recent activity
-        ]
+    def _metrics_polars(self, df: pd.DataFrame, age_days: pd.Series) -> Dict[str, np.ndarray]:
+        """Compute the METRIC_COLUMNS with one lazy Polars query (same formulas as _metrics_numpy)."""
+        weights = self.config['scoring_weights']
+        caps = self.config['normalization']
         
-        df['engagement_score'] = np.mean(engagement_factors, axis=0) * 100
+        source = pl.from_pandas(
+            df[['stars', 'forks', 'issues', 'contributors', 'recent_commits', 'description', 'topics', 'license']]
+            .assign(age_days=age_days)
+        )
         
-        # Calculate trend direction
-        df['trend_direction'] = self._calculate_trend_direction(df)
+        def num(name: str) -> pl.Expr:
+            return pl.col(name).cast(pl.Float64)
+        
+        def flag(expr: pl.Expr) -> pl.Expr:
+            return expr.cast(pl.Float64).fill_null(0.0)
+        
+        age, stars, contributors = num('age_days'), num('stars'), num('contributors')
+        safe_age = age.clip(lower_bound=1)
+        safe_stars = stars.clip(lower_bound=1)
+        
+        metrics = (
+            source.lazy()
+            .with_columns(
+                star_velocity=stars / safe_age,
+                contributor_velocity=contributors / safe_age * 30,
+                activity_score=(num('recent_commits') / 10).clip(upper_bound=1.0),
+                freshness_score=(1 - age / self.config['thresholds']['max_age_days']).clip(lower_bound=0),
+                engagement_norm=((num('issues') + num('forks')) / safe_stars).clip(upper_bound=1.0),
+                fork_ratio=num('forks') / safe_stars,
+                issue_ratio=num('issues') / safe_stars,
+                contributor_ratio=(contributors / stars * 100).clip(upper_bound=1.0),
+                quality_norm=(
+                    flag(pl.col('description').str.len_chars() > 20) * 0.3 +
+                    flag(pl.col('topics').list.len() > 0) * 0.3 +
+                    flag(pl.col('license').is_not_null()) * 0.2 +
+                    (contributors / 10).clip(upper_bound=1.0) * 0.2
+                )
+            )
+            .with_columns(
+                growth_rate=pl.col('star_velocity') * 30,
+                star_velocity_norm=(pl.col('star_velocity') / caps['star_velocity_cap']).clip(upper_bound=1.0),
+                contributor_velocity_norm=(pl.col('contributor_velocity') / 5).clip(upper_bound=1.0),
+                activity_norm=pl.col('activity_score'),
+                freshness_norm=pl.col('freshness_score'),
+                engagement_score=(
+                    (pl.col('fork_ratio') * 2).clip(upper_bound=1.0) +
+                    (pl.col('issue_ratio') * 5).clip(upper_bound=1.0) +
+                    pl.col('contributor_ratio') +
+                    pl.col('activity_score')
+                ) / 4 * 100
+            )
+            .with_columns(
+                growth_rate_norm=(pl.col('growth_rate') / caps['growth_rate_cap']).clip(upper_bound=1.0)
+            )
+            .with_columns(
+                momentum_score=(
+                    weights['star_velocity'] * pl.col('star_velocity_norm') +
+                    weights['growth_rate'] * pl.col('growth_rate_norm') +
+                    weights['engagement'] * pl.col('engagement_norm') +
+                    weights['contributor_velocity'] * pl.col('contributor_velocity_norm') +
+                    weights['activity'] * pl.col('activity_score') +
+                    weights['freshness'] * pl.col('freshness_score') +
+                    weights['quality'] * pl.col('quality_norm')
+                ) * 100
+            )
+            .select(METRIC_COLUMNS)
+            .collect()
+        )
         
-        return df
+        return {column: metrics[column].to_numpy() for column in METRIC_COLUMNS}
     
-    def _calculate_trend_direction(self, df: pd.DataFrame) -> np.ndarray:
-        """Calculate trend direction: rising, stable, or declining."""
-        directions = []
+    def _calculate_trend_direction(self, days_inactive: np.ndarray) -> pd.Categorical:
+        """Calculate trend direction: rising, stable, or declining.
         
-        for _, repo in df.iterrows():
-            # Use days since last update as a proxy for activity trend
-            days_inactive = repo['days_since_update']
-            
-            if days_inactive <= 7:
-                direction = "rising"
-            elif days_inactive <= 30:
-                direction = "stable"
-            else:
-                direction = "declining"
-            
-            directions.append(direction)
-        
-        return np.array(directions)
+        Days since the last update serve as a proxy for the activity trend:
+        <= 7 days rising, <= 30 days stable, otherwise (or unknown) declining.
+        """
+        codes = np.searchsorted(TREND_DIRECTION_EDGES, days_inactive, side='left')
+        return pd.Categorical.from_codes(codes, categories=TREND_DIRECTIONS)
     
     def _classify_repository_types(self, df: pd.DataFrame) -> pd.DataFrame:
         """Classify repositories into different types based on characteristics."""
+        stars = df['stars'].to_numpy(dtype=float)
+        age_days = df['age_days'].to_numpy(dtype=float)
+        contributors = df['contributors'].to_numpy(dtype=float)
+        momentum = df['momentum_score'].to_numpy(dtype=float)
+        
+        # Checked in order; the first matching type wins
+        conditions = [
+            (stars > 1000) & (age_days < 90),                          # Viral: High stars, recent creation
+            (stars > 5000) & (age_days > 365),                         # Established: High stars, older
+            (momentum > 70) & (age_days > 30) & (age_days < 365),      # Rising: Good momentum, moderate age
+            contributors / np.maximum(stars, 1) > 0.1,                 # Community: Many contributors relative to stars
+            (stars < 100) & (age_days < 30)                            # Experimental: Low stars, recent
+        ]
         
-        def classify_repo(repo):
-            stars = repo['stars']
-            age_days = repo['age_days']
-            contributors = repo['contributors']
-            
-            # Viral: High stars, recent creation
-            if stars > 1000 and age_days < 90:
-                return "viral"
-            
-            # Established: High stars, older
-            elif stars > 5000 and age_days > 365:
-                return "established"
-            
-            # Rising: Good momentum, moderate age
-            elif repo['momentum_score'] > 70 and 30 < age_days < 365:
-                return "rising"
-            
-            # Community: Many contributors relative to stars
-            elif contributors / max(stars, 1) > 0.1:
-                return "community"
-            
-            # Experimental: Low stars, recent
-            elif stars < 100 and age_days < 30:
-                return "experimental"
-            
-            # Niche: Moderate stats
-            else:
-                return "niche"
-        
-        df['repo_type'] = df.apply(classify_repo, axis=1)
+        # Niche: Moderate stats
+        df['repo_type'] = np.select(conditions, REPO_TYPES[:-1], default=REPO_TYPES[-1])
         return df
     
     def _predict_growth_potential(self, df: pd.DataFrame) -> pd.DataFrame:
         """Predict future growth potential using current metrics."""
         
-        # Growth potential factors
-        growth_factors = [
-            df['star_velocity_norm'] * 0.3,  # Current velocity
-            df['freshness_norm'] * 0.2,     # Age factor
-            df['activity_norm'] * 0.2,      # Recent activity
-            df['engagement_norm'] * 0.15,   # Community engagement
-            df['quality_norm'] * 0.15       # Repository quality
-        ]
-        
-        df['growth_potential'] = sum(growth_factors) * 100
-        
-        # Classify growth potential
-        df['growth_category'] = pd.cut(
-            df['growth_potential'],
-            bins=[0, 30, 60, 80, 100],
-            labels=['low', 'moderate', 'high', 'exceptional']
+        # Growth potential factors: current velocity, age, recent activity, community engagement, quality
+        df['growth_potential'] = weighted_sum(
+            [df[column].to_numpy(dtype=np.float32) for column in GROWTH_FACTORS],
+            list(GROWTH_FACTORS.values()),
+            scale=100
         )
         
+        # Classify growth potential into (0, 30], (30, 60], (60, 80] and (80, 100]; anything else is missing
+        codes = np.searchsorted(GROWTH_CATEGORY_EDGES, df['growth_potential'].to_numpy(), side='left') - 1
+        codes[codes >= len(GROWTH_CATEGORIES)] = -1
+        df['growth_category'] = pd.Categorical.from_codes(codes, categories=GROWTH_CATEGORIES, ordered=True)
+        
         return df
     
     def get_trending_insights(self, df: pd.DataFrame) -> Dict:
@@ -305,70 +455,73 @@ class DataAnalysisEngine:
         if df.empty:
             return {"error": "No data available for analysis"}
         
+        language_trends = self._analyze_language_trends(df)
+        
         insights = {
             'summary': {
                 'total_repos': len(df),
-                'avg_momentum_score': df['momentum_score'].mean(),
-                'top_momentum_score': df['momentum_score'].max(),
+                'avg_momentum_score': float(df['momentum_score'].mean()),
+                'top_momentum_score': float(df['momentum_score'].max()),
                 'analysis_timestamp': datetime.now().isoformat()
             },
             'top_performers': {
-                'highest_momentum': df.nlargest(5, 'momentum_score')[['name', 'full_name', 'momentum_score', 'stars']].to_dict('records'),
-                'fastest_growing': df.nlargest(5, 'star_velocity')[['name', 'full_name', 'star_velocity', 'stars']].to_dict('records'),
-                'most_engaging': df.nlargest(5, 'engagement_score')[['name', 'full_name', 'engagement_score', 'contributors']].to_dict('records')
+                'highest_momentum': _top_rows(df, 'momentum_score')[['name', 'full_name', 'momentum_score', 'stars']].to_dict('records'),
+                'fastest_growing': _top_rows(df, 'star_velocity')[['name', 'full_name', 'star_velocity', 'stars']].to_dict('records'),
+                'most_engaging': _top_rows(df, 'engagement_score')[['name', 'full_name', 'engagement_score', 'contributors']].to_dict('records')
             },
-            'language_trends': self._analyze_language_trends(df),
+            'language_trends': language_trends,
             'growth_patterns': self._analyze_growth_patterns(df),
             'repository_types': df['repo_type'].value_counts().to_dict(),
-            'trend_directions': df['trend_direction'].value_counts().to_dict(),
-            'recommendations': self._generate_recommendations(df)
+            'trend_directions': df['trend_direction'].value_counts()[lambda counts: counts > 0].to_dict(),
+            'recommendations': self._generate_recommendations(df, language_trends)
         }
         
         return insights
     
     def _analyze_language_trends(self, df: pd.DataFrame) -> Dict:
         """Analyze trends by programming language."""
-        language_stats = {}
-        
-        for language in df['language'].dropna().unique():
-            lang_data = df[df['language'] == language]
-            language_stats[language] = {
-                'count': len(lang_data),
-                'avg_momentum': lang_data['momentum_score'].mean(),
-                'avg_stars': lang_data['stars'].mean(),
-                'top_repo': lang_data.loc[lang_data['momentum_score'].idxmax(), 'name'] if len(lang_data) > 0 else None
-            }
+        ranked = df.dropna(subset=['language'])
+        if ranked.empty:
+            return {}
+        
+        # One grouped pass over all languages (in order of first appearance)
+        language_stats = ranked.groupby('language', sort=False, observed=True).agg(
+            count=('momentum_score', 'size'),
+            avg_momentum=('momentum_score', 'mean'),
+            avg_stars=('stars', 'mean'),
+            top_idx=('momentum_score', 'idxmax')
+        )
+        language_stats['top_repo'] = ranked.loc[language_stats.pop('top_idx'), 'name'].to_numpy()
         
         # Sort by average momentum
-        return dict(sorted(language_stats.items(), key=lambda x: x[1]['avg_momentum'], reverse=True))
+        return language_stats.sort_values('avg_momentum', ascending=False, kind='stable').to_dict('index')
     
     def _analyze_growth_patterns(self, df: pd.DataFrame) -> Dict:
         """Analyze different growth patterns in the data."""
+        momentum = df['momentum_score']
+        by_age = pd.cut(df['age_days'], bins=AGE_BUCKET_EDGES, labels=AGE_BUCKETS)
+        by_size = pd.cut(df['stars'], bins=SIZE_BUCKET_EDGES, labels=SIZE_BUCKETS)
         
         patterns = {
-            'by_age': {
-                'new (0-30 days)': df[df['age_days'] <= 30]['momentum_score'].mean(),
-                'young (31-90 days)': df[(df['age_days'] > 30) & (df['age_days'] <= 90)]['momentum_score'].mean(),
-                'mature (91-365 days)': df[(df['age_days'] > 90) & (df['age_days'] <= 365)]['momentum_score'].mean(),
-                'established (>365 days)': df[df['age_days'] > 365]['momentum_score'].mean()
-            },
-            'by_size': {
-                'small (0-100 stars)': df[df['stars'] <= 100]['momentum_score'].mean(),
-                'medium (101-1000 stars)': df[(df['stars'] > 100) & (df['stars'] <= 1000)]['momentum_score'].mean(),
-                'large (1001-10000 stars)': df[(df['stars'] > 1000) & (df['stars'] <= 10000)]['momentum_score'].mean(),
-                'huge (>10000 stars)': df[df['stars'] > 10000]['momentum_score'].mean()
-            },
+            'by_age': momentum.groupby(by_age, observed=False).mean().to_dict(),
+            'by_size': momentum.groupby(by_size, observed=False).mean().to_dict(),
             'growth_potential_distribution': df['growth_category'].value_counts().to_dict()
         }
         
         return patterns
     
-    def _generate_recommendations(self, df: pd.DataFrame) -> List[str]:
-        """Generate actionable recommendations based on analysis."""
+    def _generate_recommendations(self, df: pd.DataFrame, lang_trends: Optional[Dict] = None) -> List[str]:
+        """Generate actionable recommendations based on analysis.
+        
+        Args:
+            df: Analyzed repositories DataFrame
+            lang_trends: Result of _analyze_language_trends, computed here if not given
+        """
         recommendations = []
         
         # Top language recommendation
-        lang_trends = self._analyze_language_trends(df)
+        if lang_trends is None:
+            lang_trends = self._analyze_language_trends(df)
         if lang_trends:
             top_lang = list(lang_trends.keys())[0]
             recommendations.append(f"🔥 {top_lang} repositories are showing the highest momentum right now")
@@ -424,21 +577,107 @@ class DataAnalysisEngine:
         df.attrs['cluster_info'] = cluster_info
         return df
     
-    def export_analysis(self, df: pd.DataFrame, insights: Dict, output_dir: str = "data"):
-        """Export analysis results to various formats."""
+    def build_dashboard_summary(self, df: pd.DataFrame, insights: Dict, top_n: int = 5) -> Dict:
+        """Collect the metrics and top-N rankings shown by the dashboard.
+        
+        Args:
+            df: Analyzed repositories DataFrame
+            insights: Insights dictionary from get_trending_insights
+            top_n: Number of entries kept per ranking
+            
+        Returns:
+            Dictionary with metrics, top_languages, top_categories and recommendations
+        """
+        momentum = df['momentum_score'] if 'momentum_score' in df.columns else pd.Series(dtype=float)
+        metrics = {
+            'total': len(df),
+            'avg_momentum': float(momentum.mean()) if len(momentum) else 0.0,
+            'total_stars': int(df['stars'].sum()) if 'stars' in df.columns else 0,
+            'high_momentum': int((momentum > 70).sum())
+        }
+        
+        top_languages = []
+        if 'language' in df.columns:
+            top_languages = [[lang, int(count)] for lang, count in df['language'].value_counts().head(top_n).items()]
+        
+        # AI categories when available, otherwise the repository types
+        categories = (insights.get('ai_analysis') or {}).get('categories')
+        if categories:
+            counts = sorted(((name, len(repos)) for name, repos in categories.items()), key=lambda x: x[1], reverse=True)
+            top_categories = [[name, count] for name, count in counts[:top_n]]
+        elif 'repo_type' in df.columns:
+            top_categories = [[name, int(count)] for name, count in df['repo_type'].value_counts().head(top_n).items()]
+        else:
+            top_categories = []
+        
+        return {
+            'metrics': metrics,
+            'top_languages': top_languages,
+            'top_categories': top_categories,
+            'recommendations': list(insights.get('recommendations', []))[:top_n]
+        }
+    
+    def export_analysis(self, df: pd.DataFrame, insights: Dict, output_dir: str = "data",
+                        data_format: str = 'csv') -> Tuple[str, str]:
+        """Export analysis results to various formats (CSV or Parquet, Arrow IPC and JSON, plus a dashboard summary).
+        
+        Args:
+            df: Analyzed repositories DataFrame
+            insights: Insights from get_trending_insights
+            output_dir: Directory for the exported files
+            data_format: 'csv' or 'parquet' (zstd-compressed) for the analysis table
+            
+        Returns:
+            Tuple of (analysis table path, insights JSON path)
+        """
+        if data_format not in ('csv', 'parquet'):
+            raise ValueError(f"Unsupported export format: {data_format}")
         
         os.makedirs(output_dir, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Export to CSV
-        csv_path = os.path.join(output_dir, f"analysis_{timestamp}.csv")
-        df.to_csv(csv_path, index=False)
-        logger.info(f"Analysis exported to {csv_path}")
+        frame = df.reset_index(drop=True)  # Feather only stores a default index
+        frame.attrs = {}  # Cluster info is not JSON-serializable Arrow metadata
+        
+        # Export the analysis table. The dashboard loads these files with fixed dtypes (ANALYSIS_DTYPES in
+        # dashboard_simple.py): stars/forks int32, momentum_score/star_velocity float32, language category
+        data_path = os.path.join(output_dir, f"analysis_{timestamp}.{data_format}")
+        if data_format == 'parquet':
+            frame.to_parquet(data_path, compression='zstd', index=False)
+        else:
+            self._write_csv(frame, data_path)
+        logger.info(f"Analysis exported to {data_path}")
+        
+        # Arrow IPC copy for the dashboards: typed columns, read back without parsing
+        feather_path = os.path.join(output_dir, f"analysis_{timestamp}.feather")
+        try:
+            frame.to_feather(feather_path, compression='zstd')
+        except Exception as e:
+            logger.warning(f"Feather export failed: {e}")
         
         # Export insights to JSON
         json_path = os.path.join(output_dir, f"insights_{timestamp}.json")
-        with open(json_path, 'w') as f:
-            json.dump(insights, f, indent=2, default=str)
+        with open(json_path, 'wb') as f:
+            f.write(jdumpb(insights, default=str, indent=True))
         logger.info(f"Insights exported to {json_path}")
         
-        return csv_path, json_path
\ No newline at end of file
+        # Small pre-ranked summary the dashboard renders without re-aggregating
+        summary_path = os.path.join(output_dir, f"summary_{timestamp}.json")
+        with open(summary_path, 'wb') as f:
+            f.write(jdumpb(self.build_dashboard_summary(df, insights), default=str, indent=True))
+        
+        return data_path, json_path
+    
+    def _write_csv(self, frame: pd.DataFrame, path: str):
+        """Write the analysis table as CSV with Arrow's C++ writer, falling back to pandas."""
+        if not PYARROW_AVAILABLE:
+            frame.to_csv(path, index=False)
+            return
+        
+        # Arrow's CSV writer has no list or dictionary types: write topics as their
+        # Python repr (as to_csv does) and categorical columns as plain strings
+        text = {column: frame[column].astype(object) for column in frame.select_dtypes('category')}
+        if 'topics' in frame:
+            text['topics'] = frame['topics'].map(str, na_action='ignore')
+        
+        pacsv.write_csv(pa.Table.from_pandas(frame.assign(**text), preserve_index=False), path)
\ No newline at end of file
@@ -4,13 +4,21 @@ Provides repository summarization, trend analysis, and insights using both DeepS
 """
 
 import logging
+from collections import Counter
+from itertools import chain
 import os
 import json
-from typing import List, Dict, Tuple, Optional, Any
-import torch
+import shelve
+import threading
+import time
+import hashlib
+from functools import wraps
+from importlib.util import find_spec
+from typing import Callable, List, Dict, Tuple, Optional, Any
 from datetime import datetime
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
+
+from fast_json import jdumps, jloads
 
 # DeepSeek API integration
 try:
@@ -20,16 +28,9 @@ except ImportError:
     DEEPSEEK_AVAILABLE = False
     logging.warning("OpenAI package not installed. DeepSeek features will be disabled.")
 
-# Hugging Face models (fallback)
-try:
-    from transformers import (
-        AutoTokenizer, AutoModel, AutoModelForSeq2SeqLM,
-        pipeline, T5Tokenizer, T5ForConditionalGeneration
-    )
-    from sentence_transformers import SentenceTransformer
-    HUGGINGFACE_AVAILABLE = True
-except ImportError:
-    HUGGINGFACE_AVAILABLE = False
+# Hugging Face models (fallback); only checked here, imported when models load
+HUGGINGFACE_AVAILABLE = find_spec('transformers') is not None and find_spec('sentence_transformers') is not None
+if not HUGGINGFACE_AVAILABLE:
     logging.warning("Transformers not installed. Hugging Face features will be disabled.")
 
 import pickle
@@ -37,6 +38,108 @@ import pickle
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Persistent cache for DeepSeek responses; bump PROMPT_VERSION when prompts change
+DEEPSEEK_CACHE_PATH = os.path.expanduser("~/.cache/ai-repo-scout/deepseek")
+PROMPT_VERSION = "1"
+
+# Byte budget for the repository payload of one batched summary request
+SUMMARY_BATCH_BYTES = 60_000
+
+# Structured summary replies. DeepSeek only supports json_object output, so
+# each schema is serialized once into a fixed system prompt that leads every
+# request and stays identical across calls (reusable as a cached prefix).
+_SUMMARY_SCHEMA = {
+    "type": "object",
+    "properties": {"summary": {"type": "string", "maxLength": 280}},
+    "required": ["summary"]
+}
+_BATCH_SUMMARY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "summaries": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "summary": {"type": "string", "maxLength": 280}
+                },
+                "required": ["id", "summary"]
+            }
+        }
+    },
+    "required": ["summaries"]
+}
+
+_SUMMARIZER_ROLE = ("You are an expert software developer and tech analyst who provides concise, "
+                    "insightful summaries of GitHub repositories. Focus on practical value and key differentiators.")
+_SUMMARY_SYSTEM_PROMPT = f"{_SUMMARIZER_ROLE} Reply only with JSON matching this schema: {jdumps(_SUMMARY_SCHEMA)}"
+_BATCH_SUMMARY_SYSTEM_PROMPT = f"{_SUMMARIZER_ROLE} Reply only with JSON matching this schema: {jdumps(_BATCH_SUMMARY_SCHEMA)}"
+
+_cache_lock = threading.Lock()
+
+
+def _is_json(reply: str) -> bool:
+    """Whether a reply parses as JSON."""
+    try:
+        jloads(reply)
+        return True
+    except ValueError:
+        return False
+
+
+def cached_api(ttl: int) -> Callable:
+    """Cache chat completions on disk, keyed by the request contents.
+    
+    Responses requested with a temperature above 0.5 are not cached, since
+    repeated calls are expected to differ. Failed calls raise and are never
+    stored, and neither are json_object replies that don't parse (e.g. cut
+    off at max_tokens); such entries already on disk are requested again.
+    
+    Args:
+        ttl: Time to live for cached entries, in seconds
+        
+    Returns:
+        Decorator for EnhancedAIAnalyzer._chat_completion
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(self, messages: List[Dict], max_tokens: int, temperature: float, **kwargs) -> str:
+            if temperature > 0.5:
+                return func(self, messages, max_tokens, temperature, **kwargs)
+            
+            json_reply = (kwargs.get('response_format') or {}).get('type') == 'json_object'
+            
+            model = self.deepseek_config.get('model', 'deepseek-chat')
+            payload = (json.dumps([messages, kwargs], sort_keys=True, default=str) +
+                       model + str(max_tokens) + str(temperature) + PROMPT_VERSION)
+            key = hashlib.blake2b(payload.encode('utf-8')).hexdigest()
+            
+            try:
+                os.makedirs(os.path.dirname(DEEPSEEK_CACHE_PATH), exist_ok=True)
+                with _cache_lock, shelve.open(DEEPSEEK_CACHE_PATH) as cache:
+                    entry = cache.get(key)
+                if entry and time.time() - entry[0] < ttl and (not json_reply or _is_json(entry[1])):
+                    logger.debug(f"DeepSeek cache hit: {key[:12]}")
+                    return entry[1]
+            except Exception as e:
+                logger.warning(f"Failed to read DeepSeek cache: {e}")
+            
+            result = func(self, messages, max_tokens, temperature, **kwargs)
+            if json_reply and not _is_json(result):
+                logger.warning("DeepSeek returned malformed JSON, not caching the reply")
+                return result
+            
+            try:
+                with _cache_lock, shelve.open(DEEPSEEK_CACHE_PATH) as cache:
+                    cache[key] = (time.time(), result)
+            except Exception as e:
+                logger.warning(f"Failed to write DeepSeek cache: {e}")
+            
+            return result
+        return wrapper
+    return decorator
+
 
 class EnhancedAIAnalyzer:
     """Enhanced AI-powered repository analysis with DeepSeek and Hugging Face support."""
@@ -57,7 +160,8 @@ class EnhancedAIAnalyzer:
         
         # Initialize clients
         self.deepseek_client = None
-        self.huggingface_models = {}
+        self._huggingface_models: Optional[Dict] = None
+        self._huggingface_lock = threading.RLock()
         
         self._initialize_providers()
     
@@ -67,8 +171,24 @@ class EnhancedAIAnalyzer:
         if self.provider == 'deepseek' and DEEPSEEK_AVAILABLE:
             self._init_deepseek()
         
-        if HUGGINGFACE_AVAILABLE:
-            self._init_huggingface()
+        # Hugging Face is the primary provider without DeepSeek; with DeepSeek its
+        # models are only loaded once a fallback actually needs them
+        if not self.deepseek_client:
+            self._load_huggingface()
+    
+    @property
+    def huggingface_models(self) -> Dict:
+        """Hugging Face models, loaded on first access (empty if transformers is missing)."""
+        return self._load_huggingface()
+    
+    def _load_huggingface(self) -> Dict:
+        """Load the Hugging Face models once and return them."""
+        with self._huggingface_lock:
+            if self._huggingface_models is None:
+                self._huggingface_models = {}
+                if HUGGINGFACE_AVAILABLE:
+                    self._init_huggingface()
+        return self._huggingface_models
     
     def _init_deepseek(self):
         """Initialize DeepSeek API client."""
@@ -106,6 +226,8 @@ class EnhancedAIAnalyzer:
         """Initialize Hugging Face models as fallback."""
         try:
             logger.info("Initializing Hugging Face models...")
+            from transformers import AutoTokenizer, AutoModel, pipeline
+            from sentence_transformers import SentenceTransformer
             
             hf_config = self.config.get('models', {}).get('huggingface', {})
             
@@ -152,6 +274,20 @@ class EnhancedAIAnalyzer:
         except Exception as e:
             logger.error(f"Failed to initialize Hugging Face models: {e}")
     
+    @cached_api(ttl=7 * 86400)
+    def _chat_completion(self, messages: List[Dict], max_tokens: int, temperature: float,
+                         response_format: Optional[Dict] = None) -> str:
+        """Send a chat completion request to DeepSeek and return the reply text."""
+        extra = {'response_format': response_format} if response_format else {}
+        response = self.deepseek_client.chat.completions.create(
+            model=self.deepseek_config.get('model', 'deepseek-chat'),
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **extra
+        )
+        return response.choices[0].message.content.strip()
+    
     def summarize_repository(self, repo: Dict) -> str:
         """Generate an AI-powered summary of a repository.
         
@@ -187,17 +323,16 @@ Focus on:
 
 Provide a professional summary that would be useful for developers and tech professionals:"""
 
-            response = self.deepseek_client.chat.completions.create(
-                model=self.deepseek_config.get('model', 'deepseek-chat'),
+            reply = self._chat_completion(
                 messages=[
-                    {"role": "system", "content": "You are an expert software developer and tech analyst who provides concise, insightful summaries of GitHub repositories. Focus on practical value and key differentiators."},
+                    {"role": "system", "content": _SUMMARY_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=self.deepseek_config.get('max_tokens', 150),
-                temperature=self.deepseek_config.get('temperature', 0.3)
+                temperature=self.deepseek_config.get('temperature', 0.3),
+                response_format={"type": "json_object"}
             )
-            
-            summary = response.choices[0].message.content.strip()
+            summary = jloads(reply)['summary'].strip()
             logger.debug(f"DeepSeek summary for {repo.get('name', 'unknown')}: {summary}")
             return summary
             
@@ -208,6 +343,109 @@ Provide a professional summary that would be useful for developers and tech prof
                 return self._summarize_with_huggingface(repo)
             return self._extract_key_info(repo)
     
+    def summarize_repositories(self, repos: List[Dict]) -> List[str]:
+        """Generate summaries for several repositories at once.
+        
+        With DeepSeek, repositories are packed into as few requests as the
+        byte budget allows; the Hugging Face summarizer runs batched pipeline
+        calls.
+        
+        Args:
+            repos: List of repository dictionaries
+            
+        Returns:
+            List of summary strings, in the same order as repos
+        """
+        if not (self.provider == 'deepseek' and self.deepseek_client):
+            if self.huggingface_models.get('summarizer'):
+                return self._summarize_batch_with_huggingface(repos)
+            return [self._extract_key_info(repo) for repo in repos]
+        
+        summaries = []
+        for batch in self._batch_by_bytes(repos, SUMMARY_BATCH_BYTES):
+            summaries.extend(self._summarize_batch_with_deepseek(batch))
+        return summaries
+    
+    def _batch_by_bytes(self, repos: List[Dict], budget: int) -> List[List[Dict]]:
+        """Split repositories into batches whose prompt context fits the byte budget."""
+        batches, batch, size = [], [], 0
+        
+        for repo in repos:
+            repo_size = len(self._prepare_repo_context(repo).encode('utf-8'))
+            if batch and size + repo_size > budget:
+                batches.append(batch)
+                batch, size = [], 0
+            batch.append(repo)
+            size += repo_size
+        
+        if batch:
+            batches.append(batch)
+        return batches
+    
+    def _summarize_batch_with_deepseek(self, repos: List[Dict]) -> List[str]:
+        """Summarize a batch of repositories with a single DeepSeek request."""
+        items = [{'id': i, 'repo': self._prepare_repo_context(repo)} for i, repo in enumerate(repos)]
+        
+        prompt = f"""For each repository below, write one concise, insightful sentence covering what it does, its key technologies and why it is noteworthy for developers.
+
+Repositories:
+{jdumps(items)}"""
+        
+        try:
+            reply = self._chat_completion(
+                messages=[
+                    {"role": "system", "content": _BATCH_SUMMARY_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=min(80 * len(repos) + 50, 8192),
+                temperature=self.deepseek_config.get('temperature', 0.3),
+                response_format={"type": "json_object"}
+            )
+            
+            by_id = {}
+            for item in jloads(reply).get('summaries', []):
+                if isinstance(item, dict) and item.get('summary'):
+                    by_id[item.get('id')] = item['summary'].strip()
+            
+        except Exception as e:
+            logger.error(f"DeepSeek batch summarization failed: {e}")
+            by_id = {}
+        
+        summaries = []
+        for i, repo in enumerate(repos):
+            if i in by_id:
+                summaries.append(by_id[i])
+            elif self.huggingface_models.get('summarizer'):
+                summaries.append(self._summarize_with_huggingface(repo))
+            else:
+                summaries.append(self._extract_key_info(repo))
+        return summaries
+    
+    def _summarize_batch_with_huggingface(self, repos: List[Dict], batch_size: int = 8) -> List[str]:
+        """Summarize several repositories with batched Hugging Face pipeline calls."""
+        inputs = [self._prepare_repo_context(repo, max_length=300) for repo in repos]
+        summaries: List[Optional[str]] = [None] * len(repos)
+        
+        # Short inputs go straight to the fallback, as in _summarize_with_huggingface
+        model_indices = [i for i, text in enumerate(inputs) if len(text) >= 50]
+        
+        if model_indices:
+            try:
+                outputs = self.huggingface_models['summarizer'](
+                    [f"summarize: {inputs[i]}" for i in model_indices],
+                    max_length=100,
+                    min_length=20,
+                    do_sample=False,
+                    truncation=True,
+                    batch_size=batch_size
+                )
+                for i, output in zip(model_indices, outputs):
+                    summaries[i] = output['summary_text']
+            except Exception as e:
+                logger.error(f"Hugging Face batch summarization failed: {e}")
+        
+        return [summary or self._extract_key_info(repo) for summary, repo in zip(summaries, repos)]
+    
     def _summarize_with_huggingface(self, repo: Dict) -> str:
         """Generate summary using Hugging Face models."""
         try:
@@ -329,7 +567,7 @@ Provide a professional summary that would be useful for developers and tech prof
             prompt = f"""Analyze these trending GitHub repositories and provide insights about current development trends:
 
 Repository Data:
-{json.dumps(trend_data, indent=2)}
+{jdumps(trend_data)}
 
 Please provide analysis on:
 1. Emerging technology trends
@@ -340,8 +578,7 @@ Please provide analysis on:
 
 Format your response as structured insights that would be valuable for developers and tech professionals."""
 
-            response = self.deepseek_client.chat.completions.create(
-                model=self.deepseek_config.get('model', 'deepseek-chat'),
+            ai_insights = self._chat_completion(
                 messages=[
                     {"role": "system", "content": "You are a senior tech analyst specializing in software development trends and open-source ecosystem analysis."},
                     {"role": "user", "content": prompt}
@@ -350,8 +587,6 @@ Format your response as structured insights that would be valuable for developer
                 temperature=self.deepseek_config.get('temperature', 0.3)
             )
             
-            ai_insights = response.choices[0].message.content.strip()
-            
             # Combine AI insights with basic analysis
             basic_analysis = self._analyze_trends_basic(repos)
             basic_analysis['ai_insights'] = ai_insights
@@ -396,17 +631,10 @@ Format your response as structured insights that would be valuable for developer
             return insights
         
         # Language analysis
-        languages = [repo.get('language') for repo in repos if repo.get('language')]
-        for lang in languages:
-            insights['top_languages'][lang] = insights['top_languages'].get(lang, 0) + 1
+        insights['top_languages'] = dict(Counter(repo['language'] for repo in repos if repo.get('language')))
         
         # Topic analysis
-        all_topics = []
-        for repo in repos:
-            all_topics.extend(repo.get('topics', []))
-        
-        for topic in all_topics:
-            insights['trending_topics'][topic] = insights['trending_topics'].get(topic, 0) + 1
+        insights['trending_topics'] = dict(Counter(chain.from_iterable(repo.get('topics', []) for repo in repos)))
         
         # Growth patterns
         star_ranges = {'0-100': 0, '100-1000': 0, '1000-10000': 0, '10000+': 0}
@@ -462,7 +690,7 @@ Format your response as structured insights that would be valuable for developer
             prompt = f"""Based on this analysis of trending GitHub repositories, provide 5-7 actionable recommendations for developers and tech professionals:
 
 Analysis Summary:
-{json.dumps(summary_data, indent=2)}
+{jdumps(summary_data)}
 
 Provide specific, actionable recommendations about:
 1. Technologies to learn or explore
@@ -473,8 +701,7 @@ Provide specific, actionable recommendations about:
 
 Format each recommendation as a clear, actionable bullet point starting with an emoji."""
 
-            response = self.deepseek_client.chat.completions.create(
-                model=self.deepseek_config.get('model', 'deepseek-chat'),
+            recommendations_text = self._chat_completion(
                 messages=[
                     {"role": "system", "content": "You are a tech career advisor and open-source expert who provides practical, actionable advice for developers."},
                     {"role": "user", "content": prompt}
@@ -483,8 +710,6 @@ Format each recommendation as a clear, actionable bullet point starting with an
                 temperature=self.deepseek_config.get('temperature', 0.4)
             )
             
-            recommendations_text = response.choices[0].message.content.strip()
-            
             # Parse into list
             recommendations = []
             for line in recommendations_text.split('\n'):
@@ -508,14 +733,10 @@ Format each recommendation as a clear, actionable bullet point starting with an
             return recommendations
         
         # Analyze top languages
-        languages = {}
-        for repo in repos:
-            lang = repo.get('language')
-            if lang:
-                languages[lang] = languages.get(lang, 0) + 1
+        languages = Counter(repo['language'] for repo in repos if repo.get('language'))
         
         if languages:
-            top_lang = max(languages.keys(), key=lambda x: languages[x])
+            top_lang = languages.most_common(1)[0][0]
             recommendations.append(f"🔥 {top_lang} repositories are showing the highest momentum right now")
         
         # Rising stars
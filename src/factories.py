@@ -0,0 +1,92 @@
+"""
+Shared factories for the main AI Repo Scout components.
+Repeated calls with the same configuration return the same warm instance
+instead of reconstructing clients, sessions and models.
+"""
+
+import atexit
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from github_client import GitHubAPIClient
+from simple_ai_analyzer import EnhancedAIAnalyzer
+from data_analysis import DataAnalysisEngine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# GitHub clients handed out so far, closed on interpreter exit
+_github_clients: List[GitHubAPIClient] = []
+
+
+def freeze_config(config: Optional[Dict], prefix: str = "") -> Tuple:
+    """Flatten a nested configuration into a hashable, sorted tuple of items.
+    
+    Args:
+        config: Configuration dictionary (may be nested)
+        prefix: Dotted key prefix used while recursing
+    
+    Returns:
+        Tuple of (dotted_key, value) pairs usable as a cache key
+    """
+    items = []
+    for key, value in (config or {}).items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            items.extend(freeze_config(value, f"{path}."))
+        elif isinstance(value, list):
+            items.append((path, tuple(value)))
+        else:
+            items.append((path, value))
+    return tuple(sorted(items))
+
+
+def thaw_config(config_key: Tuple) -> Dict:
+    """Rebuild the nested configuration dictionary from freeze_config output."""
+    config: Dict[str, Any] = {}
+    for path, value in config_key:
+        *parents, leaf = path.split('.')
+        node = config
+        for part in parents:
+            node = node.setdefault(part, {})
+        node[leaf] = list(value) if isinstance(value, tuple) else value
+    return config
+
+
+@lru_cache(maxsize=4)
+def get_github_client(token: Optional[str] = None) -> GitHubAPIClient:
+    """Return a shared GitHub API client for the given token."""
+    client = GitHubAPIClient(token)
+    _github_clients.append(client)
+    return client
+
+
+@lru_cache(maxsize=4)
+def _get_analyzer(config_key: Tuple) -> EnhancedAIAnalyzer:
+    return EnhancedAIAnalyzer(thaw_config(config_key))
+
+
+def get_analyzer(config: Optional[Dict] = None) -> EnhancedAIAnalyzer:
+    """Return a shared AI analyzer for the given configuration."""
+    return _get_analyzer(freeze_config(config))
+
+
+@lru_cache(maxsize=4)
+def _get_data_engine(config_key: Tuple) -> DataAnalysisEngine:
+    return DataAnalysisEngine(thaw_config(config_key))
+
+
+def get_data_engine(config: Optional[Dict] = None) -> DataAnalysisEngine:
+    """Return a shared data analysis engine for the given configuration."""
+    return _get_data_engine(freeze_config(config))
+
+
+@atexit.register
+def _close_sessions():
+    """Close the HTTP sessions of every client handed out by get_github_client."""
+    for client in _github_clients:
+        try:
+            client.session.close()
+        except Exception as e:
+            logger.debug(f"Failed to close GitHub session: {e}")
@@ -0,0 +1,88 @@
+"""
+Fast JSON helpers for API payloads.
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_default(default: Optional[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    """Wrap a `default` converter so NumPy arrays and scalars become lists and numbers."""
+    def convert(obj: Any) -> Any:
+        if hasattr(obj, 'tolist') and hasattr(obj, 'dtype'):
+            return obj.tolist()
+        if default is not None:
+            return default(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return convert
+
+
+def _plain_keys(obj: Any) -> Any:
+    """Copy of nested dicts and lists with every key a str, int, float, bool or None."""
+    if isinstance(obj, dict):
+        return {
+            (key if isinstance(key, (str, int, float, bool, type(None)))
+             else key.item() if hasattr(key, 'item') and hasattr(key, 'dtype') else str(key)): _plain_keys(value)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_plain_keys(item) for item in obj]
+    return obj
+
+
+def _stdlib_dumps(obj: Any, default: Optional[Callable[[Any], Any]], indent: bool) -> str:
+    """json.dumps with the NumPy conversion and key handling of jdumps."""
+    options = {'indent': 2} if indent else {'separators': (',', ':')}
+    try:
+        return json.dumps(obj, ensure_ascii=False, default=_json_default(default), **options)
+    except TypeError:
+        # Keys json rejects (tuples, NumPy scalars): retry once on a copy with plain keys
+        return json.dumps(_plain_keys(obj), ensure_ascii=False, default=_json_default(default), **options)
+
+
+def jdumps(obj: Any, default: Optional[Callable[[Any], Any]] = None, indent: bool = False) -> str:
+    """Serialize an object to JSON text.
+    
+    Both backends write NumPy arrays and scalars as lists and numbers, and
+    accept non-string dict keys: numbers, booleans and None as JSON does, NumPy
+    scalars by value and anything else (e.g. tuples) as its str().
+    
+    Args:
+        obj: Object to serialize
+        default: Optional converter for objects JSON can't represent natively
+        indent: Pretty-print with two-space indentation instead of compact output
+    """
+    return jdumpb(obj, default, indent).decode('utf-8') if ORJSON_AVAILABLE else _stdlib_dumps(obj, default, indent)
+
+
+def jdumpb(obj: Any, default: Optional[Callable[[Any], Any]] = None, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes, for binary files and hashing.
+    
+    orjson produces bytes natively, so this skips the decode that jdumps does.
+    Arguments are the same as for jdumps.
+    """
+    if not ORJSON_AVAILABLE:
+        return _stdlib_dumps(obj, default, indent).encode('utf-8')
+    
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    try:
+        return orjson.dumps(obj, default=_json_default(default), option=option)
+    except TypeError:
+        # Keys orjson rejects (tuples, NumPy scalars): retry once on a copy with plain keys
+        return orjson.dumps(_plain_keys(obj), default=_json_default(default), option=option)
+
+
+def jloads(data: Union[str, bytes]) -> Any:
+    """Parse JSON from text or raw response bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
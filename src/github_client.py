@@ -4,30 +4,75 @@ Uses only the free GitHub REST API with rate limiting support.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import shelve
+import threading
 import time
 import os
+from concurrent.futures import Future
 import logging
+import numpy as np
+from urllib.parse import urlencode
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 import json
 
+from fast_json import jloads
+from scoring_numba import NUMBA_AVAILABLE, momentum_kernel
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# ETags and response bodies for conditional requests; bump the version to invalidate
+ETAG_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'ai-repo-scout', 'etags')
+ETAG_CACHE_VERSION = 1
+
+# shelve is not safe for concurrent access from several threads
+_etag_lock = threading.Lock()
+
+# Default star floor for trending searches (the original "stars:>10")
+TRENDING_MIN_STARS = 11
+
+# GitHub's default REST page size; contributor and recent-commit counts are taken from one page
+REST_PAGE_SIZE = 30
+
+# Connection pool shared by the per-language requests (enough for the dashboard's fetch threads)
+POOL_SIZE = 16
+RETRY_POLICY = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504],
+                     allowed_methods=['GET', 'POST'])
+
 
 class GitHubAPIClient:
     """Free GitHub API client with rate limiting and trending analysis."""
     
-    def __init__(self, token: Optional[str] = None):
+    def __init__(self, token: Optional[str] = None, etag_cache: Optional[str] = ETAG_CACHE_PATH):
         """Initialize the GitHub API client.
         
         Args:
             token: GitHub personal access token (optional but recommended)
+            etag_cache: Path of the conditional-request cache, or None to disable it
         """
         self.token = token or os.getenv('GITHUB_TOKEN')
         self.base_url = "https://api.github.com"
         self.session = requests.Session()
         
+        # In-flight trending searches, so concurrent identical calls share one fetch
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        self.session.mount('https://', HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE,
+                                                   max_retries=RETRY_POLICY))
+        self.session.headers.update({'Accept-Encoding': 'gzip'})
+        self.etag_cache = etag_cache
+        
+        if self.etag_cache:
+            try:
+                os.makedirs(os.path.dirname(self.etag_cache), exist_ok=True)
+            except OSError as e:
+                logger.warning(f"ETag cache disabled: {e}")
+                self.etag_cache = None
+        
         # Set up authentication headers
         if self.token:
             self.session.headers.update({
@@ -42,12 +87,40 @@ class GitHubAPIClient:
             self.rate_limit = 60  # Without token
             logger.warning("No GitHub token provided. Rate limited to 60 requests/hour.")
     
-    def _make_request(self, endpoint: str, params: Dict = None) -> Dict:
-        """Make a rate-limited request to the GitHub API."""
+    def _etag_lookup(self, key: str) -> Optional[tuple]:
+        """Return the cached (etag, body) pair for a request key, if any."""
+        try:
+            with _etag_lock, shelve.open(self.etag_cache) as store:
+                return store.get(key)
+        except Exception as e:
+            logger.debug(f"ETag cache read failed: {e}")
+            return None
+    
+    def _etag_store(self, key: str, etag: str, body: bytes):
+        """Remember the ETag and raw body of a successful response."""
+        try:
+            with _etag_lock, shelve.open(self.etag_cache) as store:
+                store[key] = (etag, body)
+        except Exception as e:
+            logger.debug(f"ETag cache write failed: {e}")
+    
+    def _make_request(self, endpoint: str, params: Dict = None, conditional: bool = True) -> Dict:
+        """Make a rate-limited request to the GitHub API.
+        
+        When `conditional` is set, the last ETag seen for the same URL and
+        params is sent as If-None-Match; a 304 reply costs no rate-limit
+        budget and the cached body is returned instead.
+        """
         url = f"{self.base_url}{endpoint}"
         
+        cache_key = cached = None
+        if conditional and self.etag_cache:
+            cache_key = f"{ETAG_CACHE_VERSION}|{url}?{urlencode(sorted((params or {}).items()))}"
+            cached = self._etag_lookup(cache_key)
+        
         try:
-            response = self.session.get(url, params=params)
+            headers = {'If-None-Match': cached[0]} if cached else None
+            response = self.session.get(url, params=params, headers=headers)
             
             # Check rate limit
             remaining = int(response.headers.get('X-RateLimit-Remaining', 0))
@@ -57,23 +130,57 @@ class GitHubAPIClient:
                 logger.warning(f"Rate limit approaching. Sleeping for {sleep_time} seconds.")
                 time.sleep(sleep_time)
             
+            if response.status_code == 304 and cached:
+                return jloads(cached[1])
+            
             response.raise_for_status()
+            if cache_key and response.headers.get('ETag'):
+                self._etag_store(cache_key, response.headers['ETag'], response.content)
             return response.json()
             
         except requests.exceptions.RequestException as e:
             logger.error(f"API request failed: {e}")
             return {}
     
-    def get_trending_repos(self, language: str = None, since: str = "daily") -> List[Dict]:
+    def get_trending_repos(self, language: str = None, since: str = "daily",
+                           min_stars: int = TRENDING_MIN_STARS) -> List[Dict]:
         """Get trending repositories from GitHub.
         
+        Concurrent calls with the same arguments (e.g. from several dashboard
+        sessions refreshing at once) wait for the first one instead of
+        repeating its requests.
+        
         Args:
             language: Programming language filter (optional)
             since: Time period ('daily', 'weekly', 'monthly')
+            min_stars: Minimum star count, applied by the search itself
             
         Returns:
             List of repository dictionaries
         """
+        key = (language, since, min_stars)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        
+        if not leader:
+            return list(future.result())
+        
+        try:
+            repos = self._fetch_trending_repos(language, since, min_stars)
+            future.set_result(repos)
+            return repos
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+    
+    def _fetch_trending_repos(self, language: Optional[str], since: str, min_stars: int) -> List[Dict]:
+        """Search and enrich trending repositories (see get_trending_repos)."""
         # Calculate date range for trending
         days_map = {"daily": 1, "weekly": 7, "monthly": 30}
         days = days_map.get(since, 1)
@@ -82,7 +189,7 @@ class GitHubAPIClient:
         # Search for recently created/updated repos with high stars
         query_parts = [
             f"created:>{date_threshold}",
-            "stars:>10"
+            f"stars:>={min_stars}"
         ]
         
         if language:
@@ -120,39 +227,13 @@ class GitHubAPIClient:
             contributor_count = len(contributors) if isinstance(contributors, list) else 0
             
             # Get recent activity (commits, issues, PRs)
+            # The since timestamp changes on every call, so a cached ETag would never match
             commits = self._make_request(f"/repos/{repo['full_name']}/commits", 
-                                       {'since': (datetime.now() - timedelta(days=7)).isoformat()})
+                                       {'since': (datetime.now() - timedelta(days=7)).isoformat()},
+                                       conditional=False)
             recent_commits = len(commits) if isinstance(commits, list) else 0
             
-            # Calculate engagement metrics
-            stars = repo_data.get('stargazers_count', 0)
-            forks = repo_data.get('forks_count', 0)
-            issues = repo_data.get('open_issues_count', 0)
-            
-            # Star velocity (stars per day since creation)
-            created_at = datetime.strptime(repo_data['created_at'], '%Y-%m-%dT%H:%M:%SZ')
-            days_since_creation = (datetime.now() - created_at).days
-            star_velocity = stars / max(days_since_creation, 1)
-            
-            return {
-                'name': repo_data['name'],
-                'full_name': repo_data['full_name'],
-                'description': repo_data.get('description', ''),
-                'html_url': repo_data['html_url'],
-                'language': repo_data.get('language'),
-                'stars': stars,
-                'forks': forks,
-                'issues': issues,
-                'contributors': contributor_count,
-                'recent_commits': recent_commits,
-                'star_velocity': star_velocity,
-                'created_at': repo_data['created_at'],
-                'updated_at': repo_data['updated_at'],
-                'topics': repo_data.get('topics', []),
-                'license': repo_data.get('license', {}).get('name') if repo_data.get('license') else None,
-                'size': repo_data.get('size', 0),
-                'default_branch': repo_data.get('default_branch', 'main')
-            }
+            return build_repo_record(repo_data, contributor_count, recent_commits)
             
         except Exception as e:
             logger.error(f"Failed to enrich repo {repo.get('full_name', 'unknown')}: {e}")
@@ -193,19 +274,64 @@ class GitHubAPIClient:
         return self._make_request('/rate_limit')
 
 
+def build_repo_record(repo_data: Dict, contributor_count: int, recent_commits: int) -> Dict:
+    """Build the enriched repository dictionary from raw GitHub API data.
+    
+    Args:
+        repo_data: Repository payload from the /repos/{full_name} endpoint
+        contributor_count: Number of contributors
+        recent_commits: Number of commits in the last week
+        
+    Returns:
+        Repository dictionary in the shape used throughout AI Repo Scout
+    """
+    # Calculate engagement metrics
+    stars = repo_data.get('stargazers_count', 0)
+    forks = repo_data.get('forks_count', 0)
+    issues = repo_data.get('open_issues_count', 0)
+    
+    # Star velocity (stars per day since creation)
+    created_at = datetime.strptime(repo_data['created_at'], '%Y-%m-%dT%H:%M:%SZ')
+    days_since_creation = (datetime.now() - created_at).days
+    star_velocity = stars / max(days_since_creation, 1)
+    
+    return {
+        'name': repo_data['name'],
+        'full_name': repo_data['full_name'],
+        'description': repo_data.get('description', ''),
+        'html_url': repo_data['html_url'],
+        'language': repo_data.get('language'),
+        'stars': stars,
+        'forks': forks,
+        'issues': issues,
+        'contributors': contributor_count,
+        'recent_commits': recent_commits,
+        'star_velocity': star_velocity,
+        'created_at': repo_data['created_at'],
+        'updated_at': repo_data['updated_at'],
+        'topics': repo_data.get('topics', []),
+        'license': repo_data.get('license', {}).get('name') if repo_data.get('license') else None,
+        'size': repo_data.get('size', 0),
+        'default_branch': repo_data.get('default_branch', 'main')
+    }
+
+
 # Utility functions for data analysis
 
+# Weights for the momentum score factors
+MOMENTUM_WEIGHTS = {
+    'star_velocity': 0.3,
+    'contributor_ratio': 0.2,
+    'activity_ratio': 0.2,
+    'freshness': 0.15,
+    'engagement': 0.15
+}
+
+
 def calculate_momentum_score(repo: Dict) -> float:
     """Calculate a momentum score for a repository based on various metrics."""
     
-    # Weights for different factors
-    weights = {
-        'star_velocity': 0.3,
-        'contributor_ratio': 0.2,
-        'activity_ratio': 0.2,
-        'freshness': 0.15,
-        'engagement': 0.15
-    }
+    weights = MOMENTUM_WEIGHTS
     
     # Normalize metrics (0-1 scale)
     star_velocity = min(repo.get('star_velocity', 0) / 10, 1)  # Cap at 10 stars/day
@@ -232,13 +358,72 @@ def calculate_momentum_score(repo: Dict) -> float:
     return round(score * 100, 2)  # Convert to 0-100 scale
 
 
+def calculate_momentum_scores(repos: List[Dict]) -> np.ndarray:
+    """Calculate momentum scores for a batch of repositories at once.
+    
+    Uses the same formula as calculate_momentum_score, evaluated over NumPy
+    arrays instead of one dict at a time (through the compiled Numba kernel
+    when available). Repository age is computed at day resolution.
+    
+    Args:
+        repos: List of repository dictionaries
+        
+    Returns:
+        Array of momentum scores (0-100), one per repository
+    """
+    count = len(repos)
+    
+    def column(key: str) -> np.ndarray:
+        return np.fromiter((repo.get(key) or 0 for repo in repos), dtype=np.float64, count=count)
+    
+    # Freshness input: repository age in days, parsed from the date part of the timestamps
+    created_at = np.array([repo['created_at'][:10] for repo in repos], dtype='datetime64[D]')
+    days_old = (np.datetime64('today', 'D') - created_at).astype(np.int32)
+    
+    if NUMBA_AVAILABLE:
+        weights = np.array([MOMENTUM_WEIGHTS[key] for key in
+                            ('star_velocity', 'contributor_ratio', 'activity_ratio', 'freshness', 'engagement')])
+        return momentum_kernel(
+            column('star_velocity'), column('stars'), column('forks'), column('issues'),
+            column('contributors'), column('recent_commits'), days_old, weights, np.empty(count)
+        )
+    
+    stars = np.maximum(column('stars'), 1)
+    
+    # Normalize metrics (0-1 scale)
+    star_velocity = np.minimum(column('star_velocity') / 10, 1)
+    contributor_ratio = np.minimum(column('contributors') / stars, 1)
+    activity_ratio = np.minimum(column('recent_commits') / 50, 1)
+    
+    # Freshness (newer repos get higher scores)
+    freshness = np.maximum(1 - days_old / 365, 0)
+    
+    # Engagement (issues + forks relative to stars)
+    engagement = np.minimum((column('issues') + column('forks')) / stars, 1)
+    
+    weights = MOMENTUM_WEIGHTS
+    score = (
+        weights['star_velocity'] * star_velocity +
+        weights['contributor_ratio'] * contributor_ratio +
+        weights['activity_ratio'] * activity_ratio +
+        weights['freshness'] * freshness +
+        weights['engagement'] * engagement
+    )
+    
+    return np.round(score * 100, 2)
+
+
 def filter_quality_repos(repos: List[Dict], min_stars: int = 10, min_score: float = 20) -> List[Dict]:
     """Filter repositories based on quality metrics."""
     quality_repos = []
+    if not repos:
+        return quality_repos
+    
+    # Add momentum scores for the whole batch
+    scores = calculate_momentum_scores(repos)
     
-    for repo in repos:
-        # Add momentum score
-        repo['momentum_score'] = calculate_momentum_score(repo)
+    for repo, score in zip(repos, scores):
+        repo['momentum_score'] = float(score)
         
         # Filter criteria
         if (repo.get('stars', 0) >= min_stars and 
@@ -0,0 +1,197 @@
+"""
+Asynchronous GitHub API client for bulk repository fetches.
+Overlaps network round-trips with aiohttp while keeping the same
+repository dictionaries as the synchronous client.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Any, Coroutine, Dict, List, Optional
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    logging.warning("aiohttp not installed. Async GitHub client will be disabled.")
+
+from fast_json import jloads
+from github_client import TRENDING_MIN_STARS, build_repo_record
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def run_sync(coro: Coroutine) -> Any:
+    """Run a coroutine to completion from synchronous code."""
+    return asyncio.run(coro)
+
+
+class AsyncGitHubAPIClient:
+    """Concurrent GitHub API client with a bounded number of in-flight requests."""
+    
+    def __init__(self, token: Optional[str] = None, max_concurrency: int = 10):
+        """Initialize the async GitHub API client.
+        
+        Args:
+            token: GitHub personal access token (optional but recommended)
+            max_concurrency: Maximum number of simultaneous requests
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp is required for AsyncGitHubAPIClient")
+        
+        self.token = token or os.getenv('GITHUB_TOKEN')
+        self.base_url = "https://api.github.com"
+        self.max_concurrency = max_concurrency
+        
+        self.headers = {'Accept': 'application/vnd.github.v3+json'}
+        if self.token:
+            self.headers['Authorization'] = f'token {self.token}'
+            self.rate_limit = 5000  # With token
+        else:
+            self.rate_limit = 60  # Without token
+            logger.warning("No GitHub token provided. Rate limited to 60 requests/hour.")
+    
+    def _create_session(self) -> "aiohttp.ClientSession":
+        """Create a session whose connection pool matches the concurrency limit."""
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, ttl_dns_cache=300)
+        return aiohttp.ClientSession(headers=self.headers, connector=connector)
+    
+    async def _make_request(self, session: "aiohttp.ClientSession", semaphore: asyncio.Semaphore,
+                            endpoint: str, params: Dict = None) -> Any:
+        """Make a rate-limited request to the GitHub API."""
+        url = f"{self.base_url}{endpoint}"
+        
+        async with semaphore:
+            try:
+                async with session.get(url, params=params) as response:
+                    # Check rate limit
+                    remaining = int(response.headers.get('X-RateLimit-Remaining', 0))
+                    if remaining < 10:
+                        reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
+                        sleep_time = max(reset_time - time.time(), 0) + 1
+                        logger.warning(f"Rate limit approaching. Sleeping for {sleep_time} seconds.")
+                        await asyncio.sleep(sleep_time)
+                    
+                    response.raise_for_status()
+                    return await response.json(loads=jloads)
+            
+            except aiohttp.ClientError as e:
+                logger.error(f"API request failed: {e}")
+                return {}
+    
+    async def _enrich_repo_data(self, session: "aiohttp.ClientSession", semaphore: asyncio.Semaphore,
+                                full_name: str) -> Optional[Dict]:
+        """Fetch details, contributors and recent commits for one repository concurrently."""
+        try:
+            since = (datetime.now() - timedelta(days=7)).isoformat()
+            repo_data, contributors, commits = await asyncio.gather(
+                self._make_request(session, semaphore, f"/repos/{full_name}"),
+                self._make_request(session, semaphore, f"/repos/{full_name}/contributors"),
+                self._make_request(session, semaphore, f"/repos/{full_name}/commits", {'since': since})
+            )
+            
+            contributor_count = len(contributors) if isinstance(contributors, list) else 0
+            recent_commits = len(commits) if isinstance(commits, list) else 0
+            
+            return build_repo_record(repo_data, contributor_count, recent_commits)
+        
+        except Exception as e:
+            logger.error(f"Failed to enrich repo {full_name}: {e}")
+            return None
+    
+    async def fetch_repos_bulk(self, full_names: List[str]) -> List[Dict]:
+        """Fetch enriched data for many repositories at once.
+        
+        Args:
+            full_names: Repository names in "owner/name" form
+        
+        Returns:
+            List of repository dictionaries, in input order, skipping failures
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async with self._create_session() as session:
+            results = await asyncio.gather(
+                *(self._enrich_repo_data(session, semaphore, name) for name in full_names)
+            )
+        
+        return [repo for repo in results if repo]
+    
+    async def _fetch_trending(self, session: "aiohttp.ClientSession", semaphore: asyncio.Semaphore,
+                              language: Optional[str], since: str, min_stars: int) -> List[Dict]:
+        """Search trending repositories and enrich them on an existing session."""
+        # Calculate date range for trending
+        days_map = {"daily": 1, "weekly": 7, "monthly": 30}
+        days = days_map.get(since, 1)
+        date_threshold = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+        
+        query_parts = [
+            f"created:>{date_threshold}",
+            f"stars:>={min_stars}"
+        ]
+        
+        if language:
+            query_parts.append(f"language:{language}")
+        
+        params = {
+            'q': " ".join(query_parts),
+            'sort': 'stars',
+            'order': 'desc',
+            'per_page': 100
+        }
+        
+        data = await self._make_request(session, semaphore, '/search/repositories', params)
+        repos = data.get('items', [])[:50]  # Limit to avoid rate limits
+        
+        results = await asyncio.gather(
+            *(self._enrich_repo_data(session, semaphore, repo['full_name']) for repo in repos)
+        )
+        
+        return [repo for repo in results if repo]
+    
+    async def get_trending_repos(self, language: str = None, since: str = "daily",
+                                 min_stars: int = TRENDING_MIN_STARS) -> List[Dict]:
+        """Get trending repositories from GitHub.
+        
+        Args:
+            language: Programming language filter (optional)
+            since: Time period ('daily', 'weekly', 'monthly')
+            min_stars: Minimum star count, applied by the search itself
+        
+        Returns:
+            List of repository dictionaries
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._create_session() as session:
+            return await self._fetch_trending(session, semaphore, language, since, min_stars)
+    
+    async def get_trending_by_language(self, languages: List[str], since: str = "daily",
+                                       min_stars: int = TRENDING_MIN_STARS) -> Dict[str, List[Dict]]:
+        """Get trending repositories for several languages concurrently.
+        
+        All languages share one session and one concurrency limit, so total
+        latency is close to that of the slowest language rather than the sum.
+        
+        Args:
+            languages: Programming languages to search
+            since: Time period ('daily', 'weekly', 'monthly')
+            min_stars: Minimum star count, applied by the search itself
+        
+        Returns:
+            Dictionary mapping each language to its repository dictionaries
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._create_session() as session:
+            results = await asyncio.gather(
+                *(self._fetch_trending(session, semaphore, language, since, min_stars) for language in languages)
+            )
+        
+        return dict(zip(languages, results))
+    
+    def fetch_repos_bulk_sync(self, full_names: List[str]) -> List[Dict]:
+        """Synchronous wrapper around fetch_repos_bulk."""
+        return run_sync(self.fetch_repos_bulk(full_names))
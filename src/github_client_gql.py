@@ -0,0 +1,240 @@
+"""
+GitHub GraphQL client for fetching repository data in batches.
+Requests every field the scout needs for up to 50 repositories in a
+single query instead of several REST calls per repository.
+"""
+
+import os
+import logging
+import requests
+from requests.adapters import HTTPAdapter
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from fast_json import jdumps, jloads
+from github_client import POOL_SIZE, REST_PAGE_SIZE, RETRY_POLICY, TRENDING_MIN_STARS, build_repo_record
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Maximum number of aliased repositories per GraphQL query
+MAX_BATCH_SIZE = 50
+
+# Maximum number of results of a single GraphQL search
+SEARCH_PAGE_SIZE = 100
+
+# Fields requested for every repository
+REPO_FIELDS = """
+    name
+    nameWithOwner
+    description
+    url
+    primaryLanguage { name }
+    stargazerCount
+    forkCount
+    diskUsage
+    issues(states: OPEN) { totalCount }
+    mentionableUsers { totalCount }
+    defaultBranchRef {
+      name
+      target { ... on Commit { history(since: $since) { totalCount } } }
+    }
+    repositoryTopics(first: 20) { nodes { topic { name } } }
+    licenseInfo { name spdxId }
+    createdAt
+    updatedAt
+"""
+
+
+def _node_to_repo_data(node: Dict) -> Dict:
+    """Convert a GraphQL repository node to the REST payload shape."""
+    branch = node.get('defaultBranchRef') or {}
+    license_info = node.get('licenseInfo')
+    
+    return {
+        'name': node['name'],
+        'full_name': node['nameWithOwner'],
+        'description': node.get('description'),
+        'html_url': node['url'],
+        'language': (node.get('primaryLanguage') or {}).get('name'),
+        'stargazers_count': node.get('stargazerCount', 0),
+        'forks_count': node.get('forkCount', 0),
+        'open_issues_count': node['issues']['totalCount'],
+        'created_at': node['createdAt'],
+        'updated_at': node['updatedAt'],
+        'topics': [item['topic']['name'] for item in node['repositoryTopics']['nodes']],
+        'license': {'name': license_info['name']} if license_info else None,
+        'size': node.get('diskUsage') or 0,
+        'default_branch': branch.get('name', 'main')
+    }
+
+
+def _node_to_repo(node: Dict) -> Dict:
+    """Build the enriched repository dictionary from a GraphQL node."""
+    target = (node.get('defaultBranchRef') or {}).get('target') or {}
+    
+    # The REST client counts the first page of /commits and /contributors, so its counts
+    # stop at REST_PAGE_SIZE; cap the GraphQL totals the same way to keep momentum
+    # scores and the quality filter comparable between the two clients. mentionableUsers
+    # (the closest GraphQL field) also includes collaborators without commits, so below
+    # the cap the contributor count can still read higher than on the REST path.
+    recent_commits = min(target.get('history', {}).get('totalCount', 0), REST_PAGE_SIZE)
+    contributor_count = min(node['mentionableUsers']['totalCount'], REST_PAGE_SIZE)
+    
+    return build_repo_record(_node_to_repo_data(node), contributor_count, recent_commits)
+
+
+class GitHubGraphQLClient:
+    """GitHub GraphQL client that fetches many repositories per round-trip."""
+    
+    def __init__(self, token: Optional[str] = None):
+        """Initialize the GitHub GraphQL client.
+        
+        Args:
+            token: GitHub personal access token (required by the GraphQL API)
+        """
+        self.token = token or os.getenv('GITHUB_TOKEN')
+        self.url = "https://api.github.com/graphql"
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE,
+                                                   max_retries=RETRY_POLICY))
+        
+        self.session.headers.update({'Content-Type': 'application/json', 'Accept-Encoding': 'gzip'})
+        if self.token:
+            self.session.headers.update({'Authorization': f'bearer {self.token}'})
+        else:
+            logger.warning("No GitHub token provided. The GraphQL API requires authentication.")
+    
+    def _execute(self, query: str, variables: Dict) -> Dict:
+        """Post a query to the GraphQL endpoint and return its data."""
+        try:
+            response = self.session.post(self.url, data=jdumps({'query': query, 'variables': variables}))
+            response.raise_for_status()
+            payload = jloads(response.content)
+            
+            for error in payload.get('errors', []):
+                logger.warning(f"GraphQL error: {error.get('message')}")
+            
+            rate_limit = (payload.get('data') or {}).get('rateLimit')
+            if rate_limit and rate_limit['remaining'] < 10:
+                logger.warning(f"GraphQL rate limit nearly exhausted, resets at {rate_limit['resetAt']}")
+            
+            return payload.get('data') or {}
+        
+        except requests.exceptions.RequestException as e:
+            logger.error(f"GraphQL request failed: {e}")
+            return {}
+    
+    @staticmethod
+    def _since() -> str:
+        """Timestamp of the start of the recent-commit window (last 7 days)."""
+        return (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%dT%H:%M:%SZ')
+    
+    def _build_batch_query(self, full_names: List[str]) -> str:
+        """Build one query with an aliased repository lookup per name."""
+        aliases = []
+        for i, full_name in enumerate(full_names):
+            owner, name = full_name.split('/', 1)
+            aliases.append(f'r{i}: repository(owner: {jdumps(owner)}, name: {jdumps(name)}) {{{REPO_FIELDS}}}')
+        
+        return (
+            "query($since: GitTimestamp!) {\n"
+            "  rateLimit { cost remaining resetAt }\n"
+            + "\n".join(aliases) +
+            "\n}"
+        )
+    
+    def fetch_batch(self, full_names: List[str]) -> List[Dict]:
+        """Fetch enriched data for many repositories.
+        
+        Args:
+            full_names: Repository names in "owner/name" form
+        
+        Returns:
+            List of repository dictionaries, in input order, skipping missing repos
+        """
+        repos = []
+        since = self._since()
+        
+        for start in range(0, len(full_names), MAX_BATCH_SIZE):
+            batch = full_names[start:start + MAX_BATCH_SIZE]
+            data = self._execute(self._build_batch_query(batch), {'since': since})
+            
+            for i, full_name in enumerate(batch):
+                node = data.get(f'r{i}')
+                if not node:
+                    logger.warning(f"Repository {full_name} not returned by GraphQL")
+                    continue
+                try:
+                    repos.append(_node_to_repo(node))
+                except Exception as e:
+                    logger.error(f"Failed to parse repo {full_name}: {e}")
+        
+        return repos
+    
+    def get_trending_repos(self, language: str = None, since: str = "daily") -> List[Dict]:
+        """Get trending repositories from GitHub in a single query.
+        
+        Args:
+            language: Programming language filter (optional)
+            since: Time period ('daily', 'weekly', 'monthly')
+        
+        Returns:
+            List of repository dictionaries
+        """
+        return self.search_trending([language] if language else [], since)
+    
+    def search_trending(self, languages: List[str], since: str = "daily", min_stars: int = TRENDING_MIN_STARS,
+                        per_language: int = MAX_BATCH_SIZE) -> List[Dict]:
+        """Get trending repositories for several languages with one query.
+        
+        Each language gets its own aliased search inside the query, so every
+        language contributes its own most-starred repositories (like the REST
+        client's per-language requests) and a heavily starred language can't
+        crowd out the others.
+        
+        Args:
+            languages: Programming language filters (empty for any language)
+            since: Time period ('daily', 'weekly', 'monthly')
+            min_stars: Minimum star count, applied by the search itself
+            per_language: Maximum number of repositories per language (at most SEARCH_PAGE_SIZE)
+        
+        Returns:
+            List of repository dictionaries, grouped by language, most starred first
+        """
+        # Calculate date range for trending
+        days_map = {"daily": 1, "weekly": 7, "monthly": 30}
+        days = days_map.get(since, 1)
+        date_threshold = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+        
+        base_query = f"created:>{date_threshold} stars:>={min_stars} sort:stars-desc"
+        searches = [f"{base_query} language:{language}" for language in languages] or [base_query]
+        
+        query = (
+            "query($since: GitTimestamp!, $first: Int!, "
+            + ", ".join(f"$q{i}: String!" for i in range(len(searches))) + ") {\n"
+            "  rateLimit { cost remaining resetAt }\n"
+            + "\n".join(
+                f"  s{i}: search(query: $q{i}, type: REPOSITORY, first: $first) {{\n"
+                f"    nodes {{ ... on Repository {{{REPO_FIELDS}}} }}\n"
+                "  }"
+                for i in range(len(searches))
+            ) +
+            "\n}"
+        )
+        
+        variables = {'since': self._since(), 'first': min(per_language, SEARCH_PAGE_SIZE)}
+        variables.update({f'q{i}': search for i, search in enumerate(searches)})
+        data = self._execute(query, variables)
+        
+        repos = []
+        for i in range(len(searches)):
+            for node in (data.get(f's{i}') or {}).get('nodes', []):
+                if not node:
+                    continue
+                try:
+                    repos.append(_node_to_repo(node))
+                except Exception as e:
+                    logger.error(f"Failed to parse repo {node.get('nameWithOwner', 'unknown')}: {e}")
+        
+        return repos
@@ -8,11 +8,35 @@ from datetime import datetime
 from typing import Dict, List, Optional
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property
+from textwrap import shorten
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Compact dtypes for repository DataFrames used in post generation
+REPO_FRAME_COLUMNS = ['name', 'language', 'stars', 'forks', 'momentum_score', 'description']
+REPO_FRAME_DTYPES = {
+    'stars': 'int32',
+    'forks': 'int32',
+    'momentum_score': 'float32',
+    'language': 'category'
+}
+
+
+def apply_repo_dtypes(repos_df):
+    """Cast the known repository columns of a DataFrame to REPO_FRAME_DTYPES."""
+    dtypes = {col: dtype for col, dtype in REPO_FRAME_DTYPES.items()
+              if col in repos_df.columns and repos_df[col].dtype != dtype}
+    if not dtypes:
+        return repos_df
+    
+    # Integer columns cannot hold missing values
+    fills = {col: 0 for col, dtype in dtypes.items() if dtype.startswith('int')}
+    return repos_df.fillna(fills).astype(dtypes)
+
 
 @dataclass
 class LinkedInPost:
@@ -23,6 +47,16 @@ class LinkedInPost:
     post_type: str
     engagement_hooks: List[str]
     call_to_action: str
+    
+    @cached_property
+    def preview(self) -> str:
+        """Shortened content for listings."""
+        return shorten(self.content, width=200, placeholder='...')
+    
+    @cached_property
+    def hashtag_line(self) -> str:
+        """First five hashtags joined for display."""
+        return ' '.join(self.hashtags[:5])
 
 
 class LinkedInContentGenerator:
@@ -113,12 +147,13 @@ What technologies are you most excited about? Share your thoughts below! 👇
             top_repos = repos_df.nlargest(3, 'momentum_score') if 'momentum_score' in repos_df.columns else repos_df.head(3)
             
             repo_highlights = []
-            for idx, repo in top_repos.iterrows():
+            for repo in top_repos.to_dict('records'):
                 name = repo.get('name', 'Unknown')
                 language = repo.get('language', 'N/A')
                 stars = repo.get('stars', 0)
                 momentum = repo.get('momentum_score', 0)
-                description = repo.get('description', '')[:80] + "..." if len(repo.get('description', '')) > 80 else repo.get('description', '')
+                description = repo.get('description') or ''
+                description = description[:80] + "..." if len(description) > 80 else description
                 
                 repo_highlights.append(f"🚀 {name} ({language})\n   {description}\n   ⭐ {stars:,} stars | 📈 {momentum:.1f}/100 momentum")
             
@@ -146,10 +181,10 @@ Which repository caught your attention? Are you using any similar tools in your
             hashtags = ["#OpenSource", "#GitHub", "#TechTrends", "#SoftwareDevelopment", "#Innovation"]
             
             # Add language hashtags from top repos
-            languages = [repo.get('language') for _, repo in top_repos.iterrows() if repo.get('language')]
-            for lang in set(languages):
-                if lang:
-                    hashtags.append(f"#{lang}")
+            if 'language' in top_repos.columns:
+                for lang in top_repos['language'].dropna().unique():
+                    if lang:
+                        hashtags.append(f"#{lang}")
             
             return LinkedInPost(
                 title="Hottest GitHub Repositories This Week",
@@ -331,6 +366,9 @@ What tools or projects have caught your attention lately?
         posts = {}
         
         try:
+            if repos_df is not None:
+                repos_df = apply_repo_dtypes(repos_df)
+            
             posts['weekly_trends'] = self.generate_weekly_trends_post(insights, repos_df)
             posts['hot_repositories'] = self.generate_hot_repositories_post(repos_df, insights)
             posts['technology_insights'] = self.generate_technology_insights_post(insights)
@@ -347,26 +385,32 @@ What tools or projects have caught your attention lately?
         """Export posts to individual files for easy copying."""
         os.makedirs(output_dir, exist_ok=True)
         
-        for post_type, post in posts.items():
-            filename = f"{post_type}_{datetime.now().strftime('%Y%m%d')}.md"
-            filepath = os.path.join(output_dir, filename)
-            
-            with open(filepath, 'w') as f:
-                f.write(f"# {post.title}\n\n")
-                f.write(f"**Post Type:** {post.post_type}\n")
-                f.write(f"**Generated:** {datetime.now().isoformat()}\n\n")
-                f.write("## Content\n\n")
-                f.write(post.content)
-                f.write("\n\n## Hashtags\n\n")
-                f.write(" ".join(post.hashtags))
-                f.write("\n\n## Engagement Hooks\n\n")
-                for hook in post.engagement_hooks:
-                    f.write(f"- {hook}\n")
-                f.write(f"\n## Call to Action\n\n{post.call_to_action}\n")
+        if posts:
+            now = datetime.now()
+            with ThreadPoolExecutor(max_workers=min(8, len(posts))) as executor:
+                list(executor.map(lambda item: self._write_post(output_dir, *item, now), posts.items()))
         
         logger.info(f"Exported {len(posts)} posts to {output_dir}/")
         return output_dir
     
+    def _write_post(self, output_dir: str, post_type: str, post: LinkedInPost, generated: datetime):
+        """Write one post as a Markdown file with a single write call."""
+        filepath = os.path.join(output_dir, f"{post_type}_{generated.strftime('%Y%m%d')}.md")
+        hooks = "".join(f"- {hook}\n" for hook in post.engagement_hooks)
+        
+        document = (
+            f"# {post.title}\n\n"
+            f"**Post Type:** {post.post_type}\n"
+            f"**Generated:** {generated.isoformat()}\n\n"
+            f"## Content\n\n{post.content}"
+            f"\n\n## Hashtags\n\n{' '.join(post.hashtags)}"
+            f"\n\n## Engagement Hooks\n\n{hooks}"
+            f"\n## Call to Action\n\n{post.call_to_action}\n"
+        )
+        
+        with open(filepath, 'wb', buffering=0) as f:
+            f.write(document.encode('utf-8'))
+    
     def create_posting_schedule(self, posts: Dict[str, LinkedInPost]) -> Dict:
         """Create a suggested posting schedule."""
         schedule = {
@@ -115,6 +115,19 @@ class LightweightAIAnalyzer:
         
         return ". ".join(summary_parts) + "."
     
+    def summarize_repositories(self, repos: List[Dict]) -> List[str]:
+        """Generate summaries for several repositories in one call.
+        
+        Matches the batch interface of the model-backed analyzers.
+        
+        Args:
+            repos: List of repository dictionaries
+            
+        Returns:
+            List of summary strings, in the same order as repos
+        """
+        return [self.summarize_repository(repo) for repo in repos]
+    
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text."""
         if not text:
@@ -0,0 +1,41 @@
+"""Round-trip tests for the analysis cache."""
+
+import numpy as np
+
+from ai_analyzer import AIAnalyzer
+
+
+def test_analysis_cache_round_trip(tmp_path):
+    analyzer = AIAnalyzer(cache_dir=str(tmp_path))
+    embeddings = np.random.default_rng(0).normal(size=(4, 8)).astype(np.float32)
+    data = {
+        'embeddings': embeddings,
+        'stars': np.array([120000.0, 3.14159]),
+        'large': np.array([1e6, 2.5], dtype=np.float32),
+        'nested': {'v': np.arange(3), 'a/b': [np.array([0.5, 1.5]), {'label': 'x'}]},
+        'count': 5,
+        'name': 'scout'
+    }
+    
+    analyzer.save_analysis_cache(data)
+    loaded = analyzer.load_analysis_cache()
+    
+    # float32 embeddings are quantized to float16 on disk and come back as float32
+    assert loaded['embeddings'].dtype == np.float32
+    np.testing.assert_allclose(loaded['embeddings'], embeddings, rtol=1e-3, atol=1e-3)
+    
+    # Values outside float16 range and float64 arrays are kept exactly
+    assert loaded['stars'].dtype == np.float64
+    np.testing.assert_array_equal(loaded['stars'], data['stars'])
+    np.testing.assert_array_equal(loaded['large'], data['large'])
+    
+    # Nested arrays come back as arrays in place
+    np.testing.assert_array_equal(loaded['nested']['v'], np.arange(3))
+    assert loaded['nested']['a/b'][0].dtype == np.float64
+    np.testing.assert_array_equal(loaded['nested']['a/b'][0], [0.5, 1.5])
+    assert loaded['nested']['a/b'][1] == {'label': 'x'}
+    assert loaded['count'] == 5 and loaded['name'] == 'scout'
+
+
+def test_analysis_cache_missing_returns_none(tmp_path):
+    assert AIAnalyzer(cache_dir=str(tmp_path)).load_analysis_cache("missing") is None
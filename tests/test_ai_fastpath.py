@@ -0,0 +1,61 @@
+"""Parity tests for the cosine similarity top-k helpers."""
+
+import numpy as np
+import pytest
+
+import ai_fastpath
+from ai_fastpath import pairwise_topk_chunked, topk_cosine
+
+
+def _brute_force_topk(target, candidates, k):
+    norms = np.linalg.norm(candidates, axis=1) * np.linalg.norm(target)
+    similarities = candidates @ target / norms
+    indices = np.argsort(-similarities, kind='stable')[:k]
+    return indices, similarities[indices]
+
+
+@pytest.mark.parametrize('use_kernel', [True, False])
+@pytest.mark.parametrize('n', [10, 700, 3000])
+def test_topk_cosine_matches_brute_force(monkeypatch, use_kernel, n):
+    monkeypatch.setattr(ai_fastpath, 'NUMBA_AVAILABLE', use_kernel)
+    rng = np.random.default_rng(n)
+    candidates = rng.normal(size=(n, 32)).astype(np.float32)
+    target = rng.normal(size=32)
+    
+    indices, scores = topk_cosine(target, candidates, 5)
+    expected_indices, expected_scores = _brute_force_topk(target, candidates.astype(np.float64), 5)
+    
+    np.testing.assert_array_equal(indices, expected_indices)
+    np.testing.assert_allclose(scores, expected_scores, rtol=1e-6)
+
+
+def test_topk_cosine_clamps_k():
+    candidates = np.eye(3)
+    
+    indices, scores = topk_cosine(np.array([0.0, 1.0, 0.0]), candidates, 10)
+    
+    assert indices[0] == 1 and len(indices) == 3
+    np.testing.assert_allclose(scores[0], 1.0)
+    assert len(topk_cosine(np.ones(3), candidates, 0)[0]) == 0
+
+
+def test_pairwise_topk_chunked_matches_full_matrix():
+    embeddings = np.random.default_rng(7).normal(size=(50, 16))
+    normalized = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    full = normalized @ normalized.T
+    np.fill_diagonal(full, -np.inf)
+    expected_indices = np.argsort(-full, axis=1)[:, :4]
+    
+    # 50 rows in blocks of 16 covers full blocks and a short last one
+    blocks = list(pairwise_topk_chunked(embeddings, k=4, chunk=16))
+    
+    assert [start for start, _, _ in blocks] == [0, 16, 32, 48]
+    indices = np.concatenate([block for _, block, _ in blocks])
+    scores = np.concatenate([block for _, _, block in blocks])
+    np.testing.assert_array_equal(indices, expected_indices)
+    np.testing.assert_allclose(scores, np.take_along_axis(full, expected_indices, axis=1), rtol=1e-5)
+    assert not np.any(indices == np.arange(50)[:, None])
+
+
+def test_pairwise_topk_chunked_single_row():
+    assert list(pairwise_topk_chunked(np.ones((1, 3)), k=5)) == []
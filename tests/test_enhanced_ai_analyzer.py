@@ -0,0 +1,43 @@
+"""Tests for the on-disk DeepSeek response cache."""
+
+import enhanced_ai_analyzer
+from enhanced_ai_analyzer import cached_api
+
+
+class _FakeClient:
+    """Stands in for EnhancedAIAnalyzer: replays canned replies and counts requests."""
+    
+    deepseek_config = {'model': 'deepseek-chat'}
+    
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.calls = 0
+    
+    @cached_api(ttl=3600)
+    def complete(self, messages, max_tokens, temperature, response_format=None):
+        self.calls += 1
+        return self.replies.pop(0)
+
+
+MESSAGES = [{'role': 'user', 'content': 'Summarize'}]
+JSON_FORMAT = {'type': 'json_object'}
+
+
+def test_malformed_json_reply_is_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(enhanced_ai_analyzer, 'DEEPSEEK_CACHE_PATH', str(tmp_path / 'deepseek'))
+    client = _FakeClient(['{"summary": "cut o', '{"summary": "ok"}'])
+    
+    assert client.complete(MESSAGES, 150, 0.3, response_format=JSON_FORMAT) == '{"summary": "cut o'
+    assert client.complete(MESSAGES, 150, 0.3, response_format=JSON_FORMAT) == '{"summary": "ok"}'
+    assert client.complete(MESSAGES, 150, 0.3, response_format=JSON_FORMAT) == '{"summary": "ok"}'
+    assert client.calls == 2
+
+
+def test_temperature_is_part_of_the_key(tmp_path, monkeypatch):
+    monkeypatch.setattr(enhanced_ai_analyzer, 'DEEPSEEK_CACHE_PATH', str(tmp_path / 'deepseek'))
+    client = _FakeClient(['cold', 'warm'])
+    
+    assert client.complete(MESSAGES, 150, 0.0) == 'cold'
+    assert client.complete(MESSAGES, 150, 0.5) == 'warm'
+    assert client.complete(MESSAGES, 150, 0.0) == 'cold'
+    assert client.calls == 2
@@ -0,0 +1,36 @@
+"""Tests that both JSON backends serialize NumPy values and non-string keys alike."""
+
+import numpy as np
+import pytest
+
+import fast_json
+from fast_json import jdumpb, jdumps, jloads
+
+BACKENDS = [False] + ([True] if fast_json.ORJSON_AVAILABLE else [])
+
+
+@pytest.mark.parametrize('use_orjson', BACKENDS)
+def test_numpy_values_round_trip(monkeypatch, use_orjson):
+    monkeypatch.setattr(fast_json, 'ORJSON_AVAILABLE', use_orjson)
+    data = {'score': np.float32(1.5), 'count': np.int64(3), 'values': np.arange(3), 'half': np.ones(2, np.float16)}
+    
+    expected = {'score': 1.5, 'count': 3, 'values': [0, 1, 2], 'half': [1.0, 1.0]}
+    assert jloads(jdumps(data)) == expected
+    assert jloads(jdumps(data, default=str)) == expected
+    assert jloads(jdumpb(data, indent=True)) == expected
+
+
+@pytest.mark.parametrize('use_orjson', BACKENDS)
+def test_non_string_keys(monkeypatch, use_orjson):
+    monkeypatch.setattr(fast_json, 'ORJSON_AVAILABLE', use_orjson)
+    data = {1: 'int', (2, 3): 'tuple', 'nested': [{np.int64(4): 'numpy'}]}
+    
+    assert jloads(jdumps(data, default=str)) == {'1': 'int', '(2, 3)': 'tuple', 'nested': [{'4': 'numpy'}]}
+
+
+@pytest.mark.parametrize('use_orjson', BACKENDS)
+def test_unserializable_without_default_raises(monkeypatch, use_orjson):
+    monkeypatch.setattr(fast_json, 'ORJSON_AVAILABLE', use_orjson)
+    
+    with pytest.raises(TypeError):
+        jdumps({'value': object()})
@@ -0,0 +1,67 @@
+"""Tests for the GraphQL client's search query and REST-compatible records."""
+
+from github_client import REST_PAGE_SIZE
+from github_client_gql import GitHubGraphQLClient
+
+
+def _node(name: str, language: str, contributors: int = 3, commits: int = 4):
+    return {
+        'name': name,
+        'nameWithOwner': f'owner/{name}',
+        'description': 'A repository',
+        'url': f'https://github.com/owner/{name}',
+        'primaryLanguage': {'name': language},
+        'stargazerCount': 100,
+        'forkCount': 5,
+        'diskUsage': 10,
+        'issues': {'totalCount': 2},
+        'mentionableUsers': {'totalCount': contributors},
+        'defaultBranchRef': {'name': 'main', 'target': {'history': {'totalCount': commits}}},
+        'repositoryTopics': {'nodes': [{'topic': {'name': 'ai'}}]},
+        'licenseInfo': None,
+        'createdAt': '2024-01-01T00:00:00Z',
+        'updatedAt': '2024-01-02T00:00:00Z'
+    }
+
+
+def test_search_trending_runs_one_search_per_language(monkeypatch):
+    client = GitHubGraphQLClient(token='test')
+    calls = []
+    
+    def execute(query, variables):
+        calls.append((query, variables))
+        return {
+            's0': {'nodes': [_node(f'py{i}', 'Python') for i in range(3)]},
+            's1': {'nodes': [_node('go0', 'Go'), None]}
+        }
+    
+    monkeypatch.setattr(client, '_execute', execute)
+    repos = client.search_trending(['python', 'go'], per_language=3)
+    
+    assert len(calls) == 1
+    query, variables = calls[0]
+    assert 's0: search(query: $q0' in query and 's1: search(query: $q1' in query
+    assert variables['q0'].endswith('language:python') and variables['q1'].endswith('language:go')
+    assert variables['first'] == 3
+    assert [repo['name'] for repo in repos] == ['py0', 'py1', 'py2', 'go0']
+
+
+def test_counts_are_capped_like_the_rest_client(monkeypatch):
+    client = GitHubGraphQLClient(token='test')
+    monkeypatch.setattr(client, '_execute', lambda query, variables: {
+        's0': {'nodes': [_node('big', 'Python', contributors=500, commits=900), _node('small', 'Python')]}
+    })
+    
+    big, small = client.search_trending([])
+    
+    assert big['contributors'] == REST_PAGE_SIZE and big['recent_commits'] == REST_PAGE_SIZE
+    assert small['contributors'] == 3 and small['recent_commits'] == 4
+
+
+def test_batch_query_escapes_repository_names():
+    client = GitHubGraphQLClient(token='test')
+    
+    query = client._build_batch_query(['owner/plain', 'own"er/we\\ird"name'])
+    
+    assert 'r0: repository(owner: "owner", name: "plain")' in query
+    assert 'r1: repository(owner: "own\\"er", name: "we\\\\ird\\"name")' in query
@@ -0,0 +1,66 @@
+"""Parity tests for the batch momentum scoring and the fused weighted sum."""
+
+import numpy as np
+import pytest
+
+import github_client
+import scoring_numba
+from github_client import calculate_momentum_score, calculate_momentum_scores
+
+
+def _random_repos(count: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    today = np.datetime64('today', 'D')
+    repos = []
+    for i in range(count):
+        # Midnight timestamps, so the per-dict and batch paths agree on the age in days
+        created = today - np.timedelta64(int(rng.integers(0, 800)), 'D')
+        repos.append({
+            'name': f'repo{i}',
+            'stars': int(rng.integers(0, 50000)),
+            'forks': int(rng.integers(0, 2000)),
+            'issues': int(rng.integers(0, 300)),
+            'contributors': int(rng.integers(0, 100)),
+            'recent_commits': int(rng.integers(0, 120)),
+            'star_velocity': float(rng.uniform(0, 40)),
+            'created_at': f'{created}T00:00:00Z'
+        })
+    return repos
+
+
+@pytest.mark.parametrize('use_kernel', [True, False])
+def test_batch_momentum_matches_single_repo_score(monkeypatch, use_kernel):
+    monkeypatch.setattr(github_client, 'NUMBA_AVAILABLE', use_kernel)
+    repos = _random_repos(500)
+    
+    expected = np.array([calculate_momentum_score(repo) for repo in repos])
+    
+    # fastmath may flip the last rounded digit
+    np.testing.assert_allclose(calculate_momentum_scores(repos), expected, rtol=0, atol=0.01 + 1e-9)
+
+
+def test_batch_momentum_handles_missing_counts():
+    repos = _random_repos(3)
+    repos[0]['stars'] = None
+    del repos[1]['contributors']
+    
+    expected = [calculate_momentum_score({**repo, 'stars': repo['stars'] or 0}) for repo in repos]
+    
+    np.testing.assert_allclose(calculate_momentum_scores(repos), expected, rtol=0, atol=0.01 + 1e-9)
+
+
+@pytest.mark.parametrize('use_kernel', [True, False])
+@pytest.mark.parametrize('dtype', [np.float32, np.float64, bool])
+def test_weighted_sum_matches_numpy(monkeypatch, use_kernel, dtype):
+    monkeypatch.setattr(scoring_numba, 'NUMBA_AVAILABLE', use_kernel)
+    monkeypatch.setattr(scoring_numba, 'WEIGHTED_SUM_MIN_ROWS', 0)
+    rng = np.random.default_rng(1)
+    factors = [rng.random(1000).astype(dtype) if dtype is not bool else rng.random(1000) > 0.5
+               for _ in range(5)]
+    weights = [0.3, 0.2, 0.2, 0.15, 0.15]
+    
+    result = scoring_numba.weighted_sum(factors, weights, scale=100)
+    expected = np.stack([f.astype(np.float64) for f in factors], axis=1) @ weights * 100
+    
+    assert result.dtype == (np.float64 if dtype is np.float64 else np.float32)
+    np.testing.assert_allclose(result, expected, rtol=1e-5 if result.dtype == np.float32 else 1e-12)
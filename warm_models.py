@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Pre-download the Hugging Face models used by AI Repo Scout.
+Run once after installing dependencies so later runs load straight from disk.
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+
+# Use the installed modules (pip install -e .) and fall back to the source tree
+if importlib.util.find_spec('ai_analyzer') is None:
+    sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+# Files the analyzer's loaders read: configs, safetensors weights, tokenizer and
+# vocab files and the sentence-transformers module configs. Other frameworks'
+# weights (TF, Flax, Rust, ONNX variants) in the model repos are skipped.
+ALLOW_PATTERNS = ['*.json', '*.safetensors', '*.txt', '*.model']
+
+# The similarity model is tried with the ONNX backend first when onnxruntime is installed
+ONNX_PATTERNS = ['onnx/model.onnx']
+
+def warm_models(cache_dir: str) -> bool:
+    """Download every configured model into the analyzer's cache directory."""
+    try:
+        from huggingface_hub import snapshot_download
+        from ai_analyzer import AIAnalyzer
+    except ImportError as e:
+        print(f"❌ Import error: {e}")
+        print("💡 Install the AI extras with: pip install -e .[ai]")
+        return False
+    
+    analyzer = AIAnalyzer(cache_dir)
+    success = True
+    
+    onnx = importlib.util.find_spec('onnxruntime') is not None
+    
+    for role, repo_id in analyzer.models_config.items():
+        print(f"📦 Fetching {role} model: {repo_id}", flush=True)
+        patterns = ALLOW_PATTERNS + (ONNX_PATTERNS if role == 'similarity' and onnx else [])
+        try:
+            snapshot_download(repo_id=repo_id, cache_dir=cache_dir, allow_patterns=patterns)
+        except Exception as e:
+            print(f"❌ Failed to download {repo_id}: {e}")
+            success = False
+    
+    return success
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-download AI Repo Scout models")
+    parser.add_argument('--cache-dir', default='./data/models', help='Model cache directory')
+    args = parser.parse_args()
+    
+    success = warm_models(args.cache_dir)
+    print("✅ Models cached" if success else "⚠️  Some models could not be cached")
+    sys.exit(0 if success else 1)